@@ -0,0 +1,163 @@
+import argparse
+import gc
+import io
+import json
+import resource
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List
+
+from stub_server import StubConfig, stub_server
+
+from grist_python_sdk.api.attachment import (
+    download_attachment,
+    download_attachment_contents,
+    list_attachments_metadata,
+    upload_attachments,
+)
+from grist_python_sdk.api.column import list_columns
+from grist_python_sdk.api.record import (
+    add_records,
+    fetch_records,
+    patch_records,
+    put_records,
+)
+from grist_python_sdk.api.table import list_tables_info
+from grist_python_sdk.client import GristAPIClient
+
+DOC = "bench"
+TABLE = "Table1"
+
+
+@dataclass
+class BenchResult:
+    name: str
+    ops: int
+    ops_per_sec: float
+    p50_ms: float
+    p99_ms: float
+    alloc_peak_kb: float
+    rss_peak_mb: float
+
+
+def percentile(latencies: List[float], q: float) -> float:
+    latencies = sorted(latencies)
+    return latencies[min(int(len(latencies) * q), len(latencies) - 1)]
+
+
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1e6 if sys.platform == "darwin" else peak / 1e3
+
+
+def run_benchmark(
+    name: str, operation: Callable[[], object], ops: int, warmup: int
+) -> BenchResult:
+    for _ in range(warmup):
+        operation()
+    gc.collect()
+    latencies = []
+    for _ in range(ops):
+        start = time.perf_counter()
+        operation()
+        latencies.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    operation()
+    _, alloc_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return BenchResult(
+        name=name,
+        ops=ops,
+        ops_per_sec=ops / sum(latencies),
+        p50_ms=statistics.median(latencies) * 1e3,
+        p99_ms=percentile(latencies, 0.99) * 1e3,
+        alloc_peak_kb=alloc_peak / 1024,
+        rss_peak_mb=peak_rss_mb(),
+    )
+
+
+def scenarios(
+    client: GristAPIClient, batch: int, upload: bytes
+) -> Dict[str, Callable[[], object]]:
+    rows = [{"Name": f"New {i}", "Amount": i} for i in range(batch)]
+    updates = {i: {"Amount": i * 2} for i in range(1, batch + 1)}
+    requires = [{"Name": f"Row {i}"} for i in range(1, batch + 1)]
+    fields = [{"Amount": i} for i in range(batch)]
+    return {
+        "fetch_records": lambda: fetch_records(client, DOC, TABLE),
+        "add_records": lambda: add_records(client, DOC, TABLE, rows),
+        "patch_records": lambda: patch_records(client, DOC, TABLE, updates),
+        "put_records": lambda: put_records(client, DOC, TABLE, requires, fields),
+        "upload_attachments": lambda: upload_attachments(
+            client, DOC, [("bench.bin", upload)]
+        ),
+        "download_attachment_contents": lambda: download_attachment_contents(
+            client, DOC, 1
+        ),
+        "download_attachment(stream)": lambda: download_attachment(
+            client, DOC, 1, io.BytesIO()
+        ),
+        "list_attachments_metadata": lambda: list_attachments_metadata(client, DOC),
+        "list_tables_info": lambda: list_tables_info(client, DOC),
+        "list_columns": lambda: list_columns(client, DOC, TABLE),
+    }
+
+
+def report(results: List[BenchResult]) -> None:
+    print(
+        f"{'benchmark':<30} {'ops/s':>9} {'p50 ms':>9} {'p99 ms':>9} "
+        f"{'alloc KB':>10} {'RSS MB':>8}"
+    )
+    for r in results:
+        print(
+            f"{r.name:<30} {r.ops_per_sec:9.1f} {r.p50_ms:9.2f} {r.p99_ms:9.2f} "
+            f"{r.alloc_peak_kb:10.1f} {r.rss_peak_mb:8.1f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", type=int, default=200, help="operations per benchmark")
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds")
+    parser.add_argument("--records", type=int, default=1000)
+    parser.add_argument("--fields", type=int, default=8)
+    parser.add_argument("--batch", type=int, default=100)
+    parser.add_argument("--attachment-size", type=int, default=256 * 1024)
+    parser.add_argument("-k", dest="only", help="run benchmarks containing this text")
+    parser.add_argument("--json", dest="json_path", help="write results as JSON")
+    args = parser.parse_args()
+
+    config = StubConfig(
+        latency=args.latency,
+        records=args.records,
+        fields=args.fields,
+        attachment_size=args.attachment_size,
+    )
+    results: List[BenchResult] = []
+    with stub_server(config) as (root_url, _):
+        with GristAPIClient(root_url, "api_key") as client:
+            upload = b"x" * args.attachment_size
+            for name, operation in scenarios(client, args.batch, upload).items():
+                if args.only and args.only not in name:
+                    continue
+                results.append(run_benchmark(name, operation, args.n, args.warmup))
+
+    report(results)
+    if args.json_path:
+        output: Dict[str, object] = {
+            "config": asdict(config),
+            "batch": args.batch,
+            "results": [asdict(r) for r in results],
+        }
+        with open(args.json_path, "w") as f:
+            json.dump(output, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
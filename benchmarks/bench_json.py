@@ -0,0 +1,71 @@
+import argparse
+import random
+import time
+from typing import Any, Callable, Dict, List
+
+from grist_python_sdk.json_codec import (
+    JSONCodec,
+    OrjsonCodec,
+    StdlibJSONCodec,
+    UjsonCodec,
+)
+
+
+def make_payload(n: int) -> Dict[str, Any]:
+    rng = random.Random(0)
+    return {
+        "records": [
+            {
+                "id": i,
+                "fields": {
+                    "Name": f"Customer {i}",
+                    "Email": f"customer{i}@example.com",
+                    "Amount": round(rng.uniform(0, 10000), 2),
+                    "Count": rng.randint(0, 1000),
+                    "Active": rng.random() > 0.5,
+                    "Created": 1700000000 + i * 60,
+                    "Tags": ["L", "vip", "eu"] if i % 3 else ["L"],
+                    "Owner": rng.randint(1, 50),
+                    "Notes": None if i % 5 else "Follow up next week — ✓",
+                },
+            }
+            for i in range(1, n + 1)
+        ]
+    }
+
+
+def best_of(fn: Callable[[], object], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", type=int, default=50000, help="records per payload")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    payload = make_payload(args.n)
+    codecs: List[JSONCodec] = [StdlibJSONCodec()]
+    for codec_class in (UjsonCodec, OrjsonCodec):
+        try:
+            codecs.append(codec_class())
+        except ImportError:
+            print(f"{codec_class.__name__}: not installed, skipped")
+
+    body = StdlibJSONCodec().dumps(payload)
+    print(f"{args.n} records, {len(body) / 1e6:.1f} MB serialized")
+    for codec in codecs:
+        encode = best_of(lambda: codec.dumps(payload), args.repeat)
+        decode = best_of(lambda: codec.loads(body), args.repeat)
+        print(
+            f"{codec.name:<8} encode={encode * 1e3:8.1f}ms decode={decode * 1e3:8.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
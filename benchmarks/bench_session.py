@@ -0,0 +1,52 @@
+import argparse
+import statistics
+import time
+from typing import Callable, List
+
+import requests
+from stub_server import StubConfig, stub_server
+
+from grist_python_sdk.client import GristAPIClient
+
+
+def measure(call: Callable[[], object], n: int) -> List[float]:
+    latencies = []
+    for _ in range(n):
+        start = time.perf_counter()
+        call()
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def report(name: str, latencies: List[float]) -> None:
+    latencies = sorted(latencies)
+    p50 = statistics.median(latencies) * 1e6
+    p99 = latencies[int(len(latencies) * 0.99) - 1] * 1e6
+    ops = len(latencies) / sum(latencies)
+    print(f"{name:<24} p50={p50:8.1f}us p99={p99:8.1f}us ops/s={ops:8.0f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", type=int, default=2000)
+    args = parser.parse_args()
+
+    with stub_server(StubConfig(records=0)) as (root_url, _):
+        client = GristAPIClient(root_url, "api_key")
+        url = client.get_url("docs/doc/tables/Table1/records")
+
+        def unpooled() -> object:
+            response = requests.request("get", url, headers=client.headers_with_auth)
+            response.raise_for_status()
+            return response.json()
+
+        def pooled() -> object:
+            return client.request("get", "docs/doc/tables/Table1/records")
+
+        report("requests.request", measure(unpooled, args.n))
+        with client:
+            report("GristAPIClient(session)", measure(pooled, args.n))
+
+
+if __name__ == "__main__":
+    main()
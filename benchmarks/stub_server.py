@@ -0,0 +1,238 @@
+import json
+import re
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+
+@dataclass
+class StubConfig:
+    latency: float = 0.0
+    records: int = 1000
+    fields: int = 8
+    attachments: int = 20
+    attachment_size: int = 256 * 1024
+
+
+def make_fields(i: int, width: int) -> Dict[str, Any]:
+    fields: Dict[str, Any] = {
+        "Name": f"Row {i}",
+        "Amount": i * 1.5,
+        "Active": i % 2 == 0,
+    }
+    for j in range(max(width - len(fields), 0)):
+        fields[f"Col{j}"] = f"value {i}-{j}"
+    return fields
+
+
+class StubGrist:
+    def __init__(self, config: StubConfig) -> None:
+        self.config = config
+        self.lock = threading.Lock()
+        self.tables: Dict[Tuple[str, str], Dict[int, Dict[str, Any]]] = {}
+        self.attachments: Dict[str, List[Dict[str, Any]]] = {}
+        self.blob = bytes(range(256)) * (config.attachment_size // 256 + 1)
+        self.blob = self.blob[: config.attachment_size]
+
+    def table(self, doc_id: str, table_id: str) -> Dict[int, Dict[str, Any]]:
+        key = (doc_id, table_id)
+        if key not in self.tables:
+            self.tables[key] = {
+                i: make_fields(i, self.config.fields)
+                for i in range(1, self.config.records + 1)
+            }
+        return self.tables[key]
+
+    def attachment_list(self, doc_id: str) -> List[Dict[str, Any]]:
+        if doc_id not in self.attachments:
+            self.attachments[doc_id] = [
+                {
+                    "id": i,
+                    "fields": {
+                        "fileName": f"file{i}.bin",
+                        "fileSize": self.config.attachment_size,
+                        "timeUploaded": "2024-01-01T00:00:00.000Z",
+                    },
+                }
+                for i in range(1, self.config.attachments + 1)
+            ]
+        return self.attachments[doc_id]
+
+    def list_records(
+        self, doc_id: str, table_id: str, query: Dict[str, List[str]]
+    ) -> Dict[str, Any]:
+        rows = self.table(doc_id, table_id)
+        limit = int(query.get("limit", ["0"])[0]) or len(rows)
+        return {
+            "records": [
+                {"id": id, "fields": fields}
+                for id, fields in list(rows.items())[:limit]
+            ]
+        }
+
+    def add_records(self, doc_id: str, table_id: str, body: Any) -> Dict[str, Any]:
+        rows = self.table(doc_id, table_id)
+        ids = []
+        for record in body["records"]:
+            id = len(rows) + 1
+            rows[id] = record["fields"]
+            ids.append({"id": id})
+        return {"records": ids}
+
+    def patch_records(self, doc_id: str, table_id: str, body: Any) -> None:
+        rows = self.table(doc_id, table_id)
+        for record in body["records"]:
+            rows[record["id"]].update(record["fields"])
+
+    def put_records(self, doc_id: str, table_id: str, body: Any) -> None:
+        rows = self.table(doc_id, table_id)
+        index = {fields.get("Name"): id for id, fields in rows.items()}
+        for record in body["records"]:
+            id = index.get(record["require"].get("Name"))
+            if id is None:
+                id = len(rows) + 1
+                rows[id] = {**record["require"]}
+            rows[id].update(record["fields"])
+
+    def upload(self, doc_id: str, body: bytes) -> List[int]:
+        attachments = self.attachment_list(doc_id)
+        ids = []
+        for name in re.findall(rb'filename="([^"]*)"', body):
+            id = len(attachments) + 1
+            attachments.append(
+                {
+                    "id": id,
+                    "fields": {
+                        "fileName": name.decode(),
+                        "fileSize": self.config.attachment_size,
+                        "timeUploaded": "2024-01-01T00:00:00.000Z",
+                    },
+                }
+            )
+            ids.append(id)
+        return ids
+
+    def columns(self, doc_id: str, table_id: str) -> Dict[str, Any]:
+        fields = next(iter(self.table(doc_id, table_id).values()), {})
+        return {
+            "columns": [
+                {"id": col_id, "fields": {"type": "Any", "label": col_id}}
+                for col_id in fields
+            ]
+        }
+
+
+Route = Callable[[StubGrist, Dict[str, str], Dict[str, List[str]], bytes], Any]
+
+TABLE = r"/api/docs/(?P<doc>[^/]+)/tables/(?P<table>[^/]+)"
+ATTACHMENTS = r"/api/docs/(?P<doc>[^/]+)/attachments"
+
+ROUTES: List[Tuple[str, "re.Pattern[str]", Route]] = [
+    (
+        "GET",
+        re.compile(f"{TABLE}/records"),
+        lambda grist, m, q, b: grist.list_records(m["doc"], m["table"], q),
+    ),
+    (
+        "POST",
+        re.compile(f"{TABLE}/records"),
+        lambda grist, m, q, b: grist.add_records(m["doc"], m["table"], json.loads(b)),
+    ),
+    (
+        "PATCH",
+        re.compile(f"{TABLE}/records"),
+        lambda grist, m, q, b: grist.patch_records(m["doc"], m["table"], json.loads(b)),
+    ),
+    (
+        "PUT",
+        re.compile(f"{TABLE}/records"),
+        lambda grist, m, q, b: grist.put_records(m["doc"], m["table"], json.loads(b)),
+    ),
+    (
+        "GET",
+        re.compile(f"{TABLE}/columns"),
+        lambda grist, m, q, b: grist.columns(m["doc"], m["table"]),
+    ),
+    (
+        "GET",
+        re.compile(r"/api/docs/(?P<doc>[^/]+)/tables"),
+        lambda grist, m, q, b: {
+            "tables": [{"id": "Table1", "fields": {"tableRef": 1, "onDemand": False}}]
+        },
+    ),
+    (
+        "GET",
+        re.compile(ATTACHMENTS),
+        lambda grist, m, q, b: {"records": grist.attachment_list(m["doc"])},
+    ),
+    (
+        "POST",
+        re.compile(ATTACHMENTS),
+        lambda grist, m, q, b: grist.upload(m["doc"], b),
+    ),
+    (
+        "GET",
+        re.compile(f"{ATTACHMENTS}/(?P<id>[0-9]+)/download"),
+        lambda grist, m, q, b: grist.blob,
+    ),
+]
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    grist: StubGrist
+
+    def handle_any(self) -> None:
+        url = urlsplit(self.path)
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length) if length else b""
+        if self.grist.config.latency:
+            time.sleep(self.grist.config.latency)
+        for method, pattern, route in ROUTES:
+            match = pattern.fullmatch(url.path)
+            if method == self.command and match:
+                with self.grist.lock:
+                    result = route(
+                        self.grist, match.groupdict(), parse_qs(url.query), body
+                    )
+                if isinstance(result, bytes):
+                    self.reply(200, result, "application/octet-stream")
+                else:
+                    self.reply(200, json.dumps(result).encode(), "application/json")
+                return
+        self.reply(404, b'{"error": "not found"}', "application/json")
+
+    def reply(self, status: int, body: bytes, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = do_PATCH = do_PUT = do_DELETE = handle_any
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+@contextmanager
+def stub_server(
+    config: Optional[StubConfig] = None,
+) -> Iterator[Tuple[str, StubGrist]]:
+    grist = StubGrist(config or StubConfig())
+    handler = type("Handler", (StubHandler,), {"grist": grist})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        host, port = server.server_address[:2]
+        yield f"http://{host}:{port}", grist
+    finally:
+        server.shutdown()
+        server.server_close()
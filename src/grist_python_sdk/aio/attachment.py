@@ -0,0 +1,44 @@
+from typing import AsyncIterator, List, Optional
+
+from grist_python_sdk.api.attachment import (
+    DEFAULT_CHUNK_SIZE,
+    download_attachment_contents_call,
+    get_attachment_metadata_call,
+    list_attachments_metadata_call,
+    upload_attachments_call,
+)
+from grist_python_sdk.multipart import UploadSource
+
+from .client import AsyncGristAPIClient
+from .utils import run_chunked, to_async
+
+list_attachments_metadata = to_async(list_attachments_metadata_call)
+get_attachment_metadata = to_async(get_attachment_metadata_call)
+download_attachment_contents = to_async(download_attachment_contents_call)
+
+
+async def upload_attachments(
+    client: AsyncGristAPIClient,
+    doc_id: str,
+    filenames: List[UploadSource],
+    batch_size: Optional[int] = None,
+) -> List[int]:
+    results = await run_chunked(
+        client,
+        filenames,
+        lambda batch: upload_attachments_call(doc_id, list(batch)),
+        batch_size,
+    )
+    return [id for ids in results for id in ids]
+
+
+async def iter_attachment_chunks(
+    client: AsyncGristAPIClient,
+    doc_id: str,
+    attachment_id: int,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> AsyncIterator[bytes]:
+    path = f"docs/{doc_id}/attachments/{attachment_id}/download"
+    async with client.stream("get", path) as response:
+        async for chunk in response.aiter_bytes(chunk_size):
+            yield chunk
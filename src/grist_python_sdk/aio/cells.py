@@ -0,0 +1,5 @@
+from grist_python_sdk.api.cells import fetch_codec_call
+
+from .utils import to_async
+
+fetch_codec = to_async(fetch_codec_call)
@@ -0,0 +1,239 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from types import TracebackType
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Type, TypeVar
+
+import httpx
+
+from grist_python_sdk.cache import ResponseCache
+from grist_python_sdk.call import APICall, Method, ReturnType
+from grist_python_sdk.client import BaseGristAPIClient, body_size
+from grist_python_sdk.instrumentation import RequestListener
+from grist_python_sdk.json_codec import JSONCodec
+from grist_python_sdk.multipart import (
+    MultipartStream,
+    UploadItem,
+    UploadSource,
+    upload_parts,
+)
+from grist_python_sdk.ratelimit import RateLimiter
+from grist_python_sdk.retry import RetryPolicy
+
+T = TypeVar("T")
+
+
+class AsyncGristAPIClient(BaseGristAPIClient):
+    def __init__(
+        self,
+        root_url: str,
+        api_key: str,
+        max_concurrency: int = 10,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        json_codec: Optional[JSONCodec] = None,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        listeners: Optional[Sequence[RequestListener]] = None,
+    ) -> None:
+        super().__init__(
+            root_url, api_key, json_codec, retry, rate_limiter, cache, listeners
+        )
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+            transport=transport,
+        )
+
+    async def __aenter__(self) -> "AsyncGristAPIClient":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self.http_client.aclose()
+
+    async def send(
+        self,
+        method: Method,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        content: Optional[bytes] = None,
+        filenames: Optional[Sequence[UploadItem]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> httpx.Response:
+        if params is not None:
+            params = {key: value for key, value in params.items() if value is not None}
+        headers = {**self.headers_with_auth, **(headers or {})}
+        if filenames is not None:
+            with MultipartStream(filenames) as body:
+                headers["Content-Type"] = body.content_type
+                headers["Content-Length"] = str(len(body))
+                return await self.http_client.request(
+                    method=method,
+                    url=self.get_url(path),
+                    params=params,
+                    headers=headers,
+                    content=body.aiter_chunks(),
+                )
+        return await self.http_client.request(
+            method=method,
+            url=self.get_url(path),
+            params=params,
+            headers=headers,
+            content=content,
+        )
+
+    async def send_with_retry(
+        self,
+        method: Method,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        content: Optional[bytes] = None,
+        filenames: Optional[List[UploadSource]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> httpx.Response:
+        started_at = time.time()
+        start = time.perf_counter()
+        attempt = 0
+        parts = None if filenames is None else upload_parts(filenames)
+        while True:
+            attempt += 1
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async(method, path)
+            try:
+                async with self.semaphore:
+                    response = await self.send(
+                        method, path, params, content, parts, headers
+                    )
+            except httpx.TransportError as e:
+                if self.retry is None or not self.retry.should_retry(method, attempt):
+                    if self.listeners:
+                        self.record_request(
+                            method,
+                            path,
+                            started_at,
+                            start,
+                            attempt,
+                            request_bytes=None if content is None else len(content),
+                            error=e,
+                        )
+                    raise
+                delay = self.retry.backoff(attempt)
+            else:
+                if self.retry is None or not self.retry.should_retry(
+                    method, attempt, response.status_code
+                ):
+                    if self.listeners:
+                        self.record_request(
+                            method,
+                            path,
+                            started_at,
+                            start,
+                            attempt,
+                            response.status_code,
+                            body_size(response.request.headers),
+                            len(response.content),
+                        )
+                    return response
+                delay = self.retry.backoff(attempt, response.headers.get("Retry-After"))
+            await asyncio.sleep(delay)
+
+    async def request(
+        self,
+        method: Method,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Any = None,
+        filenames: Optional[List[UploadSource]] = None,
+        return_type: ReturnType = "json",
+        cacheable: bool = False,
+    ) -> Any:
+        cache_key, cached, headers = self.lookup_cache(method, path, params, cacheable)
+        if cached is not None:
+            return self.decode_content(cached, return_type)
+        content = None if json is None else self.json_codec.dumps(json)
+        try:
+            response = await self.send_with_retry(
+                method, path, params, content, filenames, headers
+            )
+        finally:
+            self.invalidate_cache(method, path)
+        if self.cache is not None and cache_key is not None:
+            if response.status_code == 304:
+                cached = self.cache.revalidate(cache_key)
+                if cached is None:
+                    return await self.request(
+                        method, path, params, return_type=return_type, cacheable=True
+                    )
+                return self.decode_content(cached, return_type)
+            if response.is_success:
+                self.cache.store(
+                    cache_key, response.content, response.headers.get("ETag")
+                )
+        response.raise_for_status()
+        if return_type == "json":
+            return self.json_codec.loads(response.content)
+        elif return_type == "text":
+            return response.text
+        elif return_type == "content":
+            return response.content
+
+    @asynccontextmanager
+    async def stream(
+        self,
+        method: Method,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> AsyncIterator[httpx.Response]:
+        if params is not None:
+            params = {key: value for key, value in params.items() if value is not None}
+        started_at = time.time()
+        start = time.perf_counter()
+        async with self.semaphore:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async(method, path)
+            async with self.http_client.stream(
+                method,
+                self.get_url(path),
+                params=params,
+                headers={**self.headers_with_auth, **(headers or {})},
+            ) as response:
+                if self.listeners:
+                    self.record_request(
+                        method,
+                        path,
+                        started_at,
+                        start,
+                        1,
+                        response.status_code,
+                        body_size(response.request.headers),
+                        body_size(response.headers),
+                    )
+                response.raise_for_status()
+                yield response
+
+    async def call(self, api_call: APICall[T]) -> T:
+        return api_call.parse(
+            await self.request(
+                method=api_call.method,
+                path=api_call.path,
+                params=api_call.params,
+                json=api_call.json,
+                filenames=api_call.filenames,
+                return_type=api_call.return_type,
+                cacheable=api_call.cacheable,
+            )
+        )
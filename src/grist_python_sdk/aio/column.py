@@ -0,0 +1,16 @@
+from grist_python_sdk.api.column import (
+    add_columns_call,
+    delete_column_call,
+    list_columns_call,
+    patch_columns_call,
+    put_columns_call,
+)
+
+from .utils import to_async
+
+
+list_columns = to_async(list_columns_call)
+add_columns = to_async(add_columns_call)
+patch_columns = to_async(patch_columns_call)
+put_columns = to_async(put_columns_call)
+delete_column = to_async(delete_column_call)
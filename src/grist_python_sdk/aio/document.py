@@ -0,0 +1,20 @@
+from grist_python_sdk.api.document import (
+    change_doc_pinned_state_call,
+    change_users_of_doc_call,
+    create_doc_call,
+    delete_doc_call,
+    describe_doc_call,
+    list_users_of_doc_call,
+    rename_doc_call,
+)
+
+from .utils import to_async
+
+
+create_doc = to_async(create_doc_call)
+describe_doc = to_async(describe_doc_call)
+rename_doc = to_async(rename_doc_call)
+change_doc_pinned_state = to_async(change_doc_pinned_state_call)
+delete_doc = to_async(delete_doc_call)
+list_users_of_doc = to_async(list_users_of_doc_call)
+change_users_of_doc = to_async(change_users_of_doc_call)
@@ -0,0 +1,112 @@
+import asyncio
+import os
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, List, Optional, Sequence, Union
+
+from grist_python_sdk.api.attachment import DEFAULT_CHUNK_SIZE
+from grist_python_sdk.api.column import list_columns_call
+from grist_python_sdk.api.export import (
+    ExportFormat,
+    ExportResult,
+    NativeFormat,
+    TableExport,
+    atomic_path,
+    native_download_request,
+    open_writer,
+    save_schema,
+    table_path,
+)
+from grist_python_sdk.api.table import list_tables_info_call
+
+from .client import AsyncGristAPIClient
+from .record import iter_record_batches
+
+
+async def export_table(
+    client: AsyncGristAPIClient,
+    doc_id: str,
+    table_id: str,
+    directory: Union[str, "os.PathLike[str]"],
+    fmt: ExportFormat = "jsonl",
+    page_size: int = 500,
+) -> TableExport:
+    path = table_path(Path(directory), table_id, fmt)
+    columns = await client.call(list_columns_call(doc_id, table_id))
+    rows = 0
+    with atomic_path(path) as tmp:
+        writer = open_writer(fmt, tmp, columns, client.json_codec)
+        try:
+            async for records in iter_record_batches(
+                client, doc_id, table_id, page_size=page_size
+            ):
+                writer.write(records)
+                rows += len(records)
+        finally:
+            writer.close()
+    return TableExport(table_id, path, rows, columns)
+
+
+async def export_doc(
+    client: AsyncGristAPIClient,
+    doc_id: str,
+    destination: Union[str, "os.PathLike[str]"],
+    fmt: ExportFormat = "jsonl",
+    table_ids: Optional[Sequence[str]] = None,
+    max_workers: int = 4,
+    page_size: int = 500,
+) -> ExportResult:
+    root = Path(destination)
+    root.mkdir(parents=True, exist_ok=True)
+    if table_ids is None:
+        tables = await client.call(list_tables_info_call(doc_id))
+        table_ids = [table["id"] for table in tables]
+    semaphore = asyncio.Semaphore(max_workers)
+
+    async def run(table_id: str) -> TableExport:
+        async with semaphore:
+            return await export_table(client, doc_id, table_id, root, fmt, page_size)
+
+    outcomes: List[Union[TableExport, BaseException]] = await asyncio.gather(
+        *(run(table_id) for table_id in table_ids), return_exceptions=True
+    )
+    result = ExportResult()
+    for table_id, outcome in zip(table_ids, outcomes):
+        if isinstance(outcome, BaseException):
+            result.failed[table_id] = outcome
+        else:
+            result.tables.append(outcome)
+    save_schema(root, result.tables)
+    return result
+
+
+async def stream_to(
+    client: AsyncGristAPIClient,
+    path: str,
+    params: Dict[str, Any],
+    file: BinaryIO,
+    chunk_size: int,
+) -> int:
+    size = 0
+    async with client.stream("get", path, params) as response:
+        async for chunk in response.aiter_bytes(chunk_size):
+            file.write(chunk)
+            size += len(chunk)
+    return size
+
+
+async def download_doc(
+    client: AsyncGristAPIClient,
+    doc_id: str,
+    destination: Union[str, "os.PathLike[str]", BinaryIO],
+    fmt: NativeFormat = "grist",
+    table_id: Optional[str] = None,
+    nohistory: Optional[bool] = None,
+    header: Optional[str] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    path, params = native_download_request(doc_id, fmt, table_id, nohistory, header)
+    if not isinstance(destination, (str, os.PathLike)):
+        return await stream_to(client, path, params, destination, chunk_size)
+    with atomic_path(Path(destination)) as tmp:
+        with open(tmp, "wb") as f:
+            return await stream_to(client, path, params, f, chunk_size)
@@ -0,0 +1,79 @@
+import asyncio
+import time
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Collection,
+    Iterable,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+from grist_python_sdk.api.fanout import DocOutcome, DocTarget, doc_targets
+from grist_python_sdk.api.workspace import list_workspaces_info_call
+
+from .client import AsyncGristAPIClient
+
+T = TypeVar("T")
+
+AsyncDocOperation = Callable[[AsyncGristAPIClient, str], Awaitable[T]]
+
+
+async def list_doc_targets(
+    client: AsyncGristAPIClient,
+    org_id: Union[int, str],
+    workspace_ids: Optional[Collection[int]] = None,
+) -> List[DocTarget]:
+    workspaces = await client.call(list_workspaces_info_call(org_id))
+    return doc_targets(org_id, workspaces, workspace_ids)
+
+
+async def run_operation(
+    client: AsyncGristAPIClient,
+    target: DocTarget,
+    operation: AsyncDocOperation[T],
+    semaphore: asyncio.Semaphore,
+) -> DocOutcome[T]:
+    async with semaphore:
+        outcome: DocOutcome[T] = DocOutcome(target, started=time.perf_counter())
+        try:
+            outcome.result = await operation(client, target.doc_id)
+        except Exception as e:
+            outcome.error = e
+        outcome.finished = time.perf_counter()
+        return outcome
+
+
+async def run_over_docs(
+    client: AsyncGristAPIClient,
+    targets: Iterable[DocTarget],
+    operation: AsyncDocOperation[T],
+    max_concurrency: int = 8,
+) -> AsyncIterator[DocOutcome[T]]:
+    semaphore = asyncio.Semaphore(max_concurrency)
+    tasks = [
+        asyncio.ensure_future(run_operation(client, target, operation, semaphore))
+        for target in targets
+    ]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def fan_out(
+    client: AsyncGristAPIClient,
+    org_id: Union[int, str],
+    operation: AsyncDocOperation[T],
+    max_concurrency: int = 8,
+    workspace_ids: Optional[Collection[int]] = None,
+) -> AsyncIterator[DocOutcome[T]]:
+    targets = await list_doc_targets(client, org_id, workspace_ids)
+    async for outcome in run_over_docs(client, targets, operation, max_concurrency):
+        yield outcome
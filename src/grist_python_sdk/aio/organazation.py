@@ -0,0 +1,16 @@
+from grist_python_sdk.api.organazation import (
+    change_users_of_organization_call,
+    describe_organization_call,
+    list_organizations_info_call,
+    list_users_of_organization_call,
+    rename_organization_call,
+)
+
+from .utils import to_async
+
+
+list_organizations_info = to_async(list_organizations_info_call)
+describe_organization = to_async(describe_organization_call)
+rename_organization = to_async(rename_organization_call)
+list_users_of_organization = to_async(list_users_of_organization_call)
+change_users_of_organization = to_async(change_users_of_organization_call)
@@ -0,0 +1,44 @@
+from typing import List, Optional, Sequence
+
+from grist_python_sdk.api.query import (
+    Condition,
+    SortSpec,
+    compile_filter,
+    compile_sort,
+    id_pages,
+    order_by_ids,
+    select_ids_call,
+)
+from grist_python_sdk.api.record import fetch_records_call
+from grist_python_sdk.api.typing import RecordInfo
+
+from .client import AsyncGristAPIClient
+
+
+async def select_records(
+    client: AsyncGristAPIClient,
+    doc_id: str,
+    table_id: str,
+    where: Optional[Condition] = None,
+    order_by: Sequence[SortSpec] = (),
+    limit: Optional[int] = None,
+    hidden: Optional[bool] = None,
+) -> List[RecordInfo]:
+    sortstring = compile_sort(order_by) or None
+    filterstring = compile_filter(where) if where is not None else None
+    if where is None or filterstring is not None:
+        return await client.call(
+            fetch_records_call(
+                doc_id, table_id, filterstring, sortstring, limit, hidden
+            )
+        )
+
+    ids = await client.call(select_ids_call(doc_id, table_id, where, order_by, limit))
+    records = [
+        record
+        for page in id_pages(ids)
+        for record in await client.call(
+            fetch_records_call(doc_id, table_id, page, hidden=hidden)
+        )
+    ]
+    return order_by_ids(records, ids)
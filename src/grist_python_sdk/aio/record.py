@@ -0,0 +1,167 @@
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from grist_python_sdk.api.cells import CellCodec
+from grist_python_sdk.api.record import (
+    add_records_call,
+    delete_records_call,
+    encode_fields_by_id,
+    fetch_columns_call,
+    fetch_records_call,
+    list_record_ids_call,
+    page_filterstring,
+    patch_records_call,
+    put_records_call,
+)
+from grist_python_sdk.api.typing import RecordInfo
+
+from .client import AsyncGristAPIClient
+from .utils import run_chunked, to_async
+
+fetch_records = to_async(fetch_records_call)
+fetch_columns = to_async(fetch_columns_call)
+
+
+async def iter_record_batches(
+    client: AsyncGristAPIClient,
+    doc_id: str,
+    table_id: str,
+    filterstring: Optional[str] = None,
+    hidden: Optional[bool] = None,
+    page_size: int = 500,
+    codec: Optional[CellCodec] = None,
+) -> AsyncIterator[List[RecordInfo]]:
+    after_id = 0
+    while True:
+        ids = await client.call(
+            list_record_ids_call(doc_id, table_id, after_id, page_size)
+        )
+        if not ids:
+            return
+        page_filter = page_filterstring(filterstring, ids)
+        if page_filter is not None:
+            records = await client.call(
+                fetch_records_call(
+                    doc_id,
+                    table_id,
+                    page_filter,
+                    sortstring="id",
+                    hidden=hidden,
+                    codec=codec,
+                )
+            )
+            if records:
+                yield records
+        if len(ids) < page_size:
+            return
+        after_id = ids[-1]
+
+
+async def iter_records(
+    client: AsyncGristAPIClient,
+    doc_id: str,
+    table_id: str,
+    filterstring: Optional[str] = None,
+    hidden: Optional[bool] = None,
+    page_size: int = 500,
+    codec: Optional[CellCodec] = None,
+) -> AsyncIterator[RecordInfo]:
+    async for records in iter_record_batches(
+        client, doc_id, table_id, filterstring, hidden, page_size, codec
+    ):
+        for record in records:
+            yield record
+
+
+async def add_records(
+    client: AsyncGristAPIClient,
+    doc_id: str,
+    table_id: str,
+    record_fields: List[Dict[str, Any]],
+    noparse: Optional[bool] = None,
+    chunk_size: Optional[int] = None,
+    max_chunk_bytes: Optional[int] = None,
+    codec: Optional[CellCodec] = None,
+) -> List[int]:
+    if codec is not None:
+        record_fields = codec.encode_fields(record_fields)
+    results = await run_chunked(
+        client,
+        record_fields,
+        lambda chunk: add_records_call(doc_id, table_id, list(chunk), noparse),
+        chunk_size,
+        max_chunk_bytes,
+    )
+    return [id for ids in results for id in ids]
+
+
+async def patch_records(
+    client: AsyncGristAPIClient,
+    doc_id: str,
+    table_id: str,
+    record_fields_dict: Dict[int, Dict[str, Any]],
+    noparse: Optional[bool] = None,
+    chunk_size: Optional[int] = None,
+    max_chunk_bytes: Optional[int] = None,
+    codec: Optional[CellCodec] = None,
+) -> None:
+    if codec is not None:
+        record_fields_dict = encode_fields_by_id(codec, record_fields_dict)
+    await run_chunked(
+        client,
+        list(record_fields_dict.items()),
+        lambda chunk: patch_records_call(doc_id, table_id, dict(chunk), noparse),
+        chunk_size,
+        max_chunk_bytes,
+    )
+
+
+async def put_records(
+    client: AsyncGristAPIClient,
+    doc_id: str,
+    table_id: str,
+    require_fields: List[Dict[str, Any]],
+    record_fields: List[Dict[str, Any]],
+    noparse: Optional[bool] = None,
+    onmany: Optional[str] = None,
+    noadd: Optional[bool] = None,
+    noupdate: Optional[bool] = None,
+    allow_empty_require: Optional[bool] = None,
+    chunk_size: Optional[int] = None,
+    max_chunk_bytes: Optional[int] = None,
+    codec: Optional[CellCodec] = None,
+) -> None:
+    if codec is not None:
+        require_fields = codec.encode_fields(require_fields)
+        record_fields = codec.encode_fields(record_fields)
+    await run_chunked(
+        client,
+        list(zip(require_fields, record_fields)),
+        lambda chunk: put_records_call(
+            doc_id,
+            table_id,
+            [require_field for require_field, _ in chunk],
+            [record_field for _, record_field in chunk],
+            noparse,
+            onmany,
+            noadd,
+            noupdate,
+            allow_empty_require,
+        ),
+        chunk_size,
+        max_chunk_bytes,
+    )
+
+
+async def delete_records(
+    client: AsyncGristAPIClient,
+    doc_id: str,
+    table_id: str,
+    record_ids: List[int],
+    chunk_size: Optional[int] = None,
+) -> None:
+    await run_chunked(
+        client,
+        record_ids,
+        lambda chunk: delete_records_call(doc_id, table_id, list(chunk)),
+        chunk_size,
+    )
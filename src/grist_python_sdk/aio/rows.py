@@ -0,0 +1,5 @@
+from grist_python_sdk.api.rows import fetch_rows_call
+
+from .utils import to_async
+
+fetch_rows = to_async(fetch_rows_call)
@@ -0,0 +1,52 @@
+from typing import Any, AsyncIterator, List, Optional, Sequence
+
+from grist_python_sdk.api.sql import (
+    SQLRow,
+    next_sql_cursor,
+    query_sql_call,
+    query_sql_columns_call,
+    sql_page_call,
+)
+
+from .client import AsyncGristAPIClient
+from .utils import to_async
+
+query_sql = to_async(query_sql_call)
+query_sql_columns = to_async(query_sql_columns_call)
+
+
+async def iter_sql_batches(
+    client: AsyncGristAPIClient,
+    doc_id: str,
+    sql: str,
+    args: Optional[Sequence[Any]] = None,
+    page_size: int = 1000,
+    key_column: Optional[str] = None,
+    timeout: Optional[int] = None,
+) -> AsyncIterator[List[SQLRow]]:
+    cursor = None
+    while True:
+        rows = await client.call(
+            sql_page_call(doc_id, sql, args, page_size, cursor, key_column, timeout)
+        )
+        if rows:
+            yield rows
+        if len(rows) < page_size:
+            return
+        cursor = next_sql_cursor(rows, cursor, key_column)
+
+
+async def iter_sql(
+    client: AsyncGristAPIClient,
+    doc_id: str,
+    sql: str,
+    args: Optional[Sequence[Any]] = None,
+    page_size: int = 1000,
+    key_column: Optional[str] = None,
+    timeout: Optional[int] = None,
+) -> AsyncIterator[SQLRow]:
+    async for rows in iter_sql_batches(
+        client, doc_id, sql, args, page_size, key_column, timeout
+    ):
+        for row in rows:
+            yield row
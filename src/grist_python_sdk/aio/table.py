@@ -0,0 +1,12 @@
+from grist_python_sdk.api.table import (
+    add_tables_call,
+    list_tables_info_call,
+    modify_tables_call,
+)
+
+from .utils import to_async
+
+
+list_tables_info = to_async(list_tables_info_call)
+modify_tables = to_async(modify_tables_call)
+add_tables = to_async(add_tables_call)
@@ -0,0 +1,51 @@
+import asyncio
+from typing import (
+    Any,
+    Callable,
+    Concatenate,
+    Coroutine,
+    List,
+    Optional,
+    ParamSpec,
+    Sequence,
+    TypeVar,
+)
+
+from grist_python_sdk.api.chunking import collect_chunk_results, split_chunks
+from grist_python_sdk.call import APICall
+
+from .client import AsyncGristAPIClient
+
+P = ParamSpec("P")
+T = TypeVar("T")
+ItemT = TypeVar("ItemT")
+
+
+def to_async(
+    build_call: Callable[P, APICall[T]],
+) -> Callable[Concatenate[AsyncGristAPIClient, P], Coroutine[Any, Any, T]]:
+    async def run(
+        client: AsyncGristAPIClient, /, *args: P.args, **kwargs: P.kwargs
+    ) -> T:
+        return await client.call(build_call(*args, **kwargs))
+
+    run.__name__ = build_call.__name__.removesuffix("_call")
+    run.__qualname__ = run.__name__
+    run.__doc__ = build_call.__doc__
+    return run
+
+
+async def run_chunked(
+    client: AsyncGristAPIClient,
+    items: Sequence[ItemT],
+    build_call: Callable[[Sequence[ItemT]], APICall[T]],
+    chunk_size: Optional[int] = None,
+    max_chunk_bytes: Optional[int] = None,
+) -> List[T]:
+    if chunk_size is None and max_chunk_bytes is None:
+        return [await client.call(build_call(items))]
+    chunks = split_chunks(items, chunk_size, max_chunk_bytes)
+    outcomes = await asyncio.gather(
+        *(client.call(build_call(chunk)) for chunk in chunks), return_exceptions=True
+    )
+    return collect_chunk_results(chunks, outcomes)
@@ -0,0 +1,15 @@
+from grist_python_sdk.api.webhook import (
+    add_webhooks_call,
+    clear_webhook_queue_call,
+    delete_webhook_call,
+    list_webhooks_call,
+    modify_webhook_call,
+)
+
+from .utils import to_async
+
+list_webhooks = to_async(list_webhooks_call)
+add_webhooks = to_async(add_webhooks_call)
+modify_webhook = to_async(modify_webhook_call)
+delete_webhook = to_async(delete_webhook_call)
+clear_webhook_queue = to_async(clear_webhook_queue_call)
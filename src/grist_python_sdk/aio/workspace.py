@@ -0,0 +1,20 @@
+from grist_python_sdk.api.workspace import (
+    change_users_of_workspace_call,
+    create_workspace_call,
+    delete_workspace_call,
+    describe_workspace_call,
+    list_users_of_workspace_call,
+    list_workspaces_info_call,
+    rename_workspace_call,
+)
+
+from .utils import to_async
+
+
+list_workspaces_info = to_async(list_workspaces_info_call)
+describe_workspace = to_async(describe_workspace_call)
+list_users_of_workspace = to_async(list_users_of_workspace_call)
+change_users_of_workspace = to_async(change_users_of_workspace_call)
+delete_workspace = to_async(delete_workspace_call)
+rename_workspace = to_async(rename_workspace_call)
+create_workspace = to_async(create_workspace_call)
@@ -1,16 +1,81 @@
-from typing import Any, Dict, List, Optional
+import hashlib
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import (
+    Any,
+    BinaryIO,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Union,
+    cast,
+)
 
+from requests import HTTPError
+
+from grist_python_sdk.call import APICall
 from grist_python_sdk.client import GristAPIClient
+from grist_python_sdk.multipart import UploadSource
 
+from .chunking import run_chunked
 from .typing import AttachmentMetadataFieldsInfo, AttachmentMetadataInfo
+from .utils import TimestampMode, parse_timestamps
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
 
 
-def parse_attachment_fields_info(data: Dict[Any, Any]) -> AttachmentMetadataFieldsInfo:
-    return {
+def parse_attachment_fields_info(
+    data: Dict[Any, Any], timestamps: TimestampMode = "raw"
+) -> AttachmentMetadataFieldsInfo:
+    fields = {
         "fileName": str(data["fileName"]),
         "fileSize": int(data["fileSize"]),
         "timeUploaded": str(data["timeUploaded"]),
     }
+    return cast(
+        AttachmentMetadataFieldsInfo,
+        parse_timestamps(fields, ("timeUploaded",), timestamps),
+    )
+
+
+def parse_attachments_metadata(
+    response: Dict[Any, Any], timestamps: TimestampMode = "raw"
+) -> List[AttachmentMetadataInfo]:
+    return [
+        {
+            "id": int(record["id"]),
+            "fields": parse_attachment_fields_info(record["fields"], timestamps),
+        }
+        for record in response["records"]
+    ]
+
+
+def parse_attachment_ids(response: List[Any]) -> List[int]:
+    return [int(id) for id in response]
+
+
+def parse_attachment_contents(response: bytes) -> bytes:
+    return response
+
+
+def list_attachments_metadata_call(
+    doc_id: str,
+    filter_: Optional[str] = None,
+    sort: Optional[str] = None,
+    limit: Optional[int] = None,
+    timestamps: TimestampMode = "raw",
+) -> APICall[List[AttachmentMetadataInfo]]:
+    path = f"docs/{doc_id}/attachments"
+    params = {"filter": filter_, "sort": sort, "limit": limit}
+    return APICall(
+        "get",
+        path,
+        lambda response: parse_attachments_metadata(response, timestamps),
+        params=params,
+    )
 
 
 def list_attachments_metadata(
@@ -19,39 +84,60 @@ def list_attachments_metadata(
     filter_: Optional[str] = None,
     sort: Optional[str] = None,
     limit: Optional[int] = None,
+    timestamps: TimestampMode = "raw",
 ) -> List[AttachmentMetadataInfo]:
-    path = f"docs/{doc_id}/attachments"
-    params = {"filter": filter_, "sort": sort, "limit": limit}
-    response: Dict[Any, Any] = client.request(method="get", path=path, params=params)
+    return client.call(
+        list_attachments_metadata_call(doc_id, filter_, sort, limit, timestamps)
+    )
 
-    return [
-        {
-            "id": int(record["id"]),
-            "fields": parse_attachment_fields_info(record["fields"]),
-        }
-        for record in response["records"]
-    ]
+
+def upload_attachments_call(
+    doc_id: str, filenames: List[UploadSource]
+) -> APICall[List[int]]:
+    path = f"docs/{doc_id}/attachments"
+    return APICall("post", path, parse_attachment_ids, filenames=filenames)
 
 
 def upload_attachments(
     client: GristAPIClient,
     doc_id: str,
-    filenames: List[str],
+    filenames: List[UploadSource],
+    batch_size: Optional[int] = None,
+    max_workers: int = 1,
 ) -> List[int]:
-    path = f"docs/{doc_id}/attachments"
-    response: List[Any] = client.request(method="post", path=path, filenames=filenames)
-    print(response)
-    return [int(id) for id in response]
+    results = run_chunked(
+        client,
+        filenames,
+        lambda batch: upload_attachments_call(doc_id, list(batch)),
+        batch_size,
+        max_workers=max_workers,
+    )
+    return [id for ids in results for id in ids]
+
+
+def get_attachment_metadata_call(
+    doc_id: str, attachment_id: int, timestamps: TimestampMode = "raw"
+) -> APICall[AttachmentMetadataFieldsInfo]:
+    path = f"docs/{doc_id}/attachments/{attachment_id}"
+    return APICall(
+        "get", path, lambda response: parse_attachment_fields_info(response, timestamps)
+    )
 
 
 def get_attachment_metadata(
     client: GristAPIClient,
     doc_id: str,
     attachment_id: int,
+    timestamps: TimestampMode = "raw",
 ) -> AttachmentMetadataFieldsInfo:
-    path = f"docs/{doc_id}/attachments/{attachment_id}"
-    response = client.request(method="get", path=path)
-    return parse_attachment_fields_info(response)
+    return client.call(get_attachment_metadata_call(doc_id, attachment_id, timestamps))
+
+
+def download_attachment_contents_call(
+    doc_id: str, attachment_id: int
+) -> APICall[bytes]:
+    path = f"docs/{doc_id}/attachments/{attachment_id}/download"
+    return APICall("get", path, parse_attachment_contents, return_type="content")
 
 
 def download_attachment_contents(
@@ -59,6 +145,93 @@ def download_attachment_contents(
     doc_id: str,
     attachment_id: int,
 ) -> bytes:
+    return client.call(download_attachment_contents_call(doc_id, attachment_id))
+
+
+@dataclass
+class DownloadResult:
+    size: int
+    checksum: Optional[str] = None
+    resumed: bool = False
+
+
+def iter_attachment_chunks(
+    client: GristAPIClient,
+    doc_id: str,
+    attachment_id: int,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[bytes]:
     path = f"docs/{doc_id}/attachments/{attachment_id}/download"
-    response: bytes = client.request(method="get", path=path, return_type="content")
-    return response
+    with client.stream("get", path) as response:
+        yield from response.iter_content(chunk_size=chunk_size)
+
+
+def write_chunks(
+    chunks: Iterable[bytes], file: BinaryIO, hasher: Optional["hashlib._Hash"]
+) -> int:
+    size = 0
+    for chunk in chunks:
+        file.write(chunk)
+        if hasher is not None:
+            hasher.update(chunk)
+        size += len(chunk)
+    return size
+
+
+def hash_file(
+    path: Path, hasher: "hashlib._Hash", chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> None:
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            hasher.update(chunk)
+
+
+def download_attachment(
+    client: GristAPIClient,
+    doc_id: str,
+    attachment_id: int,
+    destination: Union[str, "os.PathLike[str]", BinaryIO],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    checksum: Optional[str] = None,
+    resume: bool = False,
+) -> DownloadResult:
+    path = f"docs/{doc_id}/attachments/{attachment_id}/download"
+    hasher = hashlib.new(checksum) if checksum is not None else None
+    if not isinstance(destination, (str, os.PathLike)):
+        with client.stream("get", path) as response:
+            size = write_chunks(response.iter_content(chunk_size), destination, hasher)
+        return DownloadResult(size, hasher.hexdigest() if hasher else None)
+
+    destination = Path(destination)
+    offset = destination.stat().st_size if resume and destination.exists() else 0
+    if offset:
+        try:
+            with client.stream(
+                "get", path, headers={"Range": f"bytes={offset}-"}
+            ) as response:
+                if response.status_code == 206:
+                    if hasher is not None:
+                        hash_file(destination, hasher, chunk_size)
+                    with open(destination, "ab") as f:
+                        size = write_chunks(
+                            response.iter_content(chunk_size), f, hasher
+                        )
+                    return DownloadResult(
+                        offset + size, hasher.hexdigest() if hasher else None, True
+                    )
+                with open(destination, "wb") as f:
+                    size = write_chunks(response.iter_content(chunk_size), f, hasher)
+                return DownloadResult(size, hasher.hexdigest() if hasher else None)
+        except HTTPError as e:
+            if e.response is None or e.response.status_code != 416:
+                raise
+        metadata = get_attachment_metadata(client, doc_id, attachment_id)
+        if metadata["fileSize"] == offset:
+            if hasher is not None:
+                hash_file(destination, hasher, chunk_size)
+            return DownloadResult(offset, hasher.hexdigest() if hasher else None, True)
+
+    with client.stream("get", path) as response:
+        with open(destination, "wb") as f:
+            size = write_chunks(response.iter_content(chunk_size), f, hasher)
+    return DownloadResult(size, hasher.hexdigest() if hasher else None)
@@ -0,0 +1,271 @@
+from dataclasses import dataclass
+from datetime import date, datetime, timezone, tzinfo
+from functools import lru_cache
+from itertools import chain
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from grist_python_sdk.call import APICall
+from grist_python_sdk.client import GristAPIClient
+from grist_python_sdk.optional import find_optional
+
+from .column import list_columns_call, parse_columns
+from .typing import ColumnarData, ColumnInfo, RecordInfo
+
+EPOCH = date(1970, 1, 1)
+DAY_SECONDS = 86400
+NUMBER_TYPES = (int, float)
+
+ColumnConverter = Callable[[str, Sequence[Any]], List[Any]]
+
+
+@dataclass(frozen=True)
+class CellError:
+    error: str
+    message: str = ""
+    details: Optional[Dict[str, Any]] = None
+
+    def encode(self) -> List[Any]:
+        encoded: List[Any] = ["E", self.error, self.message]
+        if self.details is not None:
+            encoded.append(self.details)
+        return encoded
+
+
+@lru_cache(maxsize=64)
+def column_timezone(name: Optional[str]) -> tzinfo:
+    if not name or name == "UTC":
+        return timezone.utc
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError):
+        return timezone.utc
+
+
+def split_type(col_type: Optional[str]) -> Tuple[str, Optional[str]]:
+    kind, _, arg = (col_type or "Any").partition(":")
+    return kind, arg or None
+
+
+def is_number(value: Any) -> bool:
+    return type(value) in NUMBER_TYPES
+
+
+def to_date(seconds: float) -> date:
+    return datetime.fromtimestamp(seconds, timezone.utc).date()
+
+
+def to_datetime(seconds: float, tz: tzinfo) -> datetime:
+    return datetime.fromtimestamp(seconds, tz)
+
+
+def date_seconds(value: date) -> int:
+    if isinstance(value, datetime):
+        value = value.date()
+    return (value - EPOCH).days * DAY_SECONDS
+
+
+def datetime_seconds(value: date, tz: tzinfo) -> float:
+    if not isinstance(value, datetime):
+        value = datetime(value.year, value.month, value.day)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=tz)
+    return value.timestamp()
+
+
+def timezone_name(value: datetime) -> str:
+    return str(getattr(value.tzinfo, "key", "UTC"))
+
+
+def decode_cell(value: Any) -> Any:
+    if not isinstance(value, list) or not value or not isinstance(value[0], str):
+        return value
+    tag = value[0]
+    if tag == "L":
+        return [decode_cell(item) for item in value[1:]]
+    if tag == "E":
+        return CellError(*value[1:4])
+    if tag == "d":
+        return to_date(value[1])
+    if tag == "D":
+        return to_datetime(
+            value[1], column_timezone(value[2] if len(value) > 2 else None)
+        )
+    if tag == "R":
+        return value[2]
+    if tag == "r":
+        return list(value[2])
+    if tag == "O":
+        return {key: decode_cell(item) for key, item in value[1].items()}
+    return value
+
+
+def encode_cell(value: Any) -> Any:
+    if isinstance(value, CellError):
+        return value.encode()
+    if isinstance(value, datetime):
+        return ["D", datetime_seconds(value, timezone.utc), timezone_name(value)]
+    if isinstance(value, date):
+        return ["d", date_seconds(value)]
+    if isinstance(value, (list, tuple)):
+        return ["L", *(encode_cell(item) for item in value)]
+    if isinstance(value, dict):
+        return ["O", {key: encode_cell(item) for key, item in value.items()}]
+    return value
+
+
+def decode_timestamp(value: Any, tz: Optional[tzinfo]) -> Any:
+    if not is_number(value):
+        return decode_cell(value)
+    return to_date(value) if tz is None else to_datetime(value, tz)
+
+
+def encode_timestamp(value: Any, tz: Optional[tzinfo]) -> Any:
+    if not isinstance(value, date):
+        return encode_cell(value)
+    return date_seconds(value) if tz is None else datetime_seconds(value, tz)
+
+
+class CellCodec:
+    def __init__(
+        self, column_types: Dict[str, Optional[str]], vectorize: bool = True
+    ) -> None:
+        self.column_types = column_types
+        self.np = find_optional("numpy") if vectorize else None
+
+    @classmethod
+    def from_columns(
+        cls, columns: List[ColumnInfo], vectorize: bool = True
+    ) -> "CellCodec":
+        return cls(
+            {col["id"]: col.get("fields", {}).get("type") for col in columns},
+            vectorize,
+        )
+
+    def decode_timestamps(
+        self, values: Sequence[Any], tz: Optional[tzinfo]
+    ) -> Optional[List[Any]]:
+        np = self.np
+        if np is None or not all(value is None or is_number(value) for value in values):
+            return None
+        seconds = np.asarray(values, dtype="float64")
+        missing = np.isnan(seconds)
+        micros = np.where(missing, 0, np.round(seconds * 1e6)).astype("int64")
+        stamps = micros.astype("datetime64[us]")
+        decoded: List[Any]
+        if tz is None:
+            decoded = stamps.astype("datetime64[D]").astype(object).tolist()
+        else:
+            decoded = [
+                stamp.replace(tzinfo=timezone.utc).astimezone(tz)
+                for stamp in stamps.astype(object).tolist()
+            ]
+        for i in np.flatnonzero(missing).tolist():
+            decoded[i] = None
+        return decoded
+
+    def encode_timestamps(
+        self, values: Sequence[Any], unit: str
+    ) -> Optional[List[Any]]:
+        np = self.np
+        if np is None:
+            return None
+        if isinstance(values, np.ndarray):
+            if values.dtype.kind != "M":
+                return None
+            stamps = values.astype(f"datetime64[{unit}]")
+        elif unit == "D" and all(
+            value is None or type(value) is date for value in values
+        ):
+            stamps = np.array(values, dtype="datetime64[D]")
+        else:
+            return None
+        missing = np.isnat(stamps)
+        encoded: List[Any]
+        if unit == "D":
+            encoded = stamps.astype("datetime64[s]").astype("int64").tolist()
+        else:
+            encoded = (stamps.astype("datetime64[us]").astype("int64") / 1e6).tolist()
+        for i in np.flatnonzero(missing).tolist():
+            encoded[i] = None
+        return encoded
+
+    def decode_column(self, col_id: str, values: Sequence[Any]) -> List[Any]:
+        kind, arg = split_type(self.column_types.get(col_id))
+        if kind in ("Date", "DateTime"):
+            tz = column_timezone(arg) if kind == "DateTime" else None
+            decoded = self.decode_timestamps(values, tz)
+            if decoded is not None:
+                return decoded
+            return [decode_timestamp(value, tz) for value in values]
+        if kind == "Ref":
+            return [None if value == 0 else decode_cell(value) for value in values]
+        return [decode_cell(value) for value in values]
+
+    def encode_column(self, col_id: str, values: Sequence[Any]) -> List[Any]:
+        kind, arg = split_type(self.column_types.get(col_id))
+        if kind in ("Date", "DateTime"):
+            encoded = self.encode_timestamps(values, "D" if kind == "Date" else "us")
+            if encoded is not None:
+                return encoded
+            tz = None if kind == "Date" else column_timezone(arg)
+            return [encode_timestamp(value, tz) for value in values]
+        if kind == "Ref":
+            return [0 if value is None else value for value in values]
+        return [encode_cell(value) for value in values]
+
+    def decode_columns(self, columns: ColumnarData) -> ColumnarData:
+        return {
+            col_id: self.decode_column(col_id, values)
+            for col_id, values in columns.items()
+        }
+
+    def encode_columns(self, columns: ColumnarData) -> ColumnarData:
+        return {
+            col_id: self.encode_column(col_id, values)
+            for col_id, values in columns.items()
+        }
+
+    def convert_fields(
+        self, rows: Sequence[Dict[str, Any]], convert: ColumnConverter
+    ) -> List[Dict[str, Any]]:
+        converted = [dict(fields) for fields in rows]
+        for col_id in dict.fromkeys(chain.from_iterable(converted)):
+            present = [fields for fields in converted if col_id in fields]
+            values = convert(col_id, [fields[col_id] for fields in present])
+            for fields, value in zip(present, values):
+                fields[col_id] = value
+        return converted
+
+    def decode_fields(self, rows: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return self.convert_fields(rows, self.decode_column)
+
+    def encode_fields(self, rows: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return self.convert_fields(rows, self.encode_column)
+
+    def decode_records(self, records: List[RecordInfo]) -> List[RecordInfo]:
+        fields = self.decode_fields([record["fields"] for record in records])
+        return [
+            {"id": record["id"], "fields": decoded}
+            for record, decoded in zip(records, fields)
+        ]
+
+
+def fetch_codec_call(
+    doc_id: str, table_id: str, vectorize: bool = True
+) -> APICall[CellCodec]:
+    call = list_columns_call(doc_id, table_id, hidden=True)
+    return APICall(
+        call.method,
+        call.path,
+        lambda response: CellCodec.from_columns(parse_columns(response), vectorize),
+        params=call.params,
+        cacheable=True,
+    )
+
+
+def fetch_codec(
+    client: GristAPIClient, doc_id: str, table_id: str, vectorize: bool = True
+) -> CellCodec:
+    return client.call(fetch_codec_call(doc_id, table_id, vectorize))
@@ -0,0 +1,98 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional, Sequence, TypeVar
+
+from grist_python_sdk.call import APICall
+from grist_python_sdk.client import GristAPIClient
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+@dataclass
+class ChunkFailure:
+    index: int
+    start: int
+    stop: int
+    error: BaseException
+
+
+class ChunkedRequestError(Exception):
+    def __init__(self, failures: List[ChunkFailure], results: List[Any]) -> None:
+        ranges = ", ".join(
+            f"[{failure.start}:{failure.stop}] ({failure.error!r})"
+            for failure in failures
+        )
+        super().__init__(f"{len(failures)} chunk(s) failed: {ranges}")
+        self.failures = failures
+        self.results = results
+
+
+def split_chunks(
+    items: Sequence[T],
+    chunk_size: Optional[int] = None,
+    max_chunk_bytes: Optional[int] = None,
+) -> List[Sequence[T]]:
+    if chunk_size is not None and chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    if chunk_size is None and max_chunk_bytes is None:
+        return [items]
+    if max_chunk_bytes is None:
+        assert chunk_size is not None
+        return [items[i : i + chunk_size] for i in range(0, len(items), chunk_size)]
+
+    chunks: List[Sequence[T]] = []
+    start = 0
+    chunk_bytes = 0
+    for i, item in enumerate(items):
+        item_bytes = len(json.dumps(item, separators=(",", ":"))) + 1
+        full = chunk_size is not None and i - start >= chunk_size
+        if i > start and (full or chunk_bytes + item_bytes > max_chunk_bytes):
+            chunks.append(items[start:i])
+            start = i
+            chunk_bytes = 0
+        chunk_bytes += item_bytes
+    if start < len(items):
+        chunks.append(items[start:])
+    return chunks
+
+
+def run_chunked(
+    client: GristAPIClient,
+    items: Sequence[T],
+    build_call: Callable[[Sequence[T]], APICall[R]],
+    chunk_size: Optional[int] = None,
+    max_chunk_bytes: Optional[int] = None,
+    max_workers: int = 1,
+) -> List[R]:
+    if chunk_size is None and max_chunk_bytes is None:
+        return [client.call(build_call(items))]
+    chunks = split_chunks(items, chunk_size, max_chunk_bytes)
+
+    def run(chunk: Sequence[T]) -> R:
+        return client.call(build_call(chunk))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(run, chunk) for chunk in chunks]
+        return collect_chunk_results(
+            chunks, [future.exception() or future.result() for future in futures]
+        )
+
+
+def collect_chunk_results(
+    chunks: Sequence[Sequence[Any]], outcomes: Sequence[Any]
+) -> List[Any]:
+    results: List[Any] = []
+    failures: List[ChunkFailure] = []
+    start = 0
+    for index, (chunk, outcome) in enumerate(zip(chunks, outcomes)):
+        if isinstance(outcome, BaseException):
+            results.append(None)
+            failures.append(ChunkFailure(index, start, start + len(chunk), outcome))
+        else:
+            results.append(outcome)
+        start += len(chunk)
+    if failures:
+        raise ChunkedRequestError(failures, results)
+    return results
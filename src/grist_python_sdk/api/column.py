@@ -1,38 +1,78 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
+from grist_python_sdk.call import APICall, ignore_response
 from grist_python_sdk.client import GristAPIClient
 
 from .typing import ColumnInfo
 
 
+def parse_columns(response: Dict[str, Any]) -> List[ColumnInfo]:
+    return [
+        {"id": column_parsed["id"], "fields": column_parsed["fields"]}
+        for column_parsed in response["columns"]
+    ]
+
+
+def parse_column_ids(response: Dict[str, Any]) -> List[str]:
+    return [col["id"] for col in response["columns"]]
+
+
+def list_columns_call(
+    doc_id: str, table_id: str, hidden: Optional[bool] = None
+) -> APICall[List[ColumnInfo]]:
+    path = f"docs/{doc_id}/tables/{table_id}/columns"
+    params = {"hidden": hidden} if hidden is not None else None
+    return APICall("get", path, parse_columns, params=params, cacheable=True)
+
+
 def list_columns(
     client: GristAPIClient, doc_id: str, table_id: str, hidden: Optional[bool] = None
 ) -> List[ColumnInfo]:
+    return client.call(list_columns_call(doc_id, table_id, hidden))
+
+
+def add_columns_call(
+    doc_id: str, table_id: str, columns: List[ColumnInfo]
+) -> APICall[List[str]]:
     path = f"docs/{doc_id}/tables/{table_id}/columns"
-    params = {"hidden": hidden} if hidden is not None else None
-    columns_parsed = client.request(method="get", path=path, params=params)["columns"]
-    columns: List[ColumnInfo] = [
-        {"id": column_parsed["id"], "fields": column_parsed["fields"]}
-        for column_parsed in columns_parsed
-    ]
-    return columns
+    payload = {"columns": columns}
+    return APICall("post", path, parse_column_ids, json=payload)
 
 
 def add_columns(
     client: GristAPIClient, doc_id: str, table_id: str, columns: List[ColumnInfo]
 ) -> List[str]:
+    return client.call(add_columns_call(doc_id, table_id, columns))
+
+
+def patch_columns_call(
+    doc_id: str, table_id: str, columns: List[ColumnInfo]
+) -> APICall[None]:
     path = f"docs/{doc_id}/tables/{table_id}/columns"
     payload = {"columns": columns}
-    response = client.request(method="post", path=path, json=payload)["columns"]
-    return [col["id"] for col in response]
+    return APICall("patch", path, ignore_response, json=payload, return_type="text")
 
 
 def patch_columns(
     client: GristAPIClient, doc_id: str, table_id: str, columns: List[ColumnInfo]
 ) -> None:
+    client.call(patch_columns_call(doc_id, table_id, columns))
+
+
+def put_columns_call(
+    doc_id: str,
+    table_id: str,
+    columns: List[ColumnInfo],
+    noadd: Optional[bool] = None,
+    noupdate: Optional[bool] = None,
+    replaceall: Optional[bool] = None,
+) -> APICall[None]:
     path = f"docs/{doc_id}/tables/{table_id}/columns"
+    params = {"noadd": noadd, "noupdate": noupdate, "replaceall": replaceall}
     payload = {"columns": columns}
-    client.request(method="patch", path=path, json=payload, return_type="text")
+    return APICall(
+        "put", path, ignore_response, params=params, json=payload, return_type="text"
+    )
 
 
 def put_columns(
@@ -44,16 +84,17 @@ def put_columns(
     noupdate: Optional[bool] = None,
     replaceall: Optional[bool] = None,
 ) -> None:
-    path = f"docs/{doc_id}/tables/{table_id}/columns"
-    params = {"noadd": noadd, "noupdate": noupdate, "replaceall": replaceall}
-    payload = {"columns": columns}
-    client.request(
-        method="put", path=path, params=params, json=payload, return_type="text"
+    client.call(
+        put_columns_call(doc_id, table_id, columns, noadd, noupdate, replaceall)
     )
 
 
+def delete_column_call(doc_id: str, table_id: str, col_id: str) -> APICall[None]:
+    path = f"docs/{doc_id}/tables/{table_id}/columns/{col_id}"
+    return APICall("delete", path, ignore_response, return_type="text")
+
+
 def delete_column(
     client: GristAPIClient, doc_id: str, table_id: str, col_id: str
 ) -> None:
-    path = f"docs/{doc_id}/tables/{table_id}/columns/{col_id}"
-    client.request(method="delete", path=path, return_type="text")
+    client.call(delete_column_call(doc_id, table_id, col_id))
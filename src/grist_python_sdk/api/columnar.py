@@ -0,0 +1,29 @@
+from typing import Any, Dict, Optional
+
+from grist_python_sdk.optional import import_optional
+
+from .typing import ColumnarData
+
+
+def to_numpy(
+    columns: ColumnarData, dtypes: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    np = import_optional("numpy", "numpy")
+    dtypes = dtypes or {}
+    return {
+        col_id: np.asarray(values, dtype=dtypes.get(col_id))
+        for col_id, values in columns.items()
+    }
+
+
+def to_pandas(columns: ColumnarData, index: Optional[str] = "id") -> Any:
+    pd = import_optional("pandas", "pandas")
+    df = pd.DataFrame(columns, copy=False)
+    if index is not None and index in columns:
+        df = df.set_index(index)
+    return df
+
+
+def to_arrow(columns: ColumnarData) -> Any:
+    pa = import_optional("pyarrow", "arrow")
+    return pa.table(columns)
@@ -1,56 +1,86 @@
 from typing import Any, Dict, List
 
+from grist_python_sdk.call import APICall, ignore_response
 from grist_python_sdk.client import GristAPIClient
 
 from .typing import Access, DocumentInfo, UserInfo
-from .utils import parse_document_info
+from .utils import parse_document_info, parse_users
+
+
+def parse_doc_id(response: str) -> str:
+    return response.replace('"', "")
+
+
+def create_doc_call(ws_id: int, name: str, pinned: bool = False) -> APICall[str]:
+    return APICall(
+        "post",
+        f"workspaces/{ws_id}/docs",
+        parse_doc_id,
+        json={"name": name, "isPinned": pinned},
+        return_type="text",
+    )
 
 
 def create_doc(
     client: GristAPIClient, ws_id: int, name: str, pinned: bool = False
 ) -> str:
-    doc_id: str = client.request(
-        method="post",
-        path=f"workspaces/{ws_id}/docs",
-        json={"name": name, "isPinned": pinned},
-        return_type="text",
-    ).replace('"', "")
-    return doc_id
+    return client.call(create_doc_call(ws_id, name, pinned))
+
+
+def describe_doc_call(doc_id: str) -> APICall[DocumentInfo]:
+    return APICall("get", f"docs/{doc_id}", parse_document_info, cacheable=True)
 
 
 def describe_doc(client: GristAPIClient, doc_id: str) -> DocumentInfo:
-    print(f"docs/{doc_id}")
-    doc_parsed: Dict[str, Any] = client.request(method="get", path=f"docs/{doc_id}")
-    return parse_document_info(doc_parsed)
+    return client.call(describe_doc_call(doc_id))
 
 
-def rename_doc(client: GristAPIClient, doc_id: str, new_name: str) -> None:
+def rename_doc_call(doc_id: str, new_name: str) -> APICall[None]:
     changes = {"name": new_name}
-    client.request(method="patch", path=f"docs/{doc_id}", json=changes)
+    return APICall("patch", f"docs/{doc_id}", ignore_response, json=changes)
+
+
+def rename_doc(client: GristAPIClient, doc_id: str, new_name: str) -> None:
+    client.call(rename_doc_call(doc_id, new_name))
+
+
+def change_doc_pinned_state_call(doc_id: str, is_pinned: bool) -> APICall[None]:
+    changes = {"isPinned": is_pinned}
+    return APICall("patch", f"docs/{doc_id}", ignore_response, json=changes)
 
 
 def change_doc_pinned_state(
     client: GristAPIClient, doc_id: str, is_pinned: bool
 ) -> None:
-    changes = {"isPinned": is_pinned}
-    client.request(method="patch", path=f"docs/{doc_id}", json=changes)
+    client.call(change_doc_pinned_state_call(doc_id, is_pinned))
+
+
+def delete_doc_call(doc_id: str) -> APICall[None]:
+    return APICall("delete", f"docs/{doc_id}", ignore_response)
 
 
 def delete_doc(client: GristAPIClient, doc_id: str) -> None:
-    client.request(method="delete", path=f"docs/{doc_id}")
+    client.call(delete_doc_call(doc_id))
+
+
+def list_users_of_doc_call(doc_id: str) -> APICall[List[UserInfo]]:
+    return APICall("get", f"docs/{doc_id}/access", parse_users, cacheable=True)
 
 
 def list_users_of_doc(client: GristAPIClient, doc_id: str) -> List[UserInfo]:
-    users: List[UserInfo] = client.request(method="get", path=f"docs/{doc_id}/access")[
-        "users"
-    ]
-    return users
+    return client.call(list_users_of_doc_call(doc_id))
 
 
-def change_users_of_doc(
-    client: GristAPIClient, doc_id: str, users_info: Dict[str, Access]
-) -> None:
+def change_users_of_doc_call(
+    doc_id: str, users_info: Dict[str, Access]
+) -> APICall[None]:
     delta_info: Dict[str, Any] = {
         "delta": {"maxInheritedRole": "owners", "users": users_info}
     }
-    client.request(method="patch", path=f"docs/{doc_id}/access", json=delta_info)
+    return APICall("patch", f"docs/{doc_id}/access", ignore_response, json=delta_info)
+
+
+def change_users_of_doc(
+    client: GristAPIClient, doc_id: str, users_info: Dict[str, Access]
+) -> None:
+    client.call(change_users_of_doc_call(doc_id, users_info))
@@ -0,0 +1,310 @@
+import csv
+import json
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from pathlib import Path
+from typing import (
+    Any,
+    BinaryIO,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from grist_python_sdk.client import GristAPIClient
+from grist_python_sdk.json_codec import JSONCodec
+from grist_python_sdk.optional import import_optional
+
+from .attachment import DEFAULT_CHUNK_SIZE, write_chunks
+from .cells import CellCodec, split_type
+from .column import list_columns
+from .record import iter_record_batches
+from .table import list_tables_info
+from .typing import ColumnInfo, RecordInfo
+
+ExportFormat = Literal["csv", "jsonl", "parquet"]
+NativeFormat = Literal["grist", "xlsx", "csv", "tsv", "table-schema"]
+
+EXTENSIONS: Dict[str, str] = {"csv": ".csv", "jsonl": ".jsonl", "parquet": ".parquet"}
+NATIVE_PATHS: Dict[str, str] = {
+    "grist": "download",
+    "xlsx": "download/xlsx",
+    "csv": "download/csv",
+    "tsv": "download/tsv",
+    "table-schema": "download/table-schema",
+}
+TABLE_FORMATS = ("csv", "tsv", "table-schema")
+SCHEMA_NAME = "schema.json"
+
+ARROW_COLUMNS: Dict[str, Tuple[str, Tuple[type, ...]]] = {
+    "Int": ("int64", (int,)),
+    "Numeric": ("float64", (int, float)),
+    "Bool": ("bool_", (bool,)),
+    "Ref": ("int64", (int,)),
+    "Date": ("date32", (date,)),
+    "Text": ("string", (str,)),
+    "Choice": ("string", (str,)),
+}
+
+
+@dataclass
+class TableExport:
+    table_id: str
+    path: Path
+    rows: int
+    columns: List[ColumnInfo]
+
+
+@dataclass
+class ExportResult:
+    tables: List[TableExport] = field(default_factory=list)
+    failed: Dict[str, BaseException] = field(default_factory=dict)
+
+
+@contextmanager
+def atomic_path(path: Path) -> Iterator[Path]:
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}-", suffix=".tmp")
+    os.close(fd)
+    try:
+        yield Path(tmp)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+
+def cell_text(value: Any) -> Any:
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, separators=(",", ":"))
+    return value
+
+
+class TableWriter(Protocol):
+    def write(self, records: List[RecordInfo]) -> None: ...
+
+    def close(self) -> None: ...
+
+
+class CSVWriter:
+    def __init__(self, path: Path, columns: List[ColumnInfo]) -> None:
+        self.col_ids = [col["id"] for col in columns]
+        self.file = open(path, "w", newline="", encoding="utf-8")
+        self.writer = csv.writer(self.file)
+        self.writer.writerow(["id", *self.col_ids])
+
+    def write(self, records: List[RecordInfo]) -> None:
+        self.writer.writerows(
+            [record["id"], *(cell_text(record["fields"].get(c)) for c in self.col_ids)]
+            for record in records
+        )
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class JSONLinesWriter:
+    def __init__(self, path: Path, json_codec: JSONCodec) -> None:
+        self.json_codec = json_codec
+        self.file = open(path, "wb")
+
+    def write(self, records: List[RecordInfo]) -> None:
+        self.file.writelines(
+            self.json_codec.dumps({"id": record["id"], **record["fields"]}) + b"\n"
+            for record in records
+        )
+
+    def close(self) -> None:
+        self.file.close()
+
+
+def arrow_column(pa: Any, column: ColumnInfo) -> Tuple[Any, Optional[Tuple[type, ...]]]:
+    kind, arg = split_type(column.get("fields", {}).get("type"))
+    if kind == "DateTime":
+        return pa.timestamp("us", tz=arg or "UTC"), (datetime,)
+    if kind in ARROW_COLUMNS:
+        name, types = ARROW_COLUMNS[kind]
+        return getattr(pa, name)(), types
+    return pa.string(), None
+
+
+def fits(types: Optional[Tuple[type, ...]], value: Any) -> bool:
+    if types is None or value is None:
+        return True
+    if isinstance(value, bool) and bool not in types:
+        return False
+    return isinstance(value, types)
+
+
+def arrow_value(types: Optional[Tuple[type, ...]], value: Any) -> Any:
+    if types is not None or value is None or isinstance(value, str):
+        return value
+    if isinstance(value, date):
+        return value.isoformat()
+    return json.dumps(value, separators=(",", ":"), default=str)
+
+
+class ParquetWriter:
+    def __init__(self, path: Path, columns: List[ColumnInfo]) -> None:
+        self.pa = import_optional("pyarrow", "arrow")
+        self.pq = import_optional("pyarrow.parquet", "arrow")
+        self.path = path
+        self.codec = CellCodec.from_columns(columns)
+        self.specs = [[col["id"], *arrow_column(self.pa, col)] for col in columns]
+        self.schema: Any = None
+        self.writer: Any = None
+
+    def open(self, rows: List[Dict[str, Any]]) -> None:
+        for spec in self.specs:
+            if not all(fits(spec[2], row.get(spec[0])) for row in rows):
+                spec[1:] = [self.pa.string(), None]
+        self.schema = self.pa.schema(
+            [("id", self.pa.int64()), *((col_id, t) for col_id, t, _ in self.specs)]
+        )
+        self.writer = self.pq.ParquetWriter(str(self.path), self.schema)
+
+    def write(self, records: List[RecordInfo]) -> None:
+        rows = self.codec.decode_fields([record["fields"] for record in records])
+        if self.writer is None:
+            self.open(rows)
+        for col_id, type, types in self.specs:
+            misfits = [row[col_id] for row in rows if not fits(types, row.get(col_id))]
+            if misfits:
+                raise ValueError(
+                    f"value {misfits[0]!r} in column {col_id!r} does not fit {type}"
+                )
+        arrays = [self.pa.array([record["id"] for record in records], self.pa.int64())]
+        arrays += [
+            self.pa.array([arrow_value(types, row.get(col_id)) for row in rows], type)
+            for col_id, type, types in self.specs
+        ]
+        self.writer.write_table(self.pa.Table.from_arrays(arrays, schema=self.schema))
+
+    def close(self) -> None:
+        if self.writer is None:
+            self.open([])
+        self.writer.close()
+
+
+def open_writer(
+    fmt: ExportFormat, path: Path, columns: List[ColumnInfo], json_codec: JSONCodec
+) -> TableWriter:
+    if fmt == "csv":
+        return CSVWriter(path, columns)
+    if fmt == "jsonl":
+        return JSONLinesWriter(path, json_codec)
+    if fmt == "parquet":
+        return ParquetWriter(path, columns)
+    raise ValueError(f"unsupported export format {fmt!r}")
+
+
+def table_path(directory: Path, table_id: str, fmt: ExportFormat) -> Path:
+    if fmt not in EXTENSIONS:
+        raise ValueError(f"unsupported export format {fmt!r}")
+    return directory / f"{table_id}{EXTENSIONS[fmt]}"
+
+
+def export_table(
+    client: GristAPIClient,
+    doc_id: str,
+    table_id: str,
+    directory: Union[str, "os.PathLike[str]"],
+    fmt: ExportFormat = "jsonl",
+    page_size: int = 500,
+) -> TableExport:
+    path = table_path(Path(directory), table_id, fmt)
+    columns = list_columns(client, doc_id, table_id)
+    rows = 0
+    with atomic_path(path) as tmp:
+        writer = open_writer(fmt, tmp, columns, client.json_codec)
+        try:
+            for records in iter_record_batches(
+                client, doc_id, table_id, page_size=page_size
+            ):
+                writer.write(records)
+                rows += len(records)
+        finally:
+            writer.close()
+    return TableExport(table_id, path, rows, columns)
+
+
+def save_schema(root: Path, tables: List[TableExport]) -> None:
+    with atomic_path(root / SCHEMA_NAME) as tmp:
+        with open(tmp, "w") as f:
+            json.dump({table.table_id: table.columns for table in tables}, f, indent=1)
+
+
+def export_doc(
+    client: GristAPIClient,
+    doc_id: str,
+    destination: Union[str, "os.PathLike[str]"],
+    fmt: ExportFormat = "jsonl",
+    table_ids: Optional[Sequence[str]] = None,
+    max_workers: int = 4,
+    page_size: int = 500,
+) -> ExportResult:
+    root = Path(destination)
+    root.mkdir(parents=True, exist_ok=True)
+    if table_ids is None:
+        table_ids = [table["id"] for table in list_tables_info(client, doc_id)]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            table_id: executor.submit(
+                export_table, client, doc_id, table_id, root, fmt, page_size
+            )
+            for table_id in table_ids
+        }
+    result = ExportResult()
+    for table_id, future in futures.items():
+        error = future.exception()
+        if error is None:
+            result.tables.append(future.result())
+        else:
+            result.failed[table_id] = error
+    save_schema(root, result.tables)
+    return result
+
+
+def native_download_request(
+    doc_id: str,
+    fmt: NativeFormat,
+    table_id: Optional[str],
+    nohistory: Optional[bool],
+    header: Optional[str],
+) -> Tuple[str, Dict[str, Any]]:
+    if fmt not in NATIVE_PATHS:
+        raise ValueError(f"unsupported download format {fmt!r}")
+    if fmt in TABLE_FORMATS and table_id is None:
+        raise ValueError(f"{fmt} downloads require a table_id")
+    params = {"tableId": table_id, "nohistory": nohistory, "header": header}
+    return f"docs/{doc_id}/{NATIVE_PATHS[fmt]}", params
+
+
+def download_doc(
+    client: GristAPIClient,
+    doc_id: str,
+    destination: Union[str, "os.PathLike[str]", BinaryIO],
+    fmt: NativeFormat = "grist",
+    table_id: Optional[str] = None,
+    nohistory: Optional[bool] = None,
+    header: Optional[str] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    path, params = native_download_request(doc_id, fmt, table_id, nohistory, header)
+    if not isinstance(destination, (str, os.PathLike)):
+        with client.stream("get", path, params) as response:
+            return write_chunks(response.iter_content(chunk_size), destination, None)
+    with atomic_path(Path(destination)) as tmp:
+        with client.stream("get", path, params) as response, open(tmp, "wb") as f:
+            return write_chunks(response.iter_content(chunk_size), f, None)
@@ -0,0 +1,132 @@
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import (
+    Callable,
+    Collection,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+from grist_python_sdk.client import GristAPIClient
+
+from .typing import WorkspaceInfo
+from .workspace import list_workspaces_info
+
+T = TypeVar("T")
+
+DocOperation = Callable[[GristAPIClient, str], T]
+
+
+@dataclass(frozen=True)
+class DocTarget:
+    org_id: Union[int, str]
+    workspace_id: int
+    workspace_name: str
+    doc_id: str
+    doc_name: str
+
+
+@dataclass
+class DocOutcome(Generic[T]):
+    target: DocTarget
+    result: Optional[T] = None
+    error: Optional[BaseException] = None
+    started: float = 0.0
+    finished: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @property
+    def elapsed(self) -> float:
+        return self.finished - self.started
+
+
+@dataclass
+class FanOutStats:
+    docs: int
+    succeeded: int
+    failed: int
+    elapsed: float
+
+    @property
+    def docs_per_second(self) -> float:
+        return self.docs / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def doc_targets(
+    org_id: Union[int, str],
+    workspaces: Iterable[WorkspaceInfo],
+    workspace_ids: Optional[Collection[int]] = None,
+) -> List[DocTarget]:
+    return [
+        DocTarget(org_id, ws["id"], ws["name"], doc["id"], doc["name"])
+        for ws in workspaces
+        if workspace_ids is None or ws["id"] in workspace_ids
+        for doc in ws["docs"]
+    ]
+
+
+def list_doc_targets(
+    client: GristAPIClient,
+    org_id: Union[int, str],
+    workspace_ids: Optional[Collection[int]] = None,
+) -> List[DocTarget]:
+    return doc_targets(org_id, list_workspaces_info(client, org_id), workspace_ids)
+
+
+def run_operation(
+    client: GristAPIClient, target: DocTarget, operation: DocOperation[T]
+) -> DocOutcome[T]:
+    outcome: DocOutcome[T] = DocOutcome(target, started=time.perf_counter())
+    try:
+        outcome.result = operation(client, target.doc_id)
+    except Exception as e:
+        outcome.error = e
+    outcome.finished = time.perf_counter()
+    return outcome
+
+
+def run_over_docs(
+    client: GristAPIClient,
+    targets: Iterable[DocTarget],
+    operation: DocOperation[T],
+    max_workers: int = 8,
+) -> Iterator[DocOutcome[T]]:
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        futures: List[Future[DocOutcome[T]]] = [
+            executor.submit(run_operation, client, target, operation)
+            for target in targets
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def fan_out(
+    client: GristAPIClient,
+    org_id: Union[int, str],
+    operation: DocOperation[T],
+    max_workers: int = 8,
+    workspace_ids: Optional[Collection[int]] = None,
+) -> Iterator[DocOutcome[T]]:
+    targets = list_doc_targets(client, org_id, workspace_ids)
+    return run_over_docs(client, targets, operation, max_workers)
+
+
+def summarize_outcomes(outcomes: Iterable[DocOutcome[T]]) -> FanOutStats:
+    collected = list(outcomes)
+    if not collected:
+        return FanOutStats(0, 0, 0, 0.0)
+    succeeded = sum(outcome.ok for outcome in collected)
+    elapsed = max(o.finished for o in collected) - min(o.started for o in collected)
+    return FanOutStats(len(collected), succeeded, len(collected) - succeeded, elapsed)
@@ -0,0 +1,322 @@
+import csv
+import json
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from itertools import chain, islice
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+from grist_python_sdk.call import APICall
+from grist_python_sdk.client import GristAPIClient
+from grist_python_sdk.optional import import_optional
+
+from .cells import CellCodec
+from .column import add_columns, list_columns
+from .export import atomic_path
+from .record import add_records_call, put_records_call
+from .typing import ColumnInfo
+
+Row = Dict[str, Any]
+Span = Tuple[int, int]
+CHECKPOINT_VERSION = 2
+
+
+@dataclass
+class ImportResult:
+    rows: int = 0
+    batches: int = 0
+    skipped: int = 0
+    created_columns: List[str] = field(default_factory=list)
+
+
+@dataclass
+class ImportCheckpoint:
+    rows: int = 0
+    done: Set[Span] = field(default_factory=set)
+    batch_size: Optional[int] = None
+    max_batch_bytes: Optional[int] = None
+
+    def complete(self, span: Span) -> None:
+        self.done.add(span)
+        while True:
+            following = next((s for s in self.done if s[0] == self.rows), None)
+            if following is None:
+                return
+            self.done.discard(following)
+            self.rows = following[1]
+
+
+class ImportRowsError(Exception):
+    def __init__(self, result: ImportResult, checkpoint: ImportCheckpoint) -> None:
+        super().__init__(
+            f"import failed after {result.rows} rows; resume from row {checkpoint.rows}"
+        )
+        self.result = result
+        self.checkpoint = checkpoint
+
+
+def load_checkpoint(
+    path: Path, batch_size: int, max_batch_bytes: Optional[int]
+) -> ImportCheckpoint:
+    if not path.exists():
+        return ImportCheckpoint(batch_size=batch_size, max_batch_bytes=max_batch_bytes)
+    with open(path, "rb") as f:
+        data = json.load(f)
+    if data.get("version") != CHECKPOINT_VERSION:
+        raise ValueError(f"unsupported checkpoint version {data.get('version')}")
+    if (data["batch_size"], data["max_batch_bytes"]) != (batch_size, max_batch_bytes):
+        raise ValueError(
+            f"checkpoint {path} was written with batch_size={data['batch_size']} "
+            f"and max_batch_bytes={data['max_batch_bytes']}; resume with the same "
+            "settings"
+        )
+    return ImportCheckpoint(
+        data["rows"],
+        {(start, stop) for start, stop in data["done"]},
+        batch_size,
+        max_batch_bytes,
+    )
+
+
+def save_checkpoint(path: Path, checkpoint: ImportCheckpoint) -> None:
+    with atomic_path(path) as tmp:
+        with open(tmp, "w") as f:
+            json.dump(
+                {
+                    "version": CHECKPOINT_VERSION,
+                    "rows": checkpoint.rows,
+                    "done": sorted(checkpoint.done),
+                    "batch_size": checkpoint.batch_size,
+                    "max_batch_bytes": checkpoint.max_batch_bytes,
+                },
+                f,
+            )
+
+
+def iter_csv_rows(
+    path: Union[str, "os.PathLike[str]"],
+    delimiter: str = ",",
+    encoding: str = "utf-8-sig",
+) -> Iterator[Row]:
+    with open(path, newline="", encoding=encoding) as f:
+        yield from csv.DictReader(f, delimiter=delimiter)
+
+
+def iter_parquet_rows(
+    path: Union[str, "os.PathLike[str]"],
+    batch_size: int = 1024,
+    columns: Optional[Sequence[str]] = None,
+) -> Iterator[Row]:
+    pq = import_optional("pyarrow.parquet", "arrow")
+    parquet = pq.ParquetFile(path)
+    try:
+        for batch in parquet.iter_batches(batch_size, columns=columns):
+            yield from batch.to_pylist()
+    finally:
+        parquet.close()
+
+
+def iter_row_batches(
+    rows: Iterable[Row], batch_size: int, max_batch_bytes: Optional[int] = None
+) -> Iterator[List[Row]]:
+    batch: List[Row] = []
+    batch_bytes = 0
+    for row in rows:
+        row_bytes = 0
+        if max_batch_bytes is not None:
+            row_bytes = len(json.dumps(row, separators=(",", ":"), default=str)) + 1
+        if batch and (
+            len(batch) >= batch_size
+            or (
+                max_batch_bytes is not None
+                and batch_bytes + row_bytes > max_batch_bytes
+            )
+        ):
+            yield batch
+            batch = []
+            batch_bytes = 0
+        batch.append(row)
+        batch_bytes += row_bytes
+    if batch:
+        yield batch
+
+
+def text_type(value: str) -> str:
+    for parse, col_type in ((int, "Int"), (float, "Numeric")):
+        try:
+            parse(value)
+            return col_type
+        except ValueError:
+            pass
+    return "Text"
+
+
+def value_type(value: Any) -> str:
+    if isinstance(value, bool):
+        return "Bool"
+    if isinstance(value, int):
+        return "Int"
+    if isinstance(value, float):
+        return "Numeric"
+    if isinstance(value, datetime):
+        return "DateTime:UTC"
+    if isinstance(value, date):
+        return "Date"
+    if isinstance(value, str):
+        return text_type(value)
+    if isinstance(value, (list, tuple)):
+        return "ChoiceList"
+    return "Any"
+
+
+def infer_column_type(values: Iterable[Any]) -> str:
+    types = {value_type(value) for value in values if value is not None and value != ""}
+    if len(types) == 1:
+        return types.pop()
+    if types == {"Int", "Numeric"}:
+        return "Numeric"
+    if types and types <= {"Int", "Numeric", "Text"}:
+        return "Text"
+    return "Any"
+
+
+def ensure_columns(
+    client: GristAPIClient,
+    doc_id: str,
+    table_id: str,
+    batch: List[Row],
+    known: Set[str],
+) -> List[str]:
+    missing = [
+        col_id
+        for col_id in dict.fromkeys(chain.from_iterable(batch))
+        if col_id not in known and col_id != "id"
+    ]
+    if not missing:
+        return []
+    columns: List[ColumnInfo] = [
+        {
+            "id": col_id,
+            "fields": {"type": infer_column_type(row.get(col_id) for row in batch)},
+        }
+        for col_id in missing
+    ]
+    created = add_columns(client, doc_id, table_id, columns)
+    known.update(missing)
+    return created
+
+
+def import_batch_call(
+    doc_id: str,
+    table_id: str,
+    batch: List[Row],
+    key_columns: Optional[Sequence[str]],
+    noparse: Optional[bool],
+    codec: Optional[CellCodec],
+) -> APICall[Any]:
+    if not key_columns:
+        return add_records_call(doc_id, table_id, batch, noparse, codec)
+    return put_records_call(
+        doc_id,
+        table_id,
+        [{col_id: row[col_id] for col_id in key_columns} for row in batch],
+        [
+            {
+                col_id: value
+                for col_id, value in row.items()
+                if col_id not in key_columns
+            }
+            for row in batch
+        ],
+        noparse,
+        codec=codec,
+    )
+
+
+def import_rows(
+    client: GristAPIClient,
+    doc_id: str,
+    table_id: str,
+    rows: Iterable[Row],
+    batch_size: int = 500,
+    max_batch_bytes: Optional[int] = None,
+    max_in_flight: int = 4,
+    key_columns: Optional[Sequence[str]] = None,
+    create_columns: bool = False,
+    checkpoint: Optional[Union[str, "os.PathLike[str]"]] = None,
+    noparse: Optional[bool] = None,
+    codec: Optional[CellCodec] = None,
+) -> ImportResult:
+    checkpoint_path = Path(checkpoint) if checkpoint is not None else None
+    state = (
+        load_checkpoint(checkpoint_path, batch_size, max_batch_bytes)
+        if checkpoint_path
+        else ImportCheckpoint()
+    )
+    result = ImportResult()
+    known: Optional[Set[str]] = None
+    if create_columns:
+        known = {col["id"] for col in list_columns(client, doc_id, table_id, True)}
+
+    source = iter(rows)
+    for _ in islice(source, state.rows):
+        result.skipped += 1
+    start = result.skipped
+    in_flight: Dict[Future[Any], Tuple[Span, int]] = {}
+    error: Optional[BaseException] = None
+
+    def settle(futures: Iterable[Future[Any]]) -> None:
+        nonlocal error
+        settled = list(futures)
+        if not settled:
+            return
+        for future in settled:
+            span, count = in_flight.pop(future)
+            if future.exception() is not None:
+                error = error or future.exception()
+                continue
+            state.complete(span)
+            result.rows += count
+            result.batches += 1
+        if checkpoint_path is not None:
+            save_checkpoint(checkpoint_path, state)
+
+    with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+        for batch in iter_row_batches(source, batch_size, max_batch_bytes):
+            span = (start, start + len(batch))
+            start = span[1]
+            if span in state.done:
+                result.skipped += len(batch)
+                continue
+            settle([future for future in in_flight if future.done()])
+            if len(in_flight) >= max_in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                settle(done)
+            if error is not None:
+                break
+            if known is not None:
+                result.created_columns += ensure_columns(
+                    client, doc_id, table_id, batch, known
+                )
+            call = import_batch_call(
+                doc_id, table_id, batch, key_columns, noparse, codec
+            )
+            in_flight[executor.submit(client.call, call)] = (span, len(batch))
+        settle(wait(in_flight).done)
+
+    if error is not None:
+        raise ImportRowsError(result, state) from error
+    return result
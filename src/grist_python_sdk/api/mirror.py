@@ -0,0 +1,168 @@
+import hashlib
+import json
+import os
+import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Sequence, Set, Tuple, Union
+
+from grist_python_sdk.client import GristAPIClient
+
+from .attachment import (
+    DEFAULT_CHUNK_SIZE,
+    download_attachment,
+    hash_file,
+    list_attachments_metadata,
+)
+from .typing import AttachmentMetadataInfo, AttachmentMirrorEntry
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+Manifest = Dict[str, Dict[str, AttachmentMirrorEntry]]
+AttachmentKey = Tuple[str, int]
+FetchFuture = Future[Tuple[AttachmentMirrorEntry, str]]
+
+
+@dataclass
+class MirrorResult:
+    downloaded: List[AttachmentKey] = field(default_factory=list)
+    skipped: List[AttachmentKey] = field(default_factory=list)
+    deduplicated: List[AttachmentKey] = field(default_factory=list)
+    failed: Dict[AttachmentKey, BaseException] = field(default_factory=dict)
+
+
+def object_path(root: Path, sha256: str) -> Path:
+    return root / "objects" / sha256[:2] / sha256
+
+
+def load_manifest(root: Path) -> Manifest:
+    path = root / MANIFEST_NAME
+    if not path.exists():
+        return {}
+    with open(path, "rb") as f:
+        data = json.load(f)
+    if data.get("version") != MANIFEST_VERSION:
+        raise ValueError(f"unsupported mirror manifest version {data.get('version')}")
+    docs: Manifest = data["docs"]
+    return docs
+
+
+def save_manifest(root: Path, manifest: Manifest) -> None:
+    fd, tmp = tempfile.mkstemp(dir=root, prefix=".manifest-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump({"version": MANIFEST_VERSION, "docs": manifest}, f, indent=1)
+        os.replace(tmp, root / MANIFEST_NAME)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def is_mirrored(
+    root: Path,
+    entry: AttachmentMirrorEntry,
+    attachment: AttachmentMetadataInfo,
+    verify: bool,
+) -> bool:
+    fields = attachment["fields"]
+    if (
+        entry["fileSize"] != fields["fileSize"]
+        or entry["timeUploaded"] != fields["timeUploaded"]
+    ):
+        return False
+    path = object_path(root, entry["sha256"])
+    if not path.exists() or path.stat().st_size != entry["fileSize"]:
+        return False
+    if verify:
+        hasher = hashlib.sha256()
+        hash_file(path, hasher)
+        return hasher.hexdigest() == entry["sha256"]
+    return True
+
+
+def fetch_attachment(
+    client: GristAPIClient,
+    root: Path,
+    doc_id: str,
+    attachment: AttachmentMetadataInfo,
+    chunk_size: int,
+) -> Tuple[AttachmentMirrorEntry, str]:
+    fd, tmp = tempfile.mkstemp(dir=root / "tmp")
+    os.close(fd)
+    try:
+        result = download_attachment(
+            client, doc_id, attachment["id"], tmp, chunk_size, checksum="sha256"
+        )
+        fields = attachment["fields"]
+        if result.size != fields["fileSize"]:
+            raise ValueError(
+                f"attachment {attachment['id']} in {doc_id}: expected "
+                f"{fields['fileSize']} bytes, got {result.size}"
+            )
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    assert result.checksum is not None
+    entry: AttachmentMirrorEntry = {**fields, "sha256": result.checksum}
+    return entry, tmp
+
+
+def store_object(root: Path, sha256: str, tmp: str, stored: Set[str]) -> bool:
+    path = object_path(root, sha256)
+    if sha256 in stored:
+        os.unlink(tmp)
+        return True
+    deduplicated = path.exists()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    os.replace(tmp, path)
+    stored.add(sha256)
+    return deduplicated
+
+
+def mirror_attachments(
+    client: GristAPIClient,
+    doc_ids: Sequence[str],
+    destination: Union[str, "os.PathLike[str]"],
+    max_workers: int = 4,
+    verify: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> MirrorResult:
+    root = Path(destination)
+    (root / "tmp").mkdir(parents=True, exist_ok=True)
+    manifest = load_manifest(root)
+    result = MirrorResult()
+    stored: Set[str] = set()
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures: Dict[AttachmentKey, FetchFuture] = {}
+            for doc_id in doc_ids:
+                entries = manifest.setdefault(doc_id, {})
+                for attachment in list_attachments_metadata(client, doc_id):
+                    key = (doc_id, attachment["id"])
+                    entry = entries.get(str(attachment["id"]))
+                    if entry is not None and is_mirrored(
+                        root, entry, attachment, verify
+                    ):
+                        result.skipped.append(key)
+                        continue
+                    futures[key] = executor.submit(
+                        fetch_attachment, client, root, doc_id, attachment, chunk_size
+                    )
+            for (doc_id, attachment_id), future in futures.items():
+                key = (doc_id, attachment_id)
+                try:
+                    entry, tmp = future.result()
+                except Exception as e:
+                    result.failed[key] = e
+                    continue
+                deduplicated = store_object(root, entry["sha256"], tmp, stored)
+                manifest[doc_id][str(attachment_id)] = entry
+                if deduplicated:
+                    result.deduplicated.append(key)
+                else:
+                    result.downloaded.append(key)
+    finally:
+        save_manifest(root, manifest)
+    return result
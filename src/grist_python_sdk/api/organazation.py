@@ -1,51 +1,80 @@
 from typing import Any, Dict, List
 
+from grist_python_sdk.call import APICall, ignore_response
 from grist_python_sdk.client import GristAPIClient
 
 from .typing import Access, OrganizationInfo, UserInfo
-from .utils import parse_organization_info
+from .utils import TimestampMode, parse_organization_info, parse_users
 
 
-def list_organizations_info(client: GristAPIClient) -> List[OrganizationInfo]:
-    orgs_parsed: List[Dict[str, Any]] = client.request(
-        method="get", path="orgs", params={}
+def parse_organizations_info(
+    response: List[Dict[str, Any]], timestamps: TimestampMode = "eager"
+) -> List[OrganizationInfo]:
+    return [parse_organization_info(org_parsed, timestamps) for org_parsed in response]
+
+
+def list_organizations_info_call(
+    timestamps: TimestampMode = "eager",
+) -> APICall[List[OrganizationInfo]]:
+    return APICall(
+        "get",
+        "orgs",
+        lambda response: parse_organizations_info(response, timestamps),
+        params={},
+        cacheable=True,
+    )
+
+
+def list_organizations_info(
+    client: GristAPIClient, timestamps: TimestampMode = "eager"
+) -> List[OrganizationInfo]:
+    return client.call(list_organizations_info_call(timestamps))
+
+
+def describe_organization_call(
+    org_id: int | str, timestamps: TimestampMode = "eager"
+) -> APICall[OrganizationInfo]:
+    return APICall(
+        "get",
+        f"orgs/{org_id}",
+        lambda response: parse_organization_info(response, timestamps),
+        cacheable=True,
     )
-    orgs: List[OrganizationInfo] = []
-    for org_parsed in orgs_parsed:
-        orgs.append(parse_organization_info(org_parsed))
-    return orgs
 
 
 def describe_organization(
-    client: GristAPIClient, org_id: int | str
+    client: GristAPIClient, org_id: int | str, timestamps: TimestampMode = "eager"
 ) -> OrganizationInfo:
-    org_parsed: Dict[str, Any] = client.request(
-        method="get",
-        path=f"orgs/{org_id}",
-    )
-    return parse_organization_info(org_parsed)
+    return client.call(describe_organization_call(org_id, timestamps))
 
 
-def rename_organization(client: GristAPIClient, org_id: int | str, name: str) -> None:
+def rename_organization_call(org_id: int | str, name: str) -> APICall[None]:
     changes = {"name": name}
-    client.request(method="patch", path=f"orgs/{org_id}", json=changes)
+    return APICall("patch", f"orgs/{org_id}", ignore_response, json=changes)
+
+
+def rename_organization(client: GristAPIClient, org_id: int | str, name: str) -> None:
+    client.call(rename_organization_call(org_id, name))
+
+
+def list_users_of_organization_call(org_id: int | str) -> APICall[List[UserInfo]]:
+    return APICall("get", f"orgs/{org_id}/access", parse_users, cacheable=True)
 
 
 def list_users_of_organization(
     client: GristAPIClient, org_id: int | str
 ) -> List[UserInfo]:
-    users: List[UserInfo] = client.request(
-        method="get",
-        path=f"orgs/{org_id}/access",
-    )["users"]
-    return users
+    return client.call(list_users_of_organization_call(org_id))
+
+
+def change_users_of_organization_call(
+    org_id: int | str, users_info: List[Dict[str, Access]]
+) -> APICall[List[UserInfo]]:
+    delta_info: Dict[str, Any] = {"delta": {"users": users_info}}
+    return APICall("patch", f"orgs/{org_id}/access", parse_users, json=delta_info)
 
 
 def change_users_of_organization(
     client: GristAPIClient, org_id: int | str, users_info: List[Dict[str, Access]]
 ) -> List[UserInfo]:
-    delta_info: Dict[str, Any] = {"delta": {"users": users_info}}
-    users: List[UserInfo] = client.request(
-        method="patch", path=f"orgs/{org_id}/access", json=delta_info
-    )["users"]
-    return users
+    return client.call(change_users_of_organization_call(org_id, users_info))
@@ -0,0 +1,245 @@
+import json
+import operator
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from grist_python_sdk.call import APICall
+from grist_python_sdk.client import GristAPIClient
+
+from .record import fetch_records, fetch_records_call, parse_sql_record_ids
+from .sql import sql_call
+from .typing import RecordInfo
+from .utils import quote_identifier
+
+COMPARISONS = {"eq": "=", "ne": "!=", "lt": "<", "le": "<=", "gt": ">", "ge": ">="}
+COMPARE: Dict[str, Callable[[Any, Any], Any]] = {
+    "ne": operator.ne,
+    "lt": operator.lt,
+    "le": operator.le,
+    "gt": operator.gt,
+    "ge": operator.ge,
+}
+ID_PAGE_SIZE = 500
+
+ColumnSQL = Callable[[str], Tuple[str, List[Any]]]
+
+
+@dataclass(frozen=True)
+class Condition:
+    op: str
+    column: Optional[str] = None
+    values: Tuple[Any, ...] = ()
+    children: Tuple["Condition", ...] = ()
+
+    def __and__(self, other: "Condition") -> "Condition":
+        return Condition("and", children=(self, other))
+
+    def __or__(self, other: "Condition") -> "Condition":
+        return Condition("or", children=(self, other))
+
+    def __invert__(self) -> "Condition":
+        return Condition("not", children=(self,))
+
+
+@dataclass(frozen=True)
+class SortKey:
+    column: str
+    descending: bool = False
+
+
+SortSpec = Union[str, SortKey]
+
+
+class Col:
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def isin(self, values: Iterable[Any]) -> Condition:
+        return Condition("in", self.name, tuple(values))
+
+    def eq(self, value: Any) -> Condition:
+        return Condition("in", self.name, (value,))
+
+    def ne(self, value: Any) -> Condition:
+        return Condition("ne", self.name, (value,))
+
+    def lt(self, value: Any) -> Condition:
+        return Condition("lt", self.name, (value,))
+
+    def le(self, value: Any) -> Condition:
+        return Condition("le", self.name, (value,))
+
+    def gt(self, value: Any) -> Condition:
+        return Condition("gt", self.name, (value,))
+
+    def ge(self, value: Any) -> Condition:
+        return Condition("ge", self.name, (value,))
+
+    def between(self, low: Any, high: Any) -> Condition:
+        return self.ge(low) & self.le(high)
+
+    def contains(self, text: str) -> Condition:
+        return Condition("contains", self.name, (text,))
+
+    def is_null(self) -> Condition:
+        return Condition("null", self.name)
+
+    def asc(self) -> SortKey:
+        return SortKey(self.name)
+
+    def desc(self) -> SortKey:
+        return SortKey(self.name, descending=True)
+
+
+def conjuncts(condition: Condition) -> List[Condition]:
+    if condition.op == "and":
+        return [leaf for child in condition.children for leaf in conjuncts(child)]
+    return [condition]
+
+
+def compile_filter(condition: Condition) -> Optional[str]:
+    filters: Dict[str, List[Any]] = {}
+    for leaf in conjuncts(condition):
+        if leaf.op != "in" or leaf.column is None:
+            return None
+        values = list(leaf.values)
+        if leaf.column in filters:
+            values = [value for value in filters[leaf.column] if value in values]
+        filters[leaf.column] = values
+    return json.dumps(filters, separators=(",", ":"))
+
+
+def sort_key(spec: SortSpec) -> SortKey:
+    if isinstance(spec, SortKey):
+        return spec
+    if spec.startswith("-"):
+        return SortKey(spec[1:], descending=True)
+    return SortKey(spec)
+
+
+def compile_sort(order_by: Sequence[SortSpec]) -> str:
+    return ",".join(
+        f"-{key.column}" if key.descending else key.column
+        for key in map(sort_key, order_by)
+    )
+
+
+def identifier_column(name: str) -> Tuple[str, List[Any]]:
+    return quote_identifier(name), []
+
+
+def compile_sql(
+    condition: Condition, column_sql: ColumnSQL = identifier_column
+) -> Tuple[str, List[Any]]:
+    if condition.op in ("and", "or"):
+        parts = [compile_sql(child, column_sql) for child in condition.children]
+        joiner = f" {condition.op.upper()} "
+        sql = joiner.join(f"({part})" for part, _ in parts)
+        return sql, [arg for _, args in parts for arg in args]
+    if condition.op == "not":
+        sql, args = compile_sql(condition.children[0], column_sql)
+        return f"NOT coalesce({sql}, 0)", args
+    assert condition.column is not None
+    column, column_args = column_sql(condition.column)
+    if condition.op == "in":
+        values = [value for value in condition.values if value is not None]
+        tests: List[str] = []
+        params: List[Any] = []
+        if len(values) < len(condition.values):
+            tests.append(f"{column} IS NULL")
+            params += column_args
+        if values:
+            tests.append(f"{column} IN ({', '.join('?' * len(values))})")
+            params += column_args + values
+        return " OR ".join(tests) or "0", params
+    if condition.op == "null":
+        return f"{column} IS NULL", column_args
+    if condition.op == "contains":
+        return (
+            f"typeof({column}) = 'text' AND instr({column}, ?) > 0",
+            column_args + column_args + [condition.values[0]],
+        )
+    if condition.op == "ne" and condition.values[0] is None:
+        return f"{column} IS NOT NULL", column_args
+    comparison = f"{column} {COMPARISONS[condition.op]} ?"
+    return comparison, column_args + list(condition.values)
+
+
+def matches(condition: Condition, row: Dict[str, Any]) -> bool:
+    if condition.op == "and":
+        return all(matches(child, row) for child in condition.children)
+    if condition.op == "or":
+        return any(matches(child, row) for child in condition.children)
+    if condition.op == "not":
+        return not matches(condition.children[0], row)
+    assert condition.column is not None
+    value = row.get(condition.column)
+    if condition.op == "in":
+        return value in condition.values
+    if condition.op == "null":
+        return value is None
+    if value is None:
+        return False
+    if condition.op == "contains":
+        return isinstance(value, str) and condition.values[0] in value
+    return bool(COMPARE[condition.op](value, condition.values[0]))
+
+
+def select_ids_call(
+    doc_id: str,
+    table_id: str,
+    where: Condition,
+    order_by: Sequence[SortSpec] = (),
+    limit: Optional[int] = None,
+) -> APICall[List[int]]:
+    where_sql, args = compile_sql(where)
+    sql = f"SELECT id FROM {quote_identifier(table_id)} WHERE {where_sql}"
+    keys = [sort_key(spec) for spec in order_by]
+    if keys:
+        sql += " ORDER BY " + ", ".join(
+            f"{quote_identifier(key.column)} {'DESC' if key.descending else 'ASC'}"
+            for key in keys
+        )
+    if limit:
+        sql += " LIMIT ?"
+        args.append(limit)
+    return sql_call(doc_id, sql, args, None, parse_sql_record_ids)
+
+
+def id_pages(ids: List[int]) -> List[str]:
+    return [
+        json.dumps({"id": ids[start : start + ID_PAGE_SIZE]}, separators=(",", ":"))
+        for start in range(0, len(ids), ID_PAGE_SIZE)
+    ]
+
+
+def order_by_ids(records: List[RecordInfo], ids: List[int]) -> List[RecordInfo]:
+    by_id = {record["id"]: record for record in records}
+    return [by_id[id] for id in ids if id in by_id]
+
+
+def select_records(
+    client: GristAPIClient,
+    doc_id: str,
+    table_id: str,
+    where: Optional[Condition] = None,
+    order_by: Sequence[SortSpec] = (),
+    limit: Optional[int] = None,
+    hidden: Optional[bool] = None,
+) -> List[RecordInfo]:
+    sortstring = compile_sort(order_by) or None
+    filterstring = compile_filter(where) if where is not None else None
+    if where is None or filterstring is not None:
+        return fetch_records(
+            client, doc_id, table_id, filterstring, sortstring, limit, hidden
+        )
+
+    ids = client.call(select_ids_call(doc_id, table_id, where, order_by, limit))
+    records = [
+        record
+        for page in id_pages(ids)
+        for record in client.call(
+            fetch_records_call(doc_id, table_id, page, hidden=hidden)
+        )
+    ]
+    return order_by_ids(records, ids)
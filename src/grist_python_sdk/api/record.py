@@ -1,8 +1,51 @@
-from typing import Any, Dict, List, Optional
+import json
+from typing import Any, Dict, Iterator, List, Optional
 
+from grist_python_sdk.call import APICall, ignore_response
 from grist_python_sdk.client import GristAPIClient
 
-from .typing import RecordInfo
+from .cells import CellCodec
+from .chunking import run_chunked
+from .sql import parse_sql_rows, sql_call
+from .typing import ColumnarData, RecordInfo
+from .utils import quote_identifier
+
+
+def parse_records(response: Dict[str, Any]) -> List[RecordInfo]:
+    return [
+        {"id": int(record_parsed["id"]), "fields": record_parsed["fields"]}
+        for record_parsed in response["records"]
+    ]
+
+
+def parse_record_ids(response: Dict[str, Any]) -> List[int]:
+    return [int(record["id"]) for record in response["records"]]
+
+
+def fetch_records_call(
+    doc_id: str,
+    table_id: str,
+    filterstring: Optional[str] = None,
+    sortstring: Optional[str] = None,
+    limitnumber: Optional[int] = None,
+    hidden: Optional[bool] = None,
+    codec: Optional[CellCodec] = None,
+) -> APICall[List[RecordInfo]]:
+    path = f"docs/{doc_id}/tables/{table_id}/records"
+    params = {
+        "filter": filterstring,
+        "sort": sortstring,
+        "limit": limitnumber,
+        "hidden": hidden,
+    }
+    if codec is None:
+        return APICall("get", path, parse_records, params=params)
+    return APICall(
+        "get",
+        path,
+        lambda response: codec.decode_records(parse_records(response)),
+        params=params,
+    )
 
 
 def fetch_records(
@@ -13,58 +56,221 @@ def fetch_records(
     sortstring: Optional[str] = None,
     limitnumber: Optional[int] = None,
     hidden: Optional[bool] = None,
+    codec: Optional[CellCodec] = None,
 ) -> List[RecordInfo]:
-    path = f"docs/{doc_id}/tables/{table_id}/records"
+    return client.call(
+        fetch_records_call(
+            doc_id, table_id, filterstring, sortstring, limitnumber, hidden, codec
+        )
+    )
+
+
+def parse_columnar_data(response: ColumnarData) -> ColumnarData:
+    return response
+
+
+def fetch_columns_call(
+    doc_id: str,
+    table_id: str,
+    filterstring: Optional[str] = None,
+    sortstring: Optional[str] = None,
+    limitnumber: Optional[int] = None,
+    hidden: Optional[bool] = None,
+    codec: Optional[CellCodec] = None,
+) -> APICall[ColumnarData]:
+    path = f"docs/{doc_id}/tables/{table_id}/data"
     params = {
-        "filterstring": filterstring,
-        "sortstring": sortstring,
-        "limitnumber": limitnumber,
+        "filter": filterstring,
+        "sort": sortstring,
+        "limit": limitnumber,
         "hidden": hidden,
     }
-    records_parsed = client.request(method="get", path=path, params=params)["records"]
-    records: List[RecordInfo] = [
-        {"id": int(record_parsed["id"]), "fields": record_parsed["fields"]}
-        for record_parsed in records_parsed
-    ]
-    return records
+    if codec is None:
+        return APICall("get", path, parse_columnar_data, params=params)
+    return APICall("get", path, codec.decode_columns, params=params)
 
 
-def add_records(
+def fetch_columns(
+    client: GristAPIClient,
+    doc_id: str,
+    table_id: str,
+    filterstring: Optional[str] = None,
+    sortstring: Optional[str] = None,
+    limitnumber: Optional[int] = None,
+    hidden: Optional[bool] = None,
+    codec: Optional[CellCodec] = None,
+) -> ColumnarData:
+    return client.call(
+        fetch_columns_call(
+            doc_id, table_id, filterstring, sortstring, limitnumber, hidden, codec
+        )
+    )
+
+
+def parse_sql_record_ids(response: Dict[str, Any]) -> List[int]:
+    return [int(row["id"]) for row in parse_sql_rows(response)]
+
+
+def list_record_ids_call(
+    doc_id: str, table_id: str, after_id: int = 0, limit: int = 500
+) -> APICall[List[int]]:
+    sql = (
+        f"SELECT id FROM {quote_identifier(table_id)} WHERE id > ? ORDER BY id LIMIT ?"
+    )
+    return sql_call(doc_id, sql, [after_id, limit], None, parse_sql_record_ids)
+
+
+def page_filterstring(filterstring: Optional[str], ids: List[int]) -> Optional[str]:
+    filters: Dict[str, List[Any]] = json.loads(filterstring) if filterstring else {}
+    if "id" in filters:
+        wanted = set(filters["id"])
+        ids = [id for id in ids if id in wanted]
+    if not ids:
+        return None
+    filters["id"] = ids
+    return json.dumps(filters, separators=(",", ":"))
+
+
+def iter_record_batches(
+    client: GristAPIClient,
+    doc_id: str,
+    table_id: str,
+    filterstring: Optional[str] = None,
+    hidden: Optional[bool] = None,
+    page_size: int = 500,
+    codec: Optional[CellCodec] = None,
+) -> Iterator[List[RecordInfo]]:
+    after_id = 0
+    while True:
+        ids = client.call(list_record_ids_call(doc_id, table_id, after_id, page_size))
+        if not ids:
+            return
+        page_filter = page_filterstring(filterstring, ids)
+        if page_filter is not None:
+            records = client.call(
+                fetch_records_call(
+                    doc_id,
+                    table_id,
+                    page_filter,
+                    sortstring="id",
+                    hidden=hidden,
+                    codec=codec,
+                )
+            )
+            if records:
+                yield records
+        if len(ids) < page_size:
+            return
+        after_id = ids[-1]
+
+
+def iter_records(
     client: GristAPIClient,
+    doc_id: str,
+    table_id: str,
+    filterstring: Optional[str] = None,
+    hidden: Optional[bool] = None,
+    page_size: int = 500,
+    codec: Optional[CellCodec] = None,
+) -> Iterator[RecordInfo]:
+    for records in iter_record_batches(
+        client, doc_id, table_id, filterstring, hidden, page_size, codec
+    ):
+        yield from records
+
+
+def add_records_call(
     doc_id: str,
     table_id: str,
     record_fields: List[Dict[str, Any]],
     noparse: Optional[bool] = None,
-) -> List[int]:
+    codec: Optional[CellCodec] = None,
+) -> APICall[List[int]]:
     path = f"docs/{doc_id}/tables/{table_id}/records"
     params = {"noparse": noparse} if noparse is not None else None
+    if codec is not None:
+        record_fields = codec.encode_fields(record_fields)
     payload = {"records": [{"fields": record_field} for record_field in record_fields]}
-    response = client.request(method="post", path=path, params=params, json=payload)
-    return [int(record["id"]) for record in response["records"]]
+    return APICall("post", path, parse_record_ids, params=params, json=payload)
 
 
-def patch_records(
+def add_records(
     client: GristAPIClient,
     doc_id: str,
     table_id: str,
-    record_fields_dict: Dict[str, Dict[str, Any]],
+    record_fields: List[Dict[str, Any]],
     noparse: Optional[bool] = None,
-) -> None:
+    chunk_size: Optional[int] = None,
+    max_chunk_bytes: Optional[int] = None,
+    max_workers: int = 1,
+    codec: Optional[CellCodec] = None,
+) -> List[int]:
+    if codec is not None:
+        record_fields = codec.encode_fields(record_fields)
+    results = run_chunked(
+        client,
+        record_fields,
+        lambda chunk: add_records_call(doc_id, table_id, list(chunk), noparse),
+        chunk_size,
+        max_chunk_bytes,
+        max_workers,
+    )
+    return [id for ids in results for id in ids]
+
+
+def encode_fields_by_id(
+    codec: CellCodec, record_fields_dict: Dict[int, Dict[str, Any]]
+) -> Dict[int, Dict[str, Any]]:
+    encoded = codec.encode_fields(list(record_fields_dict.values()))
+    return dict(zip(record_fields_dict, encoded))
+
+
+def patch_records_call(
+    doc_id: str,
+    table_id: str,
+    record_fields_dict: Dict[int, Dict[str, Any]],
+    noparse: Optional[bool] = None,
+    codec: Optional[CellCodec] = None,
+) -> APICall[None]:
     path = f"docs/{doc_id}/tables/{table_id}/records"
     params = {"noparse": noparse} if noparse is not None else None
+    if codec is not None:
+        record_fields_dict = encode_fields_by_id(codec, record_fields_dict)
     payload = {
         "records": [
             {"id": id, "fields": record_field}
             for id, record_field in record_fields_dict.items()
         ]
     }
-    client.request(
-        method="patch", path=path, params=params, json=payload, return_type="text"
+    return APICall(
+        "patch", path, ignore_response, params=params, json=payload, return_type="text"
     )
 
 
-def put_records(
+def patch_records(
     client: GristAPIClient,
+    doc_id: str,
+    table_id: str,
+    record_fields_dict: Dict[int, Dict[str, Any]],
+    noparse: Optional[bool] = None,
+    chunk_size: Optional[int] = None,
+    max_chunk_bytes: Optional[int] = None,
+    max_workers: int = 1,
+    codec: Optional[CellCodec] = None,
+) -> None:
+    if codec is not None:
+        record_fields_dict = encode_fields_by_id(codec, record_fields_dict)
+    run_chunked(
+        client,
+        list(record_fields_dict.items()),
+        lambda chunk: patch_records_call(doc_id, table_id, dict(chunk), noparse),
+        chunk_size,
+        max_chunk_bytes,
+        max_workers,
+    )
+
+
+def put_records_call(
     doc_id: str,
     table_id: str,
     require_fields: List[Dict[str, Any]],
@@ -74,8 +280,12 @@ def put_records(
     noadd: Optional[bool] = None,
     noupdate: Optional[bool] = None,
     allow_empty_require: Optional[bool] = None,
-) -> None:
+    codec: Optional[CellCodec] = None,
+) -> APICall[None]:
     path = f"docs/{doc_id}/tables/{table_id}/records"
+    if codec is not None:
+        require_fields = codec.encode_fields(require_fields)
+        record_fields = codec.encode_fields(record_fields)
     params = {
         "noparse": noparse,
         "onmany": onmany,
@@ -89,6 +299,69 @@ def put_records(
             for require_field, record_field in zip(require_fields, record_fields)
         ]
     }
-    client.request(
-        method="put", path=path, params=params, json=payload, return_type="text"
+    return APICall(
+        "put", path, ignore_response, params=params, json=payload, return_type="text"
+    )
+
+
+def put_records(
+    client: GristAPIClient,
+    doc_id: str,
+    table_id: str,
+    require_fields: List[Dict[str, Any]],
+    record_fields: List[Dict[str, Any]],
+    noparse: Optional[bool] = None,
+    onmany: Optional[str] = None,
+    noadd: Optional[bool] = None,
+    noupdate: Optional[bool] = None,
+    allow_empty_require: Optional[bool] = None,
+    chunk_size: Optional[int] = None,
+    max_chunk_bytes: Optional[int] = None,
+    max_workers: int = 1,
+    codec: Optional[CellCodec] = None,
+) -> None:
+    if codec is not None:
+        require_fields = codec.encode_fields(require_fields)
+        record_fields = codec.encode_fields(record_fields)
+    run_chunked(
+        client,
+        list(zip(require_fields, record_fields)),
+        lambda chunk: put_records_call(
+            doc_id,
+            table_id,
+            [require_field for require_field, _ in chunk],
+            [record_field for _, record_field in chunk],
+            noparse,
+            onmany,
+            noadd,
+            noupdate,
+            allow_empty_require,
+        ),
+        chunk_size,
+        max_chunk_bytes,
+        max_workers,
+    )
+
+
+def delete_records_call(
+    doc_id: str, table_id: str, record_ids: List[int]
+) -> APICall[None]:
+    path = f"docs/{doc_id}/tables/{table_id}/data/delete"
+    return APICall("post", path, ignore_response, json=record_ids, return_type="text")
+
+
+def delete_records(
+    client: GristAPIClient,
+    doc_id: str,
+    table_id: str,
+    record_ids: List[int],
+    chunk_size: Optional[int] = None,
+    max_workers: int = 1,
+) -> None:
+    run_chunked(
+        client,
+        record_ids,
+        lambda chunk: delete_records_call(doc_id, table_id, list(chunk)),
+        chunk_size,
+        max_workers=max_workers,
     )
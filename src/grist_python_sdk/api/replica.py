@@ -0,0 +1,316 @@
+import json
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Protocol,
+    Set,
+    Tuple,
+    Union,
+)
+
+from grist_python_sdk.client import GristAPIClient
+
+from .query import Col, Condition, compile_sql, id_pages, matches, select_ids_call
+from .record import fetch_records_call, iter_record_batches, parse_sql_record_ids
+from .sql import query_sql_call, sql_call
+from .typing import RecordInfo
+from .utils import quote_identifier
+
+Row = Tuple[int, Dict[str, Any]]
+
+
+@dataclass
+class RefreshResult:
+    changed: int
+    deleted: int
+    full: bool
+
+
+def is_hidden_column(col_id: str) -> bool:
+    return col_id == "manualSort" or col_id.startswith("gristHelper_")
+
+
+def parse_webhook_rows(rows: Iterable[Dict[str, Any]]) -> List[RecordInfo]:
+    return [
+        {
+            "id": int(row["id"]),
+            "fields": {
+                col_id: value
+                for col_id, value in row.items()
+                if col_id != "id" and not is_hidden_column(col_id)
+            },
+        }
+        for row in rows
+    ]
+
+
+class ReplicaStore(Protocol):
+    def get(self, id: int) -> Optional[Dict[str, Any]]: ...
+
+    def rows(self) -> List[Row]: ...
+
+    def ids(self) -> Set[int]: ...
+
+    def select(self, condition: Condition) -> List[Row]: ...
+
+    def upsert(self, records: Iterable[RecordInfo]) -> None: ...
+
+    def delete(self, ids: Iterable[int]) -> None: ...
+
+    def get_state(self) -> Dict[str, Any]: ...
+
+    def set_state(self, state: Dict[str, Any]) -> None: ...
+
+    def __len__(self) -> int: ...
+
+    def close(self) -> None: ...
+
+
+class MemoryStore:
+    def __init__(self) -> None:
+        self.data: Dict[int, Dict[str, Any]] = {}
+        self.state: Dict[str, Any] = {}
+
+    def get(self, id: int) -> Optional[Dict[str, Any]]:
+        return self.data.get(id)
+
+    def rows(self) -> List[Row]:
+        return sorted(self.data.items())
+
+    def ids(self) -> Set[int]:
+        return set(self.data)
+
+    def select(self, condition: Condition) -> List[Row]:
+        return [
+            (id, fields)
+            for id, fields in sorted(self.data.items())
+            if matches(condition, {**fields, "id": id})
+        ]
+
+    def upsert(self, records: Iterable[RecordInfo]) -> None:
+        self.data.update((record["id"], record["fields"]) for record in records)
+
+    def delete(self, ids: Iterable[int]) -> None:
+        for id in ids:
+            self.data.pop(id, None)
+
+    def get_state(self) -> Dict[str, Any]:
+        return dict(self.state)
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        self.state = dict(state)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def close(self) -> None:
+        pass
+
+
+def json_column(name: str) -> Tuple[str, List[Any]]:
+    if name == "id":
+        return "id", []
+    return "json_extract(fields, ?)", [f'$."{name}"']
+
+
+class SQLiteStore:
+    def __init__(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS records "
+                "(id INTEGER PRIMARY KEY, fields TEXT NOT NULL)"
+            )
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS state (key TEXT PRIMARY KEY, value TEXT)"
+            )
+
+    def query(self, sql: str, args: Iterable[Any] = ()) -> List[Tuple[Any, ...]]:
+        with self.lock:
+            return self.connection.execute(sql, tuple(args)).fetchall()
+
+    def get(self, id: int) -> Optional[Dict[str, Any]]:
+        rows = self.query("SELECT fields FROM records WHERE id = ?", (id,))
+        return json.loads(rows[0][0]) if rows else None
+
+    def rows(self) -> List[Row]:
+        return [
+            (id, json.loads(fields))
+            for id, fields in self.query("SELECT id, fields FROM records ORDER BY id")
+        ]
+
+    def ids(self) -> Set[int]:
+        return {id for (id,) in self.query("SELECT id FROM records")}
+
+    def select(self, condition: Condition) -> List[Row]:
+        where, args = compile_sql(condition, json_column)
+        return [
+            (id, json.loads(fields))
+            for id, fields in self.query(
+                f"SELECT id, fields FROM records WHERE {where} ORDER BY id", args
+            )
+        ]
+
+    def upsert(self, records: Iterable[RecordInfo]) -> None:
+        with self.lock, self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO records (id, fields) VALUES (?, ?)",
+                [(record["id"], json.dumps(record["fields"])) for record in records],
+            )
+
+    def delete(self, ids: Iterable[int]) -> None:
+        with self.lock, self.connection:
+            self.connection.executemany(
+                "DELETE FROM records WHERE id = ?", [(id,) for id in ids]
+            )
+
+    def get_state(self) -> Dict[str, Any]:
+        return {
+            key: json.loads(value)
+            for key, value in self.query("SELECT key, value FROM state")
+        }
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        with self.lock, self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO state (key, value) VALUES (?, ?)",
+                [(key, json.dumps(value)) for key, value in state.items()],
+            )
+
+    def __len__(self) -> int:
+        return int(self.query("SELECT count(*) FROM records")[0][0])
+
+    def close(self) -> None:
+        self.connection.close()
+
+
+class TableReplica:
+    def __init__(
+        self,
+        client: GristAPIClient,
+        doc_id: str,
+        table_id: str,
+        updated_column: Optional[str] = None,
+        path: Optional[Union[str, "os.PathLike[str]"]] = None,
+        track_deletes: bool = True,
+        page_size: int = 500,
+    ) -> None:
+        self.client = client
+        self.doc_id = doc_id
+        self.table_id = table_id
+        self.updated_column = updated_column
+        self.track_deletes = track_deletes
+        self.page_size = page_size
+        self.store: ReplicaStore = MemoryStore() if path is None else SQLiteStore(path)
+        self.refresh_lock = threading.Lock()
+
+    def __enter__(self) -> "TableReplica":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.store.close()
+
+    def __len__(self) -> int:
+        return len(self.store)
+
+    def __contains__(self, id: int) -> bool:
+        return self.store.get(id) is not None
+
+    def get(self, id: int) -> Optional[RecordInfo]:
+        fields = self.store.get(id)
+        return None if fields is None else {"id": id, "fields": fields}
+
+    def records(self) -> List[RecordInfo]:
+        return [{"id": id, "fields": fields} for id, fields in self.store.rows()]
+
+    def select(self, where: Condition) -> List[RecordInfo]:
+        return [{"id": id, "fields": fields} for id, fields in self.store.select(where)]
+
+    def apply(self, rows: List[Dict[str, Any]]) -> None:
+        self.store.upsert(parse_webhook_rows(rows))
+
+    def advance_state(
+        self, state: Dict[str, Any], records: List[RecordInfo]
+    ) -> Dict[str, Any]:
+        state = dict(state)
+        for record in records:
+            state["max_id"] = max(state.get("max_id", 0), record["id"])
+            if self.updated_column is None:
+                continue
+            stamp = record["fields"].get(self.updated_column)
+            since = state.get("updated_since")
+            if stamp is not None and (since is None or stamp > since):
+                state["updated_since"] = stamp
+        return state
+
+    def full_refresh(self) -> RefreshResult:
+        remote_ids: Set[int] = set()
+        state: Dict[str, Any] = {}
+        changed = 0
+        for records in iter_record_batches(
+            self.client, self.doc_id, self.table_id, page_size=self.page_size
+        ):
+            self.store.upsert(records)
+            remote_ids.update(record["id"] for record in records)
+            state = self.advance_state(state, records)
+            changed += len(records)
+        stale = self.store.ids() - remote_ids
+        self.store.delete(stale)
+        state["synced"] = True
+        self.store.set_state(state)
+        return RefreshResult(changed, len(stale), True)
+
+    def changed_since(self, state: Dict[str, Any]) -> Condition:
+        condition = Col("id").gt(state.get("max_id", 0))
+        since = state.get("updated_since")
+        if self.updated_column is not None and since is not None:
+            condition = condition | Col(self.updated_column).ge(since)
+        return condition
+
+    def remote_count(self) -> int:
+        table = quote_identifier(self.table_id)
+        sql = f"SELECT count(*) AS n FROM {table}"
+        return int(self.client.call(query_sql_call(self.doc_id, sql))[0]["n"])
+
+    def remote_ids(self) -> Set[int]:
+        sql = f"SELECT id FROM {quote_identifier(self.table_id)}"
+        return set(
+            self.client.call(
+                sql_call(self.doc_id, sql, None, None, parse_sql_record_ids)
+            )
+        )
+
+    def refresh(self) -> RefreshResult:
+        with self.refresh_lock:
+            state = self.store.get_state()
+            if not state.get("synced"):
+                return self.full_refresh()
+
+            ids = self.client.call(
+                select_ids_call(self.doc_id, self.table_id, self.changed_since(state))
+            )
+            changed = [
+                record
+                for page in id_pages(ids)
+                for record in self.client.call(
+                    fetch_records_call(self.doc_id, self.table_id, page)
+                )
+            ]
+            self.store.upsert(changed)
+            deleted: Set[int] = set()
+            if self.track_deletes and self.remote_count() != len(self.store):
+                deleted = self.store.ids() - self.remote_ids()
+            self.store.delete(deleted)
+            self.store.set_state(self.advance_state(state, changed))
+            return RefreshResult(len(changed), len(deleted), False)
@@ -0,0 +1,135 @@
+from functools import lru_cache
+from operator import itemgetter
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+
+from grist_python_sdk.call import APICall
+from grist_python_sdk.client import GristAPIClient
+
+from .record import fetch_columns_call
+from .typing import ColumnarData, RecordInfo
+
+
+class CompactRow(Tuple[Any, ...]):
+    __slots__ = ()
+    _columns: ClassVar[Tuple[str, ...]] = ("id",)
+    _positions: ClassVar[Dict[str, int]] = {"id": 0}
+
+    def __getitem__(self, key: Union[str, int, slice]) -> Any:  # type: ignore[override]
+        if isinstance(key, str):
+            return tuple.__getitem__(self, self._positions[key])
+        return tuple.__getitem__(self, key)
+
+    def __getattr__(self, name: str) -> Any:
+        raise AttributeError(name)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._positions
+
+    def __repr__(self) -> str:
+        values = ", ".join(
+            f"{col}={value!r}"
+            for col, value in zip(self._columns, tuple.__iter__(self))
+        )
+        return f"{type(self).__name__}({values})"
+
+    @property
+    def id(self) -> int:
+        return int(tuple.__getitem__(self, 0))
+
+    def get(self, key: str, default: Any = None) -> Any:
+        i = self._positions.get(key)
+        return default if i is None else tuple.__getitem__(self, i)
+
+    def keys(self) -> Tuple[str, ...]:
+        return self._columns
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        return zip(self._columns, tuple.__iter__(self))
+
+    def fields(self) -> Dict[str, Any]:
+        return dict(zip(self._columns[1:], tuple.__getitem__(self, slice(1, None))))
+
+    def to_record(self) -> RecordInfo:
+        return {
+            "id": int(tuple.__getitem__(self, 0)),
+            "fields": CompactRow.fields(self),
+        }
+
+
+@lru_cache(maxsize=256)
+def row_type(columns: Tuple[str, ...], name: str = "Row") -> Type[CompactRow]:
+    columns = ("id", *(col for col in columns if col != "id"))
+    namespace: Dict[str, Any] = {
+        col: property(itemgetter(i)) for i, col in enumerate(columns) if col != "id"
+    }
+    namespace.update(
+        __slots__=(),
+        _columns=columns,
+        _positions={col: i for i, col in enumerate(columns)},
+    )
+    return type(name, (CompactRow,), namespace)
+
+
+def parse_rows(columns: ColumnarData, name: str = "Row") -> List[CompactRow]:
+    if not columns:
+        return []
+    cls = row_type(tuple(columns), name)
+    ordered = [columns["id"], *(columns[col] for col in cls._columns[1:])]
+    return [cls(values) for values in zip(*ordered)]
+
+
+def rows_from_records(
+    records: Sequence[RecordInfo], name: str = "Row"
+) -> List[CompactRow]:
+    if not records:
+        return []
+    cls = row_type(tuple(records[0]["fields"]), name)
+    fields = cls._columns[1:]
+    return [
+        cls((record["id"], *(record["fields"].get(col) for col in fields)))
+        for record in records
+    ]
+
+
+def fetch_rows_call(
+    doc_id: str,
+    table_id: str,
+    filterstring: Optional[str] = None,
+    sortstring: Optional[str] = None,
+    limitnumber: Optional[int] = None,
+    hidden: Optional[bool] = None,
+) -> APICall[List[CompactRow]]:
+    call = fetch_columns_call(
+        doc_id, table_id, filterstring, sortstring, limitnumber, hidden
+    )
+    return APICall(
+        call.method,
+        call.path,
+        lambda response: parse_rows(response, table_id),
+        params=call.params,
+    )
+
+
+def fetch_rows(
+    client: GristAPIClient,
+    doc_id: str,
+    table_id: str,
+    filterstring: Optional[str] = None,
+    sortstring: Optional[str] = None,
+    limitnumber: Optional[int] = None,
+    hidden: Optional[bool] = None,
+) -> List[CompactRow]:
+    return client.call(
+        fetch_rows_call(doc_id, table_id, filterstring, sortstring, limitnumber, hidden)
+    )
@@ -0,0 +1,159 @@
+import re
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, TypeVar
+
+from grist_python_sdk.call import APICall
+from grist_python_sdk.client import GristAPIClient
+
+from .typing import ColumnarData
+from .utils import quote_identifier
+
+T = TypeVar("T")
+
+MAX_GET_SQL_LENGTH = 2000
+ORDER_BY = re.compile(r"\border\s+by\b", re.IGNORECASE)
+
+SQLRow = Dict[str, Any]
+
+
+def parse_sql_rows(response: Dict[str, Any]) -> List[SQLRow]:
+    return [record["fields"] for record in response["records"]]
+
+
+def parse_sql_columns(response: Dict[str, Any]) -> ColumnarData:
+    rows = parse_sql_rows(response)
+    if not rows:
+        return {}
+    return {col: [row[col] for row in rows] for col in rows[0]}
+
+
+def strip_statement(sql: str) -> str:
+    return sql.strip().rstrip(";").rstrip()
+
+
+def sql_call(
+    doc_id: str,
+    sql: str,
+    args: Optional[Sequence[Any]],
+    timeout: Optional[int],
+    parse: Callable[[Any], T],
+) -> APICall[T]:
+    path = f"docs/{doc_id}/sql"
+    if not args and timeout is None and len(sql) <= MAX_GET_SQL_LENGTH:
+        return APICall("get", path, parse, params={"q": sql})
+    payload: Dict[str, Any] = {"sql": sql, "args": list(args or [])}
+    if timeout is not None:
+        payload["timeout"] = timeout
+    return APICall("post", path, parse, json=payload)
+
+
+def query_sql_call(
+    doc_id: str,
+    sql: str,
+    args: Optional[Sequence[Any]] = None,
+    timeout: Optional[int] = None,
+) -> APICall[List[SQLRow]]:
+    return sql_call(doc_id, sql, args, timeout, parse_sql_rows)
+
+
+def query_sql(
+    client: GristAPIClient,
+    doc_id: str,
+    sql: str,
+    args: Optional[Sequence[Any]] = None,
+    timeout: Optional[int] = None,
+) -> List[SQLRow]:
+    return client.call(query_sql_call(doc_id, sql, args, timeout))
+
+
+def query_sql_columns_call(
+    doc_id: str,
+    sql: str,
+    args: Optional[Sequence[Any]] = None,
+    timeout: Optional[int] = None,
+) -> APICall[ColumnarData]:
+    return sql_call(doc_id, sql, args, timeout, parse_sql_columns)
+
+
+def query_sql_columns(
+    client: GristAPIClient,
+    doc_id: str,
+    sql: str,
+    args: Optional[Sequence[Any]] = None,
+    timeout: Optional[int] = None,
+) -> ColumnarData:
+    return client.call(query_sql_columns_call(doc_id, sql, args, timeout))
+
+
+def sql_page_call(
+    doc_id: str,
+    sql: str,
+    args: Optional[Sequence[Any]],
+    page_size: int,
+    cursor: Any,
+    key_column: Optional[str] = None,
+    timeout: Optional[int] = None,
+) -> APICall[List[SQLRow]]:
+    inner = strip_statement(sql)
+    args = list(args or [])
+    if key_column is None:
+        if not ORDER_BY.search(inner):
+            raise ValueError(
+                "offset paging needs an ORDER BY in the statement; "
+                "add one or pass key_column for keyset paging"
+            )
+        paged = f"SELECT * FROM ({inner}) LIMIT ? OFFSET ?"
+        args += [page_size, cursor or 0]
+    else:
+        key = quote_identifier(key_column)
+        where = "" if cursor is None else f" WHERE {key} > ?"
+        paged = f"SELECT * FROM ({inner}){where} ORDER BY {key} LIMIT ?"
+        args += [page_size] if cursor is None else [cursor, page_size]
+    return query_sql_call(doc_id, paged, args, timeout)
+
+
+def next_sql_cursor(rows: List[SQLRow], cursor: Any, key_column: Optional[str]) -> Any:
+    if key_column is None:
+        return (cursor or 0) + len(rows)
+    return rows[-1][key_column]
+
+
+def iter_sql_batches(
+    client: GristAPIClient,
+    doc_id: str,
+    sql: str,
+    args: Optional[Sequence[Any]] = None,
+    page_size: int = 1000,
+    key_column: Optional[str] = None,
+    timeout: Optional[int] = None,
+) -> Iterator[List[SQLRow]]:
+    """Page through a SELECT statement.
+
+    With key_column, pages are fetched by keyset on that column. Without it,
+    pages use LIMIT/OFFSET, which is only stable if the statement has an
+    ORDER BY over a unique key, so statements without one are rejected.
+    """
+    cursor = None
+    while True:
+        rows = client.call(
+            sql_page_call(doc_id, sql, args, page_size, cursor, key_column, timeout)
+        )
+        if rows:
+            yield rows
+        if len(rows) < page_size:
+            return
+        cursor = next_sql_cursor(rows, cursor, key_column)
+
+
+def iter_sql(
+    client: GristAPIClient,
+    doc_id: str,
+    sql: str,
+    args: Optional[Sequence[Any]] = None,
+    page_size: int = 1000,
+    key_column: Optional[str] = None,
+    timeout: Optional[int] = None,
+) -> Iterator[SQLRow]:
+    for rows in iter_sql_batches(
+        client, doc_id, sql, args, page_size, key_column, timeout
+    ):
+        yield from rows
@@ -0,0 +1,151 @@
+import hashlib
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from grist_python_sdk.client import GristAPIClient
+
+from .record import add_records, delete_records, fetch_columns, patch_records
+
+
+@dataclass
+class SyncPlan:
+    additions: List[Dict[str, Any]] = field(default_factory=list)
+    updates: Dict[int, Dict[str, Any]] = field(default_factory=dict)
+    deletions: List[int] = field(default_factory=list)
+    unchanged: int = 0
+
+
+@dataclass
+class SyncResult:
+    added: int
+    updated: int
+    deleted: int
+    unchanged: int
+    added_ids: List[int] = field(default_factory=list)
+
+
+def normalize_value(value: Any) -> Any:
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, list):
+        return [normalize_value(item) for item in value]
+    return value
+
+
+def key_value(value: Any) -> Any:
+    if isinstance(value, list):
+        return tuple(key_value(item) for item in value)
+    return normalize_value(value)
+
+
+def digest_values(values: Sequence[Any]) -> bytes:
+    encoded = json.dumps(
+        [normalize_value(value) for value in values],
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    ).encode()
+    return hashlib.blake2b(encoded, digest_size=16).digest()
+
+
+def plan_sync(
+    remote_columns: Dict[str, List[Any]],
+    rows: Iterable[Dict[str, Any]],
+    key_columns: Sequence[str],
+    compare_columns: Optional[Sequence[str]] = None,
+    delete_missing: bool = False,
+) -> SyncPlan:
+    rows = list(rows)
+    if compare_columns is None:
+        compare_columns = sorted({col for row in rows for col in row})
+    remote_ids = remote_columns.get("id", [])
+    remote_index: Dict[Tuple[Any, ...], Tuple[int, bytes]] = {}
+    for i, row_id in enumerate(remote_ids):
+        key = tuple(
+            key_value(remote_columns[col][i]) if col in remote_columns else None
+            for col in key_columns
+        )
+        if key in remote_index:
+            raise ValueError(f"duplicate key {key!r} in remote table")
+        values = [
+            remote_columns[col][i] if col in remote_columns else None
+            for col in compare_columns
+        ]
+        remote_index[key] = (int(row_id), digest_values(values))
+
+    plan = SyncPlan()
+    seen: Set[Tuple[Any, ...]] = set()
+    for row in rows:
+        key = tuple(key_value(row.get(col)) for col in key_columns)
+        if key in seen:
+            raise ValueError(f"duplicate key {key!r} in local rows")
+        seen.add(key)
+        remote = remote_index.get(key)
+        if remote is None:
+            plan.additions.append(row)
+            continue
+        row_id, remote_digest = remote
+        if digest_values([row.get(col) for col in compare_columns]) == remote_digest:
+            plan.unchanged += 1
+        else:
+            plan.updates[row_id] = {
+                col: value for col, value in row.items() if col not in key_columns
+            }
+    if delete_missing:
+        plan.deletions = [
+            row_id for key, (row_id, _) in remote_index.items() if key not in seen
+        ]
+    return plan
+
+
+def sync_table(
+    client: GristAPIClient,
+    doc_id: str,
+    table_id: str,
+    rows: Iterable[Dict[str, Any]],
+    key_columns: Sequence[str],
+    compare_columns: Optional[Sequence[str]] = None,
+    delete_missing: bool = False,
+    chunk_size: int = 500,
+    max_workers: int = 1,
+    dry_run: bool = False,
+) -> SyncResult:
+    remote_columns = fetch_columns(client, doc_id, table_id)
+    plan = plan_sync(remote_columns, rows, key_columns, compare_columns, delete_missing)
+    result = SyncResult(
+        added=len(plan.additions),
+        updated=len(plan.updates),
+        deleted=len(plan.deletions),
+        unchanged=plan.unchanged,
+    )
+    if dry_run:
+        return result
+    if plan.additions:
+        result.added_ids = add_records(
+            client,
+            doc_id,
+            table_id,
+            plan.additions,
+            chunk_size=chunk_size,
+            max_workers=max_workers,
+        )
+    if plan.updates:
+        patch_records(
+            client,
+            doc_id,
+            table_id,
+            plan.updates,
+            chunk_size=chunk_size,
+            max_workers=max_workers,
+        )
+    if plan.deletions:
+        delete_records(
+            client,
+            doc_id,
+            table_id,
+            plan.deletions,
+            chunk_size=chunk_size,
+            max_workers=max_workers,
+        )
+    return result
@@ -1,16 +1,32 @@
 from typing import Any, Dict, List, TypedDict
 
+from grist_python_sdk.call import APICall, ignore_response
 from grist_python_sdk.client import GristAPIClient
 
 from .typing import ColumnInfo, TableInfo
 from .utils import parse_table_info
 
 
+def parse_tables_info(response: Dict[str, Any]) -> List[TableInfo]:
+    return [parse_table_info(table_info) for table_info in response["tables"]]
+
+
+def parse_table_ids(response: Dict[str, Any]) -> List[str]:
+    return [table["id"] for table in response["tables"]]
+
+
+def list_tables_info_call(doc_id: str) -> APICall[List[TableInfo]]:
+    return APICall("get", f"docs/{doc_id}/tables", parse_tables_info, cacheable=True)
+
+
 def list_tables_info(client: GristAPIClient, doc_id: str) -> List[TableInfo]:
-    tables_info: List[Dict[str, Any]] = client.request(
-        method="get", path=f"docs/{doc_id}/tables"
-    )["tables"]
-    return [parse_table_info(table_info) for table_info in tables_info]
+    return client.call(list_tables_info_call(doc_id))
+
+
+def modify_tables_call(doc_id: str, tables: List[TableInfo]) -> APICall[None]:
+    path = f"docs/{doc_id}/tables"
+    payload = {"tables": tables}
+    return APICall("patch", path, ignore_response, json=payload, return_type="text")
 
 
 def modify_tables(
@@ -18,9 +34,7 @@ def modify_tables(
     doc_id: str,
     tables: List[TableInfo],
 ) -> None:
-    path = f"docs/{doc_id}/tables"
-    payload = {"tables": tables}
-    client.request(method="patch", path=path, json=payload, return_type="text")
+    client.call(modify_tables_call(doc_id, tables))
 
 
 class TableWithColumnsInfo(TypedDict):
@@ -28,12 +42,17 @@ class TableWithColumnsInfo(TypedDict):
     columns: List[ColumnInfo]
 
 
+def add_tables_call(
+    doc_id: str, tables: List[TableWithColumnsInfo]
+) -> APICall[List[str]]:
+    path = f"docs/{doc_id}/tables"
+    payload = {"tables": tables}
+    return APICall("post", path, parse_table_ids, json=payload)
+
+
 def add_tables(
     client: GristAPIClient,
     doc_id: str,
     tables: List[TableWithColumnsInfo],
 ) -> List[str]:
-    path = f"docs/{doc_id}/tables"
-    payload = {"tables": tables}
-    response = client.request(method="post", path=path, json=payload)
-    return [table["id"] for table in response["tables"]]
+    return client.call(add_tables_call(doc_id, tables))
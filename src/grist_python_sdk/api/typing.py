@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Any, Dict, List, Literal, Optional, TypedDict
+from typing import Any, Dict, List, Literal, Optional, TypedDict, Union
 
 Access = Literal["owners", "editors", "viewers", "members", None]
 
@@ -62,6 +62,9 @@ class RecordInfo(TypedDict):
     fields: Dict[str, Any]
 
 
+ColumnarData = Dict[str, List[Any]]
+
+
 class ColumnFieldsInfo(TypedDict, total=False):
     type: Optional[str]
     label: Optional[str]
@@ -83,9 +86,32 @@ class ColumnInfo(TypedDict, total=False):
 class AttachmentMetadataFieldsInfo(TypedDict):
     fileName: str
     fileSize: int
-    timeUploaded: str
+    timeUploaded: Union[str, datetime]
 
 
 class AttachmentMetadataInfo(TypedDict):
     id: int
     fields: AttachmentMetadataFieldsInfo
+
+
+class AttachmentMirrorEntry(AttachmentMetadataFieldsInfo):
+    sha256: str
+
+
+class WebhookFieldsInfo(TypedDict, total=False):
+    name: Optional[str]
+    memo: Optional[str]
+    url: str
+    enabled: bool
+    eventTypes: List[str]
+    isReadyColumn: Optional[str]
+    tableId: str
+
+
+class WebhookInfoRequired(TypedDict):
+    id: str
+    fields: WebhookFieldsInfo
+
+
+class WebhookInfo(WebhookInfoRequired, total=False):
+    usage: Optional[Dict[str, Any]]
@@ -1,19 +1,107 @@
 from datetime import datetime
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    MutableMapping,
+    Set,
+    Tuple,
+    cast,
+)
 
-from .typing import DocumentInfo, OrganizationInfo, TableInfo, WorkspaceInfo
+from .typing import (
+    DocumentInfo,
+    OrganizationInfo,
+    TableInfo,
+    UserInfo,
+    WorkspaceInfo,
+)
 
 
-def parse_organization_info(org_dict: Dict[str, Any]) -> OrganizationInfo:
-    return {
+def quote_identifier(identifier: str) -> str:
+    escaped = identifier.replace('"', '""')
+    return f'"{escaped}"'
+
+
+TimestampMode = Literal["raw", "eager", "lazy"]
+
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
+
+
+@lru_cache(maxsize=4096)
+def parse_timestamp(value: str) -> datetime:
+    try:
+        return datetime.fromisoformat(value[:-1] if value.endswith("Z") else value)
+    except ValueError:
+        return datetime.strptime(value, TIMESTAMP_FORMAT)
+
+
+class LazyTimestamps(MutableMapping[str, Any]):
+    __slots__ = ("data", "pending")
+
+    def __init__(self, data: Dict[str, Any], keys: Iterable[str]) -> None:
+        self.data = dict(data)
+        self.pending: Set[str] = {key for key in keys if isinstance(data.get(key), str)}
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self.pending:
+            self.pending.discard(key)
+            self.data[key] = parse_timestamp(self.data[key])
+        return self.data[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.pending.discard(key)
+        self.data[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        self.pending.discard(key)
+        del self.data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.data)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __repr__(self) -> str:
+        return repr(self.copy())
+
+    def copy(self) -> Dict[str, Any]:
+        return dict(self)
+
+
+def parse_timestamps(
+    data: Dict[str, Any], keys: Tuple[str, ...], mode: TimestampMode
+) -> MutableMapping[str, Any]:
+    if mode == "lazy":
+        return LazyTimestamps(data, keys)
+    if mode == "eager":
+        for key in keys:
+            if isinstance(data.get(key), str):
+                data[key] = parse_timestamp(data[key])
+    return data
+
+
+def parse_organization_info(
+    org_dict: Dict[str, Any], timestamps: TimestampMode = "eager"
+) -> OrganizationInfo:
+    org = {
         "id": org_dict["id"],
         "name": str(org_dict["name"]),
         "domain": org_dict["domain"],
         "owner": org_dict["owner"],
         "access": org_dict["access"],
-        "createdAt": datetime.strptime(org_dict["createdAt"], "%Y-%m-%dT%H:%M:%S.%fZ"),
-        "updatedAt": datetime.strptime(org_dict["updatedAt"], "%Y-%m-%dT%H:%M:%S.%fZ"),
+        "createdAt": org_dict["createdAt"],
+        "updatedAt": org_dict["updatedAt"],
     }
+    return cast(
+        OrganizationInfo,
+        parse_timestamps(org, ("createdAt", "updatedAt"), timestamps),
+    )
 
 
 def parse_workspace_info(ws_dict: Dict[str, Any]) -> WorkspaceInfo:
@@ -61,3 +149,8 @@ def parse_table_info(table: Dict[str, Any]) -> TableInfo:
         },
     }
     return doc
+
+
+def parse_users(response: Dict[str, Any]) -> List[UserInfo]:
+    users: List[UserInfo] = response["users"]
+    return users
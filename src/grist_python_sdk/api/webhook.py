@@ -0,0 +1,67 @@
+from typing import Any, Dict, List
+
+from grist_python_sdk.call import APICall, ignore_response
+from grist_python_sdk.client import GristAPIClient
+
+from .typing import WebhookFieldsInfo, WebhookInfo
+
+
+def parse_webhooks(response: Dict[str, Any]) -> List[WebhookInfo]:
+    webhooks: List[WebhookInfo] = response["webhooks"]
+    return webhooks
+
+
+def parse_webhook_ids(response: Dict[str, Any]) -> List[str]:
+    return [str(webhook["id"]) for webhook in response["webhooks"]]
+
+
+def list_webhooks_call(doc_id: str) -> APICall[List[WebhookInfo]]:
+    return APICall("get", f"docs/{doc_id}/webhooks", parse_webhooks)
+
+
+def list_webhooks(client: GristAPIClient, doc_id: str) -> List[WebhookInfo]:
+    return client.call(list_webhooks_call(doc_id))
+
+
+def add_webhooks_call(
+    doc_id: str, webhooks: List[WebhookFieldsInfo]
+) -> APICall[List[str]]:
+    payload = {"webhooks": [{"fields": fields} for fields in webhooks]}
+    return APICall("post", f"docs/{doc_id}/webhooks", parse_webhook_ids, json=payload)
+
+
+def add_webhooks(
+    client: GristAPIClient, doc_id: str, webhooks: List[WebhookFieldsInfo]
+) -> List[str]:
+    return client.call(add_webhooks_call(doc_id, webhooks))
+
+
+def modify_webhook_call(
+    doc_id: str, webhook_id: str, fields: WebhookFieldsInfo
+) -> APICall[None]:
+    path = f"docs/{doc_id}/webhooks/{webhook_id}"
+    return APICall("patch", path, ignore_response, json=fields, return_type="text")
+
+
+def modify_webhook(
+    client: GristAPIClient, doc_id: str, webhook_id: str, fields: WebhookFieldsInfo
+) -> None:
+    client.call(modify_webhook_call(doc_id, webhook_id, fields))
+
+
+def delete_webhook_call(doc_id: str, webhook_id: str) -> APICall[None]:
+    path = f"docs/{doc_id}/webhooks/{webhook_id}"
+    return APICall("delete", path, ignore_response, return_type="text")
+
+
+def delete_webhook(client: GristAPIClient, doc_id: str, webhook_id: str) -> None:
+    client.call(delete_webhook_call(doc_id, webhook_id))
+
+
+def clear_webhook_queue_call(doc_id: str) -> APICall[None]:
+    path = f"docs/{doc_id}/webhooks/queue"
+    return APICall("delete", path, ignore_response, return_type="text")
+
+
+def clear_webhook_queue(client: GristAPIClient, doc_id: str) -> None:
+    client.call(clear_webhook_queue_call(doc_id))
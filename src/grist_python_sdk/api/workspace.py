@@ -1,60 +1,97 @@
 from typing import Any, Dict, List
 
+from grist_python_sdk.call import APICall, ignore_response
 from grist_python_sdk.client import GristAPIClient
 
 from .typing import Access, UserInfo, WorkspaceInfo
-from .utils import parse_workspace_info
+from .utils import parse_users, parse_workspace_info
+
+
+def parse_workspaces_info(response: List[Dict[str, Any]]) -> List[WorkspaceInfo]:
+    return [parse_workspace_info(ws_parsed) for ws_parsed in response]
+
+
+def list_workspaces_info_call(org_id: str | int) -> APICall[List[WorkspaceInfo]]:
+    return APICall(
+        "get",
+        f"orgs/{org_id}/workspaces",
+        parse_workspaces_info,
+        params={},
+        cacheable=True,
+    )
 
 
 def list_workspaces_info(
     client: GristAPIClient, org_id: str | int
 ) -> List[WorkspaceInfo]:
-    wss: List[WorkspaceInfo] = []
-    wss_parsed: List[Dict[str, Any]] = client.request(
-        method="get", path=f"orgs/{org_id}/workspaces", params={}
-    )
-    for ws_parsed in wss_parsed:
-        wss.append(parse_workspace_info(ws_parsed))
-    return wss
+    return client.call(list_workspaces_info_call(org_id))
+
+
+def describe_workspace_call(ws_id: int) -> APICall[WorkspaceInfo]:
+    return APICall("get", f"workspaces/{ws_id}", parse_workspace_info, cacheable=True)
 
 
 def describe_workspace(client: GristAPIClient, ws_id: int) -> WorkspaceInfo:
-    ws_parsed: Dict[str, Any] = client.request(method="get", path=f"workspaces/{ws_id}")
-    return parse_workspace_info(ws_parsed)
+    return client.call(describe_workspace_call(ws_id))
+
+
+def list_users_of_workspace_call(ws_id: int) -> APICall[List[UserInfo]]:
+    return APICall("get", f"workspaces/{ws_id}/access", parse_users, cacheable=True)
 
 
 def list_users_of_workspace(client: GristAPIClient, ws_id: int) -> List[UserInfo]:
-    users: List[UserInfo] = client.request(
-        method="get", path=f"workspaces/{ws_id}/access"
-    )["users"]
-    return users
+    return client.call(list_users_of_workspace_call(ws_id))
 
 
-def change_users_of_workspace(
-    client: GristAPIClient, ws_id: int, users_info: Dict[str, Access]
-) -> None:
+def change_users_of_workspace_call(
+    ws_id: int, users_info: Dict[str, Access]
+) -> APICall[None]:
     delta_info: Dict[str, Any] = {
         "delta": {"maxInheritedRole": "owners", "users": users_info}
     }
-    client.request(method="patch", path=f"workspaces/{ws_id}/access", json=delta_info)
+    return APICall(
+        "patch", f"workspaces/{ws_id}/access", ignore_response, json=delta_info
+    )
+
+
+def change_users_of_workspace(
+    client: GristAPIClient, ws_id: int, users_info: Dict[str, Access]
+) -> None:
+    client.call(change_users_of_workspace_call(ws_id, users_info))
+
+
+def delete_workspace_call(ws_id: int) -> APICall[None]:
+    return APICall("delete", f"workspaces/{ws_id}", ignore_response)
 
 
 def delete_workspace(client: GristAPIClient, ws_id: int) -> None:
-    client.request(method="delete", path=f"workspaces/{ws_id}")
+    client.call(delete_workspace_call(ws_id))
 
 
-def rename_workspace(client: GristAPIClient, ws_id: int, new_name: str) -> None:
+def rename_workspace_call(ws_id: int, new_name: str) -> APICall[None]:
     changes = {"name": new_name}
-    client.request(
-        method="patch", path=f"workspaces/{ws_id}", json=changes, return_type="text"
+    return APICall(
+        "patch",
+        f"workspaces/{ws_id}",
+        ignore_response,
+        json=changes,
+        return_type="text",
     )
 
 
-def create_workspace(client: GristAPIClient, org_id: str | int, name: str) -> str:
-    ws_id: str = client.request(
-        method="post",
-        path=f"orgs/{org_id}/workspaces",
+def rename_workspace(client: GristAPIClient, ws_id: int, new_name: str) -> None:
+    client.call(rename_workspace_call(ws_id, new_name))
+
+
+def create_workspace_call(org_id: str | int, name: str) -> APICall[str]:
+    return APICall(
+        "post",
+        f"orgs/{org_id}/workspaces",
+        str,
         json={"name": name},
         return_type="text",
     )
-    return ws_id
+
+
+def create_workspace(client: GristAPIClient, org_id: str | int, name: str) -> str:
+    return client.call(create_workspace_call(org_id, name))
@@ -0,0 +1,116 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+CacheKey = Tuple[str, str, Tuple[Tuple[str, str], ...]]
+
+SITE_SCOPE = "site"
+
+
+def cache_scope(path: str) -> str:
+    segments = path.strip("/").split("/")
+    if len(segments) >= 2 and segments[0] == "docs":
+        return f"docs/{segments[1]}"
+    return SITE_SCOPE
+
+
+def invalidates_cache(method: str, path: str) -> bool:
+    return method.lower() != "get" and path.rstrip("/").split("/")[-1] != "sql"
+
+
+def make_cache_key(path: str, params: Optional[Dict[str, Any]]) -> CacheKey:
+    items = tuple(
+        sorted(
+            (key, str(value))
+            for key, value in (params or {}).items()
+            if value is not None
+        )
+    )
+    return (cache_scope(path), path, items)
+
+
+@dataclass
+class CacheEntry:
+    content: bytes
+    expires_at: float
+    etag: Optional[str] = None
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        max_entries: int = 256,
+        ttl: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.clock = clock
+        self.entries: "OrderedDict[CacheKey, CacheEntry]" = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def lookup(self, key: CacheKey) -> Tuple[Optional[bytes], Optional[str]]:
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry.expires_at > self.clock():
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return entry.content, None
+            self.misses += 1
+            if entry is None:
+                return None, None
+            if entry.etag is None:
+                del self.entries[key]
+                return None, None
+            return None, entry.etag
+
+    def revalidate(self, key: CacheKey) -> Optional[bytes]:
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            entry.expires_at = self.clock() + self.ttl
+            self.entries.move_to_end(key)
+            self.revalidations += 1
+            return entry.content
+
+    def store(self, key: CacheKey, content: bytes, etag: Optional[str] = None) -> None:
+        with self.lock:
+            self.entries[key] = CacheEntry(content, self.clock() + self.ttl, etag)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def invalidate(self, path: str) -> None:
+        scope = cache_scope(path)
+        scopes = {scope}
+        if scope != SITE_SCOPE and path.strip("/") == scope:
+            scopes.add(SITE_SCOPE)
+        with self.lock:
+            stale = [key for key in self.entries if key[0] in scopes]
+            for key in stale:
+                del self.entries[key]
+            self.invalidations += len(stale)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+            "invalidations": self.invalidations,
+            "size": len(self.entries),
+        }
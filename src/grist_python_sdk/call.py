@@ -0,0 +1,25 @@
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Generic, List, Literal, Optional, TypeVar
+
+from .multipart import UploadSource
+
+T = TypeVar("T")
+
+Method = Literal["get", "post", "put", "delete", "patch"]
+ReturnType = Literal["json", "text", "content"]
+
+
+def ignore_response(response: Any) -> None:
+    return None
+
+
+@dataclass
+class APICall(Generic[T]):
+    method: Method
+    path: str
+    parse: Callable[[Any], T]
+    params: Optional[Dict[str, Any]] = None
+    json: Any = None
+    filenames: Optional[List[UploadSource]] = None
+    return_type: ReturnType = "json"
+    cacheable: bool = False
@@ -1,14 +1,60 @@
-from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional
+import logging
+import time
+from contextlib import contextmanager
+from types import TracebackType
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+)
 from urllib.parse import urljoin
 
-from requests import request
+from requests import ConnectionError, Response, Session, Timeout
+from requests.adapters import HTTPAdapter
 
+from .cache import CacheKey, ResponseCache, invalidates_cache, make_cache_key
+from .call import APICall, Method, ReturnType
+from .instrumentation import RequestEvent, RequestListener
+from .json_codec import JSONCodec, default_codec
+from .multipart import MultipartStream, UploadItem, UploadSource, upload_parts
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
 
-class GristAPIClient:
-    def __init__(self, root_url: str, api_key: str) -> None:
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+
+def body_size(headers: Mapping[str, str]) -> Optional[int]:
+    content_length = headers.get("Content-Length")
+    return None if content_length is None else int(content_length)
+
+
+class BaseGristAPIClient:
+    def __init__(
+        self,
+        root_url: str,
+        api_key: str,
+        json_codec: Optional[JSONCodec] = None,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        listeners: Optional[Sequence[RequestListener]] = None,
+    ) -> None:
         self.root_url = root_url
         self.api_key = api_key
+        self.json_codec = json_codec or default_codec()
+        self.retry = retry
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.listeners = list(listeners or [])
 
     @property
     def headers_with_auth(self) -> Dict[str, str]:
@@ -22,40 +68,254 @@ class GristAPIClient:
         api_url = urljoin(self.root_url, "/api/")
         return urljoin(api_url, path)
 
+    def lookup_cache(
+        self,
+        method: Method,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        cacheable: bool,
+    ) -> Tuple[Optional[CacheKey], Optional[bytes], Optional[Dict[str, str]]]:
+        if self.cache is None or method != "get" or not cacheable:
+            return None, None, None
+        cache_key = make_cache_key(path, params)
+        content, etag = self.cache.lookup(cache_key)
+        headers = {"If-None-Match": etag} if etag is not None else None
+        return cache_key, content, headers
+
+    def invalidate_cache(self, method: Method, path: str) -> None:
+        if self.cache is not None and invalidates_cache(method, path):
+            self.cache.invalidate(path)
+
+    def record_request(
+        self,
+        method: Method,
+        path: str,
+        started_at: float,
+        start: float,
+        attempt: int,
+        status: Optional[int] = None,
+        request_bytes: Optional[int] = None,
+        response_bytes: Optional[int] = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        event = RequestEvent(
+            method,
+            path,
+            status,
+            started_at,
+            time.perf_counter() - start,
+            request_bytes,
+            response_bytes,
+            attempt - 1,
+            error,
+        )
+        for listener in self.listeners:
+            try:
+                listener(event)
+            except Exception:
+                logger.exception("request listener %r failed", listener)
+
+    def decode_content(self, content: bytes, return_type: ReturnType) -> Any:
+        if return_type == "json":
+            return self.json_codec.loads(content)
+        elif return_type == "text":
+            return content.decode()
+        elif return_type == "content":
+            return content
+
+
+class GristAPIClient(BaseGristAPIClient):
+    def __init__(
+        self,
+        root_url: str,
+        api_key: str,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        json_codec: Optional[JSONCodec] = None,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        listeners: Optional[Sequence[RequestListener]] = None,
+    ) -> None:
+        super().__init__(
+            root_url, api_key, json_codec, retry, rate_limiter, cache, listeners
+        )
+        self.session = Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def __enter__(self) -> "GristAPIClient":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.session.close()
+
+    def send(
+        self,
+        method: Method,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[bytes] = None,
+        filenames: Optional[Sequence[UploadItem]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        stream: bool = False,
+    ) -> Response:
+        headers = {**self.headers_with_auth, **(headers or {})}
+        if filenames is not None:
+            with MultipartStream(filenames) as body:
+                headers["Content-Type"] = body.content_type
+                return self.session.request(
+                    method=method,
+                    url=self.get_url(path),
+                    params=params,
+                    headers=headers,
+                    data=body,
+                )
+        return self.session.request(
+            method=method,
+            url=self.get_url(path),
+            params=params,
+            headers=headers,
+            data=data,
+            stream=stream,
+        )
+
+    def send_with_retry(
+        self,
+        method: Method,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[bytes] = None,
+        filenames: Optional[List[UploadSource]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        stream: bool = False,
+    ) -> Response:
+        started_at = time.time()
+        start = time.perf_counter()
+        attempt = 0
+        parts = None if filenames is None else upload_parts(filenames)
+        while True:
+            attempt += 1
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(method, path)
+            try:
+                response = self.send(method, path, params, data, parts, headers, stream)
+            except (ConnectionError, Timeout) as e:
+                if self.retry is None or not self.retry.should_retry(method, attempt):
+                    if self.listeners:
+                        self.record_request(
+                            method,
+                            path,
+                            started_at,
+                            start,
+                            attempt,
+                            request_bytes=None if data is None else len(data),
+                            error=e,
+                        )
+                    raise
+                delay = self.retry.backoff(attempt)
+            else:
+                if self.retry is None or not self.retry.should_retry(
+                    method, attempt, response.status_code
+                ):
+                    if self.listeners:
+                        self.record_request(
+                            method,
+                            path,
+                            started_at,
+                            start,
+                            attempt,
+                            response.status_code,
+                            body_size(response.request.headers),
+                            body_size(response.headers)
+                            if stream
+                            else len(response.content),
+                        )
+                    return response
+                delay = self.retry.backoff(attempt, response.headers.get("Retry-After"))
+                response.close()
+            time.sleep(delay)
+
     def request(
         self,
-        method: Literal["get", "post", "put", "delete", "patch"],
+        method: Method,
         path: str,
         params: Optional[Dict[str, Any]] = None,
         json: Any = None,
-        filenames: Optional[List[str]] = None,
-        return_type: Literal["json", "text", "content"] = "json",
+        filenames: Optional[List[UploadSource]] = None,
+        return_type: ReturnType = "json",
+        cacheable: bool = False,
     ) -> Any:
-        if filenames is not None:
-            files = {
-                "upload": (Path(filename).name, open(filename, "rb"))
-                for filename in filenames
-            }
-            response = request(
-                method=method,
-                url=self.get_url(path),
-                params=params,
-                headers=self.headers_with_auth,
-                files=files,
-                json=json,
-            )
-        else:
-            response = request(
-                method=method,
-                url=self.get_url(path),
-                params=params,
-                headers=self.headers_with_auth,
-                json=json,
+        cache_key, content, headers = self.lookup_cache(method, path, params, cacheable)
+        if content is not None:
+            return self.decode_content(content, return_type)
+        data = None if json is None else self.json_codec.dumps(json)
+        try:
+            response = self.send_with_retry(
+                method, path, params, data, filenames, headers
             )
+        finally:
+            self.invalidate_cache(method, path)
+        if self.cache is not None and cache_key is not None:
+            if response.status_code == 304:
+                content = self.cache.revalidate(cache_key)
+                if content is None:
+                    return self.request(
+                        method, path, params, return_type=return_type, cacheable=True
+                    )
+                return self.decode_content(content, return_type)
+            if response.ok:
+                self.cache.store(
+                    cache_key, response.content, response.headers.get("ETag")
+                )
         response.raise_for_status()
         if return_type == "json":
-            return response.json()
+            return self.json_codec.loads(response.content)
         elif return_type == "text":
             return response.text
         elif return_type == "content":
             return response.content
+
+    @contextmanager
+    def stream(
+        self,
+        method: Method,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Iterator[Response]:
+        response = self.send_with_retry(
+            method, path, params, headers=headers, stream=True
+        )
+        try:
+            response.raise_for_status()
+            yield response
+        finally:
+            response.close()
+
+    def call(self, api_call: APICall[T]) -> T:
+        return api_call.parse(
+            self.request(
+                method=api_call.method,
+                path=api_call.path,
+                params=api_call.params,
+                json=api_call.json,
+                filenames=api_call.filenames,
+                return_type=api_call.return_type,
+                cacheable=api_call.cacheable,
+            )
+        )
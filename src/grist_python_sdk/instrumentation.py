@@ -0,0 +1,123 @@
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional
+
+from .optional import import_optional
+
+PATH_PARAMS = {
+    "orgs": "org_id",
+    "workspaces": "workspace_id",
+    "docs": "doc_id",
+    "tables": "table_id",
+    "columns": "col_id",
+    "attachments": "attachment_id",
+    "webhooks": "webhook_id",
+}
+NUMERIC_PARAMS = {"attachments", "workspaces"}
+LITERAL_SEGMENTS = {"queue"}
+
+
+@lru_cache(maxsize=1024)
+def path_template(path: str) -> str:
+    segments = path.strip("/").split("/")
+    for i in range(1, len(segments)):
+        collection = segments[i - 1]
+        segment = segments[i]
+        if (
+            collection not in PATH_PARAMS
+            or segment in LITERAL_SEGMENTS
+            or (collection in NUMERIC_PARAMS and not segment.isdigit())
+        ):
+            continue
+        segments[i] = f"{{{PATH_PARAMS[collection]}}}"
+    return "/".join(segments)
+
+
+@dataclass
+class RequestEvent:
+    method: str
+    path: str
+    status: Optional[int]
+    started_at: float
+    latency: float
+    request_bytes: Optional[int]
+    response_bytes: Optional[int]
+    retries: int = 0
+    error: Optional[BaseException] = None
+
+    @property
+    def path_template(self) -> str:
+        return path_template(self.path)
+
+
+RequestListener = Callable[[RequestEvent], None]
+
+
+class OpenTelemetryListener:
+    def __init__(self, tracer: Any = None) -> None:
+        self.trace = import_optional("opentelemetry.trace", "otel")
+        self.tracer = tracer or self.trace.get_tracer("grist_python_sdk")
+
+    def __call__(self, event: RequestEvent) -> None:
+        start = int(event.started_at * 1e9)
+        attributes: Dict[str, Any] = {
+            "http.request.method": event.method.upper(),
+            "url.template": event.path_template,
+            "grist.retries": event.retries,
+        }
+        if event.status is not None:
+            attributes["http.response.status_code"] = event.status
+        if event.request_bytes is not None:
+            attributes["http.request.body.size"] = event.request_bytes
+        if event.response_bytes is not None:
+            attributes["http.response.body.size"] = event.response_bytes
+        span = self.tracer.start_span(
+            f"{event.method.upper()} {event.path_template}",
+            kind=self.trace.SpanKind.CLIENT,
+            attributes=attributes,
+            start_time=start,
+        )
+        if event.error is not None:
+            span.record_exception(event.error)
+        if event.error is not None or (event.status or 0) >= 400:
+            span.set_status(self.trace.Status(self.trace.StatusCode.ERROR))
+        span.end(end_time=start + int(event.latency * 1e9))
+
+
+class PrometheusListener:
+    def __init__(self, registry: Any = None, namespace: str = "grist") -> None:
+        prometheus = import_optional("prometheus_client", "prometheus")
+        registry = registry or prometheus.REGISTRY
+        self.latency = prometheus.Histogram(
+            "request_duration_seconds",
+            "Grist API request latency",
+            ["method", "path_template", "status"],
+            namespace=namespace,
+            registry=registry,
+        )
+        self.bytes = prometheus.Counter(
+            "request_bytes",
+            "Grist API payload bytes",
+            ["method", "path_template", "direction"],
+            namespace=namespace,
+            registry=registry,
+        )
+        self.retries = prometheus.Counter(
+            "request_retries",
+            "Grist API request retries",
+            ["method", "path_template"],
+            namespace=namespace,
+            registry=registry,
+        )
+
+    def __call__(self, event: RequestEvent) -> None:
+        method = event.method.upper()
+        template = event.path_template
+        status = "error" if event.status is None else str(event.status)
+        self.latency.labels(method, template, status).observe(event.latency)
+        if event.request_bytes:
+            self.bytes.labels(method, template, "sent").inc(event.request_bytes)
+        if event.response_bytes:
+            self.bytes.labels(method, template, "received").inc(event.response_bytes)
+        if event.retries:
+            self.retries.labels(method, template).inc(event.retries)
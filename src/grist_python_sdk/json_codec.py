@@ -0,0 +1,69 @@
+import json
+from importlib import import_module
+from typing import Any, Protocol, Union
+
+
+class JSONCodec(Protocol):
+    name: str
+
+    def dumps(self, obj: Any) -> bytes: ...
+
+    def loads(self, data: Union[bytes, str]) -> Any: ...
+
+
+class StdlibJSONCodec:
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(
+            obj, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+        ).encode()
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec:
+    name = "orjson"
+
+    def __init__(self) -> None:
+        self.orjson = import_module("orjson")
+
+    def dumps(self, obj: Any) -> bytes:
+        dumped: bytes = self.orjson.dumps(
+            obj,
+            option=self.orjson.OPT_NON_STR_KEYS | self.orjson.OPT_PASSTHROUGH_DATETIME,
+        )
+        return dumped
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self.orjson.loads(data)
+
+
+class UjsonCodec:
+    name = "ujson"
+
+    def __init__(self) -> None:
+        self.ujson = import_module("ujson")
+
+    def dumps(self, obj: Any) -> bytes:
+        dumped: str = self.ujson.dumps(
+            obj, ensure_ascii=False, escape_forward_slashes=False
+        )
+        return dumped.encode()
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self.ujson.loads(data)
+
+
+def default_codec() -> JSONCodec:
+    return StdlibJSONCodec()
+
+
+def fast_codec() -> JSONCodec:
+    for codec in (OrjsonCodec, UjsonCodec):
+        try:
+            return codec()
+        except ImportError:
+            continue
+    return StdlibJSONCodec()
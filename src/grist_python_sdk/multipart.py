@@ -0,0 +1,146 @@
+import io
+import os
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import (
+    AsyncIterator,
+    BinaryIO,
+    Generator,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+UploadSource = Union[
+    str, "os.PathLike[str]", Tuple[str, Union[bytes, bytearray, BinaryIO]]
+]
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+class UploadPart:
+    def __init__(self, source: UploadSource) -> None:
+        self.path: Optional[Path] = None
+        self.data: Optional[bytes] = None
+        self.file: Optional[BinaryIO] = None
+        self.start = 0
+        if isinstance(source, (str, os.PathLike)):
+            self.path = Path(source)
+            self.filename = self.path.name
+            self.size = self.path.stat().st_size
+        else:
+            self.filename, data = source
+            if isinstance(data, (bytes, bytearray)):
+                self.data = bytes(data)
+                self.size = len(self.data)
+            else:
+                self.file = data
+                self.start = data.tell()
+                self.size = data.seek(0, io.SEEK_END) - self.start
+                data.seek(self.start)
+
+    @contextmanager
+    def open(self) -> Iterator[BinaryIO]:
+        if self.path is not None:
+            with open(self.path, "rb") as f:
+                yield f
+        elif self.data is not None:
+            yield io.BytesIO(self.data)
+        else:
+            assert self.file is not None
+            self.file.seek(self.start)
+            yield self.file
+
+
+UploadItem = Union[UploadSource, UploadPart]
+
+
+def upload_parts(sources: Sequence[UploadItem]) -> List[UploadPart]:
+    return [
+        source if isinstance(source, UploadPart) else UploadPart(source)
+        for source in sources
+    ]
+
+
+class MultipartStream:
+    def __init__(
+        self,
+        sources: Sequence[UploadItem],
+        field_name: str = "upload",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        self.boundary = uuid.uuid4().hex
+        self.chunk_size = chunk_size
+        self.parts = [
+            (self.part_header(field_name, part.filename), part)
+            for part in upload_parts(sources)
+        ]
+        self.footer = f"--{self.boundary}--\r\n".encode()
+        self.length = len(self.footer) + sum(
+            len(header) + part.size + 2 for header, part in self.parts
+        )
+        self.chunks = self.iter_chunks()
+        self.buffer = b""
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def part_header(self, field_name: str, filename: str) -> bytes:
+        quoted = filename.replace("\\", "\\\\").replace('"', "%22")
+        return (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{field_name}"; '
+            f'filename="{quoted}"\r\n'
+            "Content-Type: application/octet-stream\r\n\r\n"
+        ).encode()
+
+    def __len__(self) -> int:
+        return self.length
+
+    def iter_chunks(self) -> Generator[bytes, None, None]:
+        for header, part in self.parts:
+            yield header
+            with part.open() as f:
+                remaining = part.size
+                while remaining > 0:
+                    chunk = f.read(min(self.chunk_size, remaining))
+                    if not chunk:
+                        raise ValueError(f"{part.filename} changed while uploading")
+                    remaining -= len(chunk)
+                    yield chunk
+            yield b"\r\n"
+        yield self.footer
+
+    def __iter__(self) -> Iterator[bytes]:
+        return self.chunks
+
+    async def aiter_chunks(self) -> AsyncIterator[bytes]:
+        for chunk in self.chunks:
+            yield chunk
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            data = self.buffer + b"".join(self.chunks)
+            self.buffer = b""
+            return data
+        while len(self.buffer) < size:
+            chunk = next(self.chunks, None)
+            if chunk is None:
+                break
+            self.buffer += chunk
+        data, self.buffer = self.buffer[:size], self.buffer[size:]
+        return data
+
+    def close(self) -> None:
+        self.chunks.close()
+
+    def __enter__(self) -> "MultipartStream":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
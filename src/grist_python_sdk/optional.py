@@ -0,0 +1,19 @@
+from importlib import import_module
+from typing import Any
+
+
+def import_optional(module: str, extra: str) -> Any:
+    try:
+        return import_module(module)
+    except ImportError as e:
+        raise ImportError(
+            f"{module} is required for this feature; "
+            f"install it with `pip install grist-python-sdk[{extra}]`"
+        ) from e
+
+
+def find_optional(module: str) -> Any:
+    try:
+        return import_module(module)
+    except ImportError:
+        return None
@@ -0,0 +1,82 @@
+import asyncio
+import threading
+import time
+from typing import Callable, Dict, Literal, Optional
+
+EndpointClass = Literal["read", "write", "attachment"]
+
+
+def classify_endpoint(method: str, path: str) -> EndpointClass:
+    segments = path.strip("/").split("/")
+    if "attachments" in segments:
+        return "attachment"
+    if method.lower() == "get" or segments[-1] == "sql":
+        return "read"
+    return "write"
+
+
+class TokenBucket:
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self.clock = clock
+        self.tokens = self.capacity
+        self.updated_at = clock()
+        self.lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        with self.lock:
+            now = self.clock()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.updated_at) * self.rate
+            )
+            self.updated_at = now
+            self.tokens -= tokens
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+    def acquire(self, tokens: float = 1.0) -> None:
+        delay = self.reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, tokens: float = 1.0) -> None:
+        delay = self.reserve(tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class RateLimiter:
+    def __init__(
+        self,
+        read: Optional[TokenBucket] = None,
+        write: Optional[TokenBucket] = None,
+        attachment: Optional[TokenBucket] = None,
+    ) -> None:
+        self.buckets: Dict[EndpointClass, Optional[TokenBucket]] = {
+            "read": read,
+            "write": write,
+            "attachment": attachment,
+        }
+
+    def reserve(self, method: str, path: str) -> float:
+        bucket = self.buckets[classify_endpoint(method, path)]
+        return 0.0 if bucket is None else bucket.reserve()
+
+    def acquire(self, method: str, path: str) -> None:
+        delay = self.reserve(method, path)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, method: str, path: str) -> None:
+        delay = self.reserve(method, path)
+        if delay > 0:
+            await asyncio.sleep(delay)
@@ -0,0 +1,190 @@
+import hmac
+import json
+import logging
+import threading
+import time
+from collections import deque
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+from urllib.parse import parse_qs
+
+logger = logging.getLogger(__name__)
+
+WebhookRow = Dict[str, Any]
+BatchHandler = Callable[[List[WebhookRow]], None]
+ErrorHandler = Callable[[BaseException, List[WebhookRow]], None]
+StartResponse = Callable[[str, List[Tuple[str, str]]], Any]
+ASGIReceive = Callable[[], Awaitable[Dict[str, Any]]]
+ASGISend = Callable[[Dict[str, Any]], Awaitable[None]]
+
+STATUS_LINES = {
+    200: "200 OK",
+    400: "400 Bad Request",
+    403: "403 Forbidden",
+    405: "405 Method Not Allowed",
+    503: "503 Service Unavailable",
+}
+
+
+def parse_payload(body: bytes) -> List[WebhookRow]:
+    rows = json.loads(body)
+    if not isinstance(rows, list) or not all(
+        isinstance(row, dict) and "id" in row for row in rows
+    ):
+        raise ValueError("webhook payload must be a list of records with ids")
+    return rows
+
+
+def dedupe_rows(rows: Iterable[WebhookRow]) -> List[WebhookRow]:
+    return list({row["id"]: row for row in rows}.values())
+
+
+class WebhookReceiver:
+    def __init__(
+        self,
+        handler: BatchHandler,
+        token: Optional[str] = None,
+        max_batch: int = 500,
+        max_delay: float = 0.5,
+        max_pending: int = 10000,
+        on_error: Optional[ErrorHandler] = None,
+    ) -> None:
+        self.handler = handler
+        self.token = token
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.max_pending = max_pending
+        self.on_error = on_error
+        self.pending: Deque[WebhookRow] = deque()
+        self.condition = threading.Condition()
+        self.handler_lock = threading.Lock()
+        self.worker: Optional[threading.Thread] = None
+        self.stopping = False
+
+    def __enter__(self) -> "WebhookReceiver":
+        self.start()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        if self.worker is not None:
+            return
+        self.stopping = False
+        self.worker = threading.Thread(target=self.run, daemon=True)
+        self.worker.start()
+
+    def stop(self) -> None:
+        with self.condition:
+            self.stopping = True
+            self.condition.notify_all()
+        if self.worker is not None:
+            self.worker.join()
+            self.worker = None
+        self.flush()
+
+    def submit(self, rows: List[WebhookRow]) -> bool:
+        with self.condition:
+            if len(self.pending) + len(rows) > self.max_pending:
+                return False
+            self.pending.extend(rows)
+            self.condition.notify_all()
+            return True
+
+    def take_batch(self) -> List[WebhookRow]:
+        with self.condition:
+            count = min(len(self.pending), self.max_batch)
+            return [self.pending.popleft() for _ in range(count)]
+
+    def process(self, batch: List[WebhookRow]) -> None:
+        if not batch:
+            return
+        with self.handler_lock:
+            try:
+                self.handler(dedupe_rows(batch))
+            except Exception as e:
+                if self.on_error is None:
+                    logger.exception("webhook handler failed for %d rows", len(batch))
+                else:
+                    self.on_error(e, batch)
+
+    def flush(self) -> None:
+        while batch := self.take_batch():
+            self.process(batch)
+
+    def run(self) -> None:
+        while True:
+            with self.condition:
+                self.condition.wait_for(lambda: self.pending or self.stopping)
+                if self.stopping:
+                    return
+                deadline = time.monotonic() + self.max_delay
+                while len(self.pending) < self.max_batch and not self.stopping:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self.condition.wait(remaining)
+            self.process(self.take_batch())
+
+    def authorized(self, query: str) -> bool:
+        if self.token is None:
+            return True
+        tokens = parse_qs(query).get("token", [])
+        return any(hmac.compare_digest(token, self.token) for token in tokens)
+
+    def receive(self, method: str, query: str, body: bytes) -> int:
+        if method != "POST":
+            return 405
+        if not self.authorized(query):
+            return 403
+        try:
+            rows = parse_payload(body)
+        except ValueError:
+            return 400
+        return 200 if self.submit(rows) else 503
+
+    def __call__(
+        self, environ: Dict[str, Any], start_response: StartResponse
+    ) -> List[bytes]:
+        length = int(environ.get("CONTENT_LENGTH") or 0)
+        body = environ["wsgi.input"].read(length) if length else b""
+        status = self.receive(
+            environ["REQUEST_METHOD"], environ.get("QUERY_STRING", ""), body
+        )
+        headers = [("Content-Type", "text/plain"), ("Content-Length", "0")]
+        if status == 503:
+            headers.append(("Retry-After", "1"))
+        start_response(STATUS_LINES[status], headers)
+        return [b""]
+
+    async def asgi(
+        self, scope: Dict[str, Any], receive: ASGIReceive, send: ASGISend
+    ) -> None:
+        if scope["type"] != "http":
+            return
+        chunks = []
+        while True:
+            message = await receive()
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body"):
+                break
+        status = self.receive(
+            scope["method"], scope.get("query_string", b"").decode(), b"".join(chunks)
+        )
+        headers = [(b"content-type", b"text/plain"), (b"content-length", b"0")]
+        if status == 503:
+            headers.append((b"retry-after", b"1"))
+        await send(
+            {"type": "http.response.start", "status": status, "headers": headers}
+        )
+        await send({"type": "http.response.body", "body": b""})
@@ -0,0 +1,227 @@
+import asyncio
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+
+import httpx
+
+from grist_python_sdk.aio.attachment import iter_attachment_chunks, upload_attachments
+from grist_python_sdk.aio.client import AsyncGristAPIClient
+from grist_python_sdk.aio.document import create_doc
+from grist_python_sdk.aio.export import download_doc, export_doc
+from grist_python_sdk.aio.fanout import fan_out
+from grist_python_sdk.aio.record import add_records, fetch_records, iter_records
+from grist_python_sdk.aio.sql import iter_sql
+from grist_python_sdk.aio.table import list_tables_info
+from grist_python_sdk.api.fanout import summarize_outcomes
+
+api_key = "your_api_key"
+mock_root_url = "https://example.com"
+
+
+def make_client(
+    routes: Dict[str, Any], seen: List[httpx.Request]
+) -> AsyncGristAPIClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        body = routes[f"{request.method} {request.url.path}"]
+        if isinstance(body, str):
+            return httpx.Response(200, text=body)
+        return httpx.Response(200, json=body)
+
+    return AsyncGristAPIClient(
+        mock_root_url, api_key, transport=httpx.MockTransport(handler)
+    )
+
+
+def test_async_fetch_records() -> None:
+    expected_records = [
+        {"id": 1, "fields": {"pet": "cat", "popularity": 67}},
+        {"id": 2, "fields": {"pet": "dog", "popularity": 95}},
+    ]
+    seen: List[httpx.Request] = []
+    client = make_client(
+        {"GET /api/docs/145/tables/Pets/records": {"records": expected_records}}, seen
+    )
+
+    records = asyncio.run(fetch_records(client, "145", "Pets", limitnumber=5))
+
+    assert records == expected_records
+    assert seen[0].url.params["limit"] == "5"
+
+
+def test_async_add_records() -> None:
+    seen: List[httpx.Request] = []
+    client = make_client(
+        {"POST /api/docs/145/tables/Pets/records": {"records": [{"id": 1}]}}, seen
+    )
+
+    ids = asyncio.run(add_records(client, "145", "Pets", [{"pet": "cat"}]))
+
+    assert ids == [1]
+    assert json.loads(seen[0].content) == {"records": [{"fields": {"pet": "cat"}}]}
+
+
+def test_async_fan_out_over_docs() -> None:
+    routes: Dict[str, Any] = {
+        f"GET /api/docs/doc{i}/tables": {
+            "tables": [
+                {"id": f"Table{i}", "fields": {"tableRef": i, "onDemand": False}}
+            ]
+        }
+        for i in range(10)
+    }
+    routes["POST /api/workspaces/1/docs"] = '"newdoc"'
+    seen: List[httpx.Request] = []
+    client = make_client(routes, seen)
+
+    async def run() -> List[Any]:
+        return await asyncio.gather(
+            *(list_tables_info(client, f"doc{i}") for i in range(10)),
+            create_doc(client, 1, "New"),
+        )
+
+    results = asyncio.run(run())
+
+    assert [tables[0]["id"] for tables in results[:10]] == [
+        f"Table{i}" for i in range(10)
+    ]
+    assert results[10] == "newdoc"
+
+
+def test_async_iter_records() -> None:
+    seen: List[httpx.Request] = []
+    client = make_client(
+        {
+            "POST /api/docs/145/sql": {"records": [{"fields": {"id": 1}}]},
+            "GET /api/docs/145/tables/Pets/records": {
+                "records": [{"id": 1, "fields": {"pet": "cat"}}]
+            },
+        },
+        seen,
+    )
+
+    async def run() -> List[Any]:
+        return [record async for record in iter_records(client, "145", "Pets")]
+
+    assert asyncio.run(run()) == [{"id": 1, "fields": {"pet": "cat"}}]
+    assert seen[1].url.params["filter"] == '{"id":[1]}'
+
+
+def test_async_iter_attachment_chunks() -> None:
+    seen: List[httpx.Request] = []
+    client = make_client(
+        {"GET /api/docs/145/attachments/1/download": "0123456789"}, seen
+    )
+
+    async def run() -> bytes:
+        chunks = [
+            chunk
+            async for chunk in iter_attachment_chunks(client, "145", 1, chunk_size=4)
+        ]
+        return b"".join(chunks)
+
+    assert asyncio.run(run()) == b"0123456789"
+
+
+def test_async_upload_attachments() -> None:
+    seen: List[httpx.Request] = []
+    client = make_client({"POST /api/docs/145/attachments": [7]}, seen)
+    sources: List[Any] = [("a.txt", b"first"), ("b.txt", b"second")]
+
+    ids = asyncio.run(upload_attachments(client, "145", sources, batch_size=1))
+
+    assert ids == [7, 7]
+    assert len(seen) == 2
+    assert seen[0].headers["Content-Type"].startswith("multipart/form-data")
+    assert seen[0].headers["Content-Length"] == str(len(seen[0].content))
+    assert b'filename="a.txt"' in seen[0].content
+    assert b"second" in seen[1].content
+
+
+def test_async_iter_sql() -> None:
+    seen: List[httpx.Request] = []
+    rows = [{"fields": {"id": 1}}, {"fields": {"id": 2}}]
+    client = make_client({"POST /api/docs/145/sql": {"records": rows}}, seen)
+
+    async def run() -> List[Dict[str, Any]]:
+        return [
+            row
+            async for row in iter_sql(client, "145", "SELECT id FROM Pets ORDER BY id")
+        ]
+
+    assert asyncio.run(run()) == [{"id": 1}, {"id": 2}]
+    assert json.loads(seen[0].content)["args"] == [1000, 0]
+
+
+def test_async_export_doc(tmp_path: Path) -> None:
+    seen: List[httpx.Request] = []
+    client = make_client(
+        {
+            "GET /api/docs/145/tables": {
+                "tables": [{"id": "Pets", "fields": {"tableRef": 1, "onDemand": False}}]
+            },
+            "GET /api/docs/145/tables/Pets/columns": {
+                "columns": [{"id": "pet", "fields": {"type": "Text"}}]
+            },
+            "POST /api/docs/145/sql": {"records": [{"fields": {"id": 1}}]},
+            "GET /api/docs/145/tables/Pets/records": {
+                "records": [{"id": 1, "fields": {"pet": "cat"}}]
+            },
+            "GET /api/docs/145/download/xlsx": "xlsx-bytes",
+        },
+        seen,
+    )
+
+    result = asyncio.run(export_doc(client, "145", tmp_path, "csv"))
+    size = asyncio.run(download_doc(client, "145", tmp_path / "doc.xlsx", "xlsx"))
+
+    assert [(table.table_id, table.rows) for table in result.tables] == [("Pets", 1)]
+    assert (tmp_path / "Pets.csv").read_text().splitlines() == ["id,pet", "1,cat"]
+    assert size == 10
+    assert (tmp_path / "doc.xlsx").read_bytes() == b"xlsx-bytes"
+
+
+def test_async_fan_out_helper() -> None:
+    routes: Dict[str, Any] = {
+        "GET /api/orgs/1/workspaces": [
+            {
+                "id": 10,
+                "name": "ws",
+                "access": "owners",
+                "docs": [
+                    {
+                        "id": f"doc{i}",
+                        "name": f"Doc {i}",
+                        "access": "owners",
+                        "isPinned": False,
+                    }
+                    for i in range(4)
+                ],
+            }
+        ]
+    }
+    for i in range(3):
+        routes[f"GET /api/docs/doc{i}/tables"] = {
+            "tables": [
+                {"id": f"Table{i}", "fields": {"tableRef": i, "onDemand": False}}
+            ]
+        }
+    seen: List[httpx.Request] = []
+    client = make_client(routes, seen)
+
+    async def run() -> List[Any]:
+        return [
+            outcome
+            async for outcome in fan_out(client, 1, list_tables_info, max_concurrency=2)
+        ]
+
+    outcomes = asyncio.run(run())
+
+    results = {o.target.doc_id: o.result for o in outcomes if o.ok}
+    assert results == {
+        f"doc{i}": [{"id": f"Table{i}", "fields": {"tableRef": i, "onDemand": False}}]
+        for i in range(3)
+    }
+    assert [o.target.doc_id for o in outcomes if not o.ok] == ["doc3"]
+    assert summarize_outcomes(outcomes).failed == 1
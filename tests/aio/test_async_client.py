@@ -0,0 +1,84 @@
+import asyncio
+from typing import List
+
+import httpx
+import pytest
+from grist_python_sdk.aio.client import AsyncGristAPIClient
+from grist_python_sdk.call import APICall
+
+api_key = "your_api_key"
+mock_root_url = "https://example.com"
+
+
+def test_async_client_request() -> None:
+    seen: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"abc": "value"})
+
+    async def run() -> None:
+        async with AsyncGristAPIClient(
+            mock_root_url, api_key, transport=httpx.MockTransport(handler)
+        ) as client:
+            result = await client.request(
+                "get", "path", params={"param": "value", "unset": None}
+            )
+            assert result == {"abc": "value"}
+
+    asyncio.run(run())
+    assert str(seen[0].url) == "https://example.com/api/path?param=value"
+    assert seen[0].headers["Authorization"] == f"Bearer {api_key}"
+
+
+def test_async_client_request_raises_on_error() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(401)
+
+    async def run() -> None:
+        async with AsyncGristAPIClient(
+            mock_root_url, api_key, transport=httpx.MockTransport(handler)
+        ) as client:
+            await client.request("get", "path")
+
+    with pytest.raises(httpx.HTTPStatusError, match="Unauthorized"):
+        asyncio.run(run())
+
+
+def test_async_client_call_parses_response() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, text='"doc"')
+
+    async def run() -> str:
+        async with AsyncGristAPIClient(
+            mock_root_url, api_key, transport=httpx.MockTransport(handler)
+        ) as client:
+            api_call = APICall("post", "path", str.upper, return_type="text")
+            return await client.call(api_call)
+
+    assert asyncio.run(run()) == '"DOC"'
+
+
+def test_async_client_bounds_concurrency() -> None:
+    in_flight = 0
+    max_in_flight = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={})
+
+    async def run() -> None:
+        async with AsyncGristAPIClient(
+            mock_root_url,
+            api_key,
+            max_concurrency=3,
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            await asyncio.gather(*(client.request("get", "path") for _ in range(20)))
+
+    asyncio.run(run())
+    assert max_in_flight == 3
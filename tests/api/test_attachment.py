@@ -1,14 +1,23 @@
+import hashlib
+import io
 import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any, List
 
 import pytest
+from requests_mock import Mocker
+
 from grist_python_sdk.api.attachment import (
+    DownloadResult,
+    download_attachment,
     download_attachment_contents,
     get_attachment_metadata,
+    iter_attachment_chunks,
     list_attachments_metadata,
     upload_attachments,
 )
 from grist_python_sdk.client import GristAPIClient
-from requests_mock import Mocker
 
 api_key = "your_api_key"
 mock_root_url = "https://example.com"
@@ -68,6 +77,59 @@ def test_upload_attachments(
         assert response == expected_response
 
 
+def test_upload_attachments_sends_every_file(
+    grist_client: GristAPIClient, requests_mock: Mocker, tmp_path: Path
+) -> None:
+    doc_id = "145"
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"file{i}.txt"
+        path.write_bytes(f"contents{i}".encode())
+        paths.append(str(path))
+    bodies = []
+
+    def respond(request: Any, context: Any) -> List[int]:
+        bodies.append(request.body.read())
+        assert request.headers["Content-Length"] == str(len(bodies[-1]))
+        return [101, 102, 103, 104]
+
+    requests_mock.post(f"{mock_root_url}/api/docs/{doc_id}/attachments", json=respond)
+
+    response = upload_attachments(
+        grist_client, doc_id, [*paths, ("memory.bin", b"in memory")]
+    )
+
+    assert response == [101, 102, 103, 104]
+    assert requests_mock.last_request is not None
+    content_type = requests_mock.last_request.headers["Content-Type"]
+    assert content_type.startswith("multipart/form-data; boundary=")
+    assert bodies[0].count(b'name="upload"') == 4
+    for i in range(3):
+        assert f'filename="file{i}.txt"'.encode() in bodies[0]
+        assert f"contents{i}".encode() in bodies[0]
+    assert b"in memory" in bodies[0]
+
+
+def test_upload_attachments_in_batches(
+    grist_client: GristAPIClient, requests_mock: Mocker
+) -> None:
+    doc_id = "145"
+    sources: List[Any] = [(f"file{i}.txt", f"{i}".encode()) for i in range(5)]
+
+    def respond(request: Any, context: Any) -> List[int]:
+        body = request.body.read()
+        return [100 + i for i in range(5) if f'filename="file{i}.txt"'.encode() in body]
+
+    requests_mock.post(f"{mock_root_url}/api/docs/{doc_id}/attachments", json=respond)
+
+    response = upload_attachments(
+        grist_client, doc_id, sources, batch_size=2, max_workers=3
+    )
+
+    assert response == [100, 101, 102, 103, 104]
+    assert requests_mock.call_count == 3
+
+
 def test_get_attachment_metadata(
     grist_client: GristAPIClient, requests_mock: Mocker
 ) -> None:
@@ -89,6 +151,11 @@ def test_get_attachment_metadata(
     metadata = get_attachment_metadata(grist_client, doc_id, attachment_id)
     assert metadata == expected_metadata
 
+    metadata = get_attachment_metadata(
+        grist_client, doc_id, attachment_id, timestamps="eager"
+    )
+    assert metadata["timeUploaded"] == datetime(2020, 2, 13, 12, 17, 19)
+
 
 def test_download_attachment_contents(
     grist_client: GristAPIClient, requests_mock: Mocker
@@ -105,3 +172,77 @@ def test_download_attachment_contents(
 
     contents = download_attachment_contents(grist_client, doc_id, attachment_id)
     assert contents == expected_contents
+
+
+def test_iter_attachment_chunks(
+    grist_client: GristAPIClient, requests_mock: Mocker
+) -> None:
+    requests_mock.get(
+        f"{mock_root_url}/api/docs/145/attachments/1/download",
+        content=b"0123456789",
+    )
+
+    chunks = list(iter_attachment_chunks(grist_client, "145", 1, chunk_size=4))
+
+    assert chunks == [b"0123", b"4567", b"89"]
+
+
+def test_download_attachment_to_stream_with_checksum(
+    grist_client: GristAPIClient, requests_mock: Mocker
+) -> None:
+    contents = b"attachment_contents" * 100
+    requests_mock.get(
+        f"{mock_root_url}/api/docs/145/attachments/1/download", content=contents
+    )
+    buffer = io.BytesIO()
+
+    result = download_attachment(
+        grist_client, "145", 1, buffer, chunk_size=64, checksum="sha256"
+    )
+
+    assert buffer.getvalue() == contents
+    assert result.size == len(contents)
+    assert result.checksum == hashlib.sha256(contents).hexdigest()
+
+
+def test_download_attachment_resumes_partial_file(
+    grist_client: GristAPIClient, requests_mock: Mocker, tmp_path: Path
+) -> None:
+    contents = b"0123456789"
+    destination = tmp_path / "file.bin"
+    destination.write_bytes(contents[:4])
+
+    def respond(request: Any, context: Any) -> bytes:
+        start = int(request.headers["Range"].removeprefix("bytes=").rstrip("-"))
+        context.status_code = 206
+        return contents[start:]
+
+    requests_mock.get(
+        f"{mock_root_url}/api/docs/145/attachments/1/download", content=respond
+    )
+
+    result = download_attachment(
+        grist_client, "145", 1, destination, checksum="md5", resume=True
+    )
+
+    assert destination.read_bytes() == contents
+    assert result == DownloadResult(10, hashlib.md5(contents).hexdigest(), True)
+
+
+def test_download_attachment_resume_of_complete_file(
+    grist_client: GristAPIClient, requests_mock: Mocker, tmp_path: Path
+) -> None:
+    destination = tmp_path / "file.bin"
+    destination.write_bytes(b"0123456789")
+    requests_mock.get(
+        f"{mock_root_url}/api/docs/145/attachments/1/download", status_code=416
+    )
+    requests_mock.get(
+        f"{mock_root_url}/api/docs/145/attachments/1",
+        json={"fileName": "file.bin", "fileSize": 10, "timeUploaded": "x"},
+    )
+
+    result = download_attachment(grist_client, "145", 1, destination, resume=True)
+
+    assert result == DownloadResult(10, None, True)
+    assert destination.read_bytes() == b"0123456789"
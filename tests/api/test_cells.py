@@ -0,0 +1,203 @@
+from datetime import date, datetime, timezone
+from typing import Any, Dict, List
+
+import pytest
+from requests_mock import Mocker
+from zoneinfo import ZoneInfo
+
+from grist_python_sdk.api.cells import (
+    CellCodec,
+    CellError,
+    decode_cell,
+    encode_cell,
+    fetch_codec,
+)
+from grist_python_sdk.api.record import add_records, fetch_columns, fetch_records
+from grist_python_sdk.client import GristAPIClient
+
+api_key = "your_api_key"
+mock_root_url = "https://example.com"
+
+column_types: Dict[str, Any] = {
+    "Born": "Date",
+    "Seen": "DateTime:America/New_York",
+    "Pet": "Ref:Pets",
+    "Toys": "RefList:Toys",
+    "Tags": "ChoiceList",
+    "Name": "Text",
+}
+
+raw_fields: List[Dict[str, Any]] = [
+    {
+        "Born": 1577836800,
+        "Seen": 1577836800.5,
+        "Pet": 3,
+        "Toys": ["L", 1, 2],
+        "Tags": ["L", "a"],
+        "Name": "Rex",
+    },
+    {
+        "Born": None,
+        "Seen": ["E", "TypeError", "bad"],
+        "Pet": 0,
+        "Toys": None,
+        "Tags": None,
+        "Name": ["E", "ValueError", "oops"],
+    },
+]
+
+new_york = ZoneInfo("America/New_York")
+decoded_fields: List[Dict[str, Any]] = [
+    {
+        "Born": date(2020, 1, 1),
+        "Seen": datetime(2020, 1, 1, 0, 0, 0, 500000, timezone.utc).astimezone(
+            new_york
+        ),
+        "Pet": 3,
+        "Toys": [1, 2],
+        "Tags": ["a"],
+        "Name": "Rex",
+    },
+    {
+        "Born": None,
+        "Seen": CellError("TypeError", "bad"),
+        "Pet": None,
+        "Toys": None,
+        "Tags": None,
+        "Name": CellError("ValueError", "oops"),
+    },
+]
+
+
+@pytest.fixture
+def grist_client(requests_mock: Mocker) -> GristAPIClient:
+    return GristAPIClient(mock_root_url, api_key)
+
+
+@pytest.mark.parametrize("vectorize", [True, False])
+def test_decode_fields(vectorize: bool) -> None:
+    if vectorize:
+        pytest.importorskip("numpy")
+    codec = CellCodec(column_types, vectorize)
+
+    decoded = codec.decode_fields(raw_fields)
+
+    assert decoded == decoded_fields
+    assert decoded[0]["Seen"].tzinfo == new_york
+    assert raw_fields[0]["Toys"] == ["L", 1, 2]
+
+
+@pytest.mark.parametrize("vectorize", [True, False])
+def test_encode_fields(vectorize: bool) -> None:
+    if vectorize:
+        pytest.importorskip("numpy")
+    codec = CellCodec(column_types, vectorize)
+
+    encoded = codec.encode_fields(decoded_fields)
+
+    assert encoded == raw_fields
+
+
+def test_encode_numpy_datetimes() -> None:
+    np = pytest.importorskip("numpy")
+    codec = CellCodec({"Born": "Date", "Seen": "DateTime:UTC"})
+
+    columns = codec.encode_columns(
+        {
+            "Born": np.array(["2020-01-01", "NaT"], dtype="datetime64[D]"),
+            "Seen": np.array(["2020-01-01T00:00:01.5"], dtype="datetime64[ms]"),
+        }
+    )
+
+    assert columns == {"Born": [1577836800, None], "Seen": [1577836801.5]}
+
+
+def test_encode_fields_keeps_missing_keys() -> None:
+    codec = CellCodec({"Born": "Date"})
+
+    encoded = codec.encode_fields([{"Born": date(2020, 1, 1)}, {"Name": "Rex"}])
+
+    assert encoded == [{"Born": 1577836800}, {"Name": "Rex"}]
+
+
+def test_decode_and_encode_tagged_cells() -> None:
+    assert decode_cell(["d", 1577836800]) == date(2020, 1, 1)
+    assert decode_cell(["D", 1577836800, "UTC"]) == datetime(
+        2020, 1, 1, tzinfo=timezone.utc
+    )
+    assert decode_cell(["R", "Pets", 3]) == 3
+    assert decode_cell(["r", "Pets", [1, 2]]) == [1, 2]
+    assert decode_cell(["O", {"a": ["L", 1]}]) == {"a": [1]}
+    assert decode_cell(["P"]) == ["P"]
+    assert encode_cell(date(2020, 1, 1)) == ["d", 1577836800]
+    assert encode_cell(datetime(2020, 1, 1, tzinfo=new_york)) == [
+        "D",
+        1577854800.0,
+        "America/New_York",
+    ]
+    assert encode_cell({"a": (1, 2)}) == ["O", {"a": ["L", 1, 2]}]
+    assert encode_cell(CellError("TypeError", "bad", {"tb": ""})) == [
+        "E",
+        "TypeError",
+        "bad",
+        {"tb": ""},
+    ]
+
+
+def test_fetch_records_with_codec(
+    grist_client: GristAPIClient, requests_mock: Mocker
+) -> None:
+    requests_mock.get(
+        f"{mock_root_url}/api/docs/doc/tables/Table1/columns",
+        json={
+            "columns": [
+                {"id": col_id, "fields": {"type": col_type}}
+                for col_id, col_type in column_types.items()
+            ]
+        },
+    )
+    requests_mock.get(
+        f"{mock_root_url}/api/docs/doc/tables/Table1/records",
+        json={
+            "records": [
+                {"id": i + 1, "fields": fields} for i, fields in enumerate(raw_fields)
+            ]
+        },
+    )
+    requests_mock.get(
+        f"{mock_root_url}/api/docs/doc/tables/Table1/data",
+        json={"id": [1, 2], "Born": [1577836800, None]},
+    )
+
+    codec = fetch_codec(grist_client, "doc", "Table1")
+    records = fetch_records(grist_client, "doc", "Table1", codec=codec)
+    columns = fetch_columns(grist_client, "doc", "Table1", codec=codec)
+
+    assert codec.column_types == column_types
+    assert [record["fields"] for record in records] == decoded_fields
+    assert columns == {"id": [1, 2], "Born": [date(2020, 1, 1), None]}
+
+
+def test_add_records_with_codec(
+    grist_client: GristAPIClient, requests_mock: Mocker
+) -> None:
+    requests_mock.post(
+        f"{mock_root_url}/api/docs/doc/tables/Table1/records",
+        json={"records": [{"id": 1}, {"id": 2}]},
+    )
+
+    ids = add_records(
+        grist_client,
+        "doc",
+        "Table1",
+        decoded_fields,
+        chunk_size=1,
+        codec=CellCodec(column_types),
+    )
+
+    assert ids == [1, 2, 1, 2]
+    sent = [
+        request.json()["records"][0]["fields"]
+        for request in requests_mock.request_history
+    ]
+    assert sent == raw_fields
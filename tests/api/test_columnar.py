@@ -0,0 +1,45 @@
+import pytest
+from grist_python_sdk.api.columnar import to_arrow, to_numpy, to_pandas
+from grist_python_sdk.api.typing import ColumnarData
+
+columns: ColumnarData = {
+    "id": [1, 2, 3],
+    "pet": ["cat", "dog", "cat"],
+    "popularity": [67, 95, 12],
+}
+
+
+def test_to_numpy() -> None:
+    np = pytest.importorskip("numpy")
+
+    arrays = to_numpy(columns, dtypes={"popularity": "float64"})
+
+    assert arrays["id"].tolist() == [1, 2, 3]
+    assert arrays["popularity"].dtype == np.float64
+
+
+def test_to_pandas() -> None:
+    pytest.importorskip("pandas")
+
+    df = to_pandas(columns)
+
+    assert df.index.tolist() == [1, 2, 3]
+    assert df.loc[2, "pet"] == "dog"
+
+
+def test_to_arrow() -> None:
+    pytest.importorskip("pyarrow")
+
+    table = to_arrow(columns)
+
+    assert table.column_names == ["id", "pet", "popularity"]
+    assert table.num_rows == 3
+
+
+def test_missing_optional_dependency(monkeypatch: pytest.MonkeyPatch) -> None:
+    import sys
+
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+
+    with pytest.raises(ImportError, match=r"grist-python-sdk\[arrow\]"):
+        to_arrow(columns)
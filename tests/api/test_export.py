@@ -0,0 +1,179 @@
+import csv
+import io
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+from requests import HTTPError
+from requests_mock import Mocker
+
+from grist_python_sdk.api.export import (
+    SCHEMA_NAME,
+    ParquetWriter,
+    download_doc,
+    export_doc,
+    export_table,
+)
+from grist_python_sdk.client import GristAPIClient
+
+api_key = "your_api_key"
+mock_root_url = "https://example.com"
+
+columns: List[Dict[str, Any]] = [
+    {"id": "pet", "fields": {"type": "Text"}},
+    {"id": "born", "fields": {"type": "Date"}},
+    {"id": "toys", "fields": {"type": "RefList:Toys"}},
+]
+records: List[Dict[str, Any]] = [
+    {"id": 1, "fields": {"pet": "cat", "born": 1577836800, "toys": ["L", 1]}},
+    {"id": 2, "fields": {"pet": "dog", "born": None, "toys": None}},
+]
+
+
+@pytest.fixture
+def grist_client(requests_mock: Mocker) -> GristAPIClient:
+    return GristAPIClient(mock_root_url, api_key)
+
+
+def mock_table(requests_mock: Mocker, table_id: str, rows: List[Any]) -> None:
+    base = f"{mock_root_url}/api/docs/doc/tables/{table_id}"
+    requests_mock.get(f"{base}/columns", json={"columns": columns})
+    requests_mock.get(f"{base}/records", json={"records": rows})
+
+
+def mock_ids(requests_mock: Mocker, ids: Dict[str, List[int]]) -> None:
+    def respond(request: Any, context: Any) -> Dict[str, Any]:
+        payload = request.json()
+        table_id = payload["sql"].split('"')[1]
+        after_id = payload["args"][0]
+        rows = [{"fields": {"id": id}} for id in ids[table_id] if id > after_id]
+        return {"records": rows}
+
+    requests_mock.post(f"{mock_root_url}/api/docs/doc/sql", json=respond)
+
+
+def test_export_doc_jsonl(
+    grist_client: GristAPIClient, requests_mock: Mocker, tmp_path: Path
+) -> None:
+    requests_mock.get(
+        f"{mock_root_url}/api/docs/doc/tables",
+        json={
+            "tables": [
+                {"id": table_id, "fields": {"tableRef": i, "onDemand": False}}
+                for i, table_id in enumerate(["Pets", "Empty", "Broken"])
+            ]
+        },
+    )
+    mock_table(requests_mock, "Pets", records)
+    mock_table(requests_mock, "Empty", [])
+    requests_mock.get(
+        f"{mock_root_url}/api/docs/doc/tables/Broken/columns", status_code=500
+    )
+    mock_ids(requests_mock, {"Pets": [1, 2], "Empty": []})
+
+    result = export_doc(grist_client, "doc", tmp_path / "out", max_workers=2)
+
+    assert [(t.table_id, t.rows) for t in result.tables] == [("Pets", 2), ("Empty", 0)]
+    assert isinstance(result.failed["Broken"], HTTPError)
+    lines = (tmp_path / "out" / "Pets.jsonl").read_text().splitlines()
+    assert [json.loads(line) for line in lines] == [
+        {"id": 1, "pet": "cat", "born": 1577836800, "toys": ["L", 1]},
+        {"id": 2, "pet": "dog", "born": None, "toys": None},
+    ]
+    assert (tmp_path / "out" / "Empty.jsonl").read_text() == ""
+    schema = json.loads((tmp_path / "out" / SCHEMA_NAME).read_text())
+    assert schema == {"Pets": columns, "Empty": columns}
+    assert sorted(p.name for p in (tmp_path / "out").iterdir()) == [
+        "Empty.jsonl",
+        "Pets.jsonl",
+        SCHEMA_NAME,
+    ]
+
+
+def test_export_table_csv(
+    grist_client: GristAPIClient, requests_mock: Mocker, tmp_path: Path
+) -> None:
+    mock_table(requests_mock, "Pets", records)
+    mock_ids(requests_mock, {"Pets": [1, 2]})
+
+    exported = export_table(grist_client, "doc", "Pets", tmp_path, "csv")
+
+    with open(exported.path, newline="") as f:
+        rows = list(csv.reader(f))
+    assert rows == [
+        ["id", "pet", "born", "toys"],
+        ["1", "cat", "1577836800", '["L",1]'],
+        ["2", "dog", "", ""],
+    ]
+
+
+def test_export_table_parquet(
+    grist_client: GristAPIClient, requests_mock: Mocker, tmp_path: Path
+) -> None:
+    pq = pytest.importorskip("pyarrow.parquet")
+    mock_table(requests_mock, "Pets", records)
+    mock_ids(requests_mock, {"Pets": [1, 2]})
+
+    exported = export_table(grist_client, "doc", "Pets", tmp_path, "parquet")
+
+    table = pq.read_table(exported.path)
+    assert str(table.schema.field("born").type) == "date32[day]"
+    assert table.to_pylist()[0]["toys"] == "[1]"
+    assert table.column("pet").to_pylist() == ["cat", "dog"]
+
+
+def test_parquet_writer_keeps_mismatched_values(tmp_path: Path) -> None:
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "mixed.parquet"
+    writer = ParquetWriter(
+        path,
+        [
+            {"id": "age", "fields": {"type": "Int"}},
+            {"id": "name", "fields": {"type": "Text"}},
+            {"id": "born", "fields": {"type": "Date"}},
+            {"id": "score", "fields": {"type": "Numeric"}},
+        ],
+    )
+    writer.write(
+        [
+            {
+                "id": 1,
+                "fields": {"age": 3, "name": "cat", "born": 1577836800, "score": 1.5},
+            },
+            {"id": 2, "fields": {"age": "n/a", "name": 7, "born": "soon", "score": 2}},
+        ]
+    )
+    writer.write([{"id": 3, "fields": {"age": True, "name": None, "born": 0}}])
+    with pytest.raises(ValueError, match="'score'"):
+        writer.write([{"id": 4, "fields": {"score": "high"}}])
+    writer.close()
+
+    table = pq.read_table(path)
+    assert [str(field.type) for field in table.schema] == (
+        ["int64"] + ["string"] * 3 + ["double"]
+    )
+    assert table.to_pylist() == [
+        {"id": 1, "age": "3", "name": "cat", "born": "2020-01-01", "score": 1.5},
+        {"id": 2, "age": "n/a", "name": "7", "born": "soon", "score": 2.0},
+        {"id": 3, "age": "true", "name": None, "born": "1970-01-01", "score": None},
+    ]
+
+
+def test_download_doc(
+    grist_client: GristAPIClient, requests_mock: Mocker, tmp_path: Path
+) -> None:
+    requests_mock.get(f"{mock_root_url}/api/docs/doc/download", content=b"sqlite")
+    requests_mock.get(f"{mock_root_url}/api/docs/doc/download/csv", content=b"a,b\n")
+
+    size = download_doc(grist_client, "doc", tmp_path / "doc.grist", nohistory=True)
+    buffer = io.BytesIO()
+    download_doc(grist_client, "doc", buffer, "csv", table_id="Pets")
+
+    assert size == 6
+    assert (tmp_path / "doc.grist").read_bytes() == b"sqlite"
+    assert requests_mock.request_history[0].qs == {"nohistory": ["true"]}
+    assert buffer.getvalue() == b"a,b\n"
+    assert requests_mock.request_history[1].qs == {"tableid": ["pets"]}
+    with pytest.raises(ValueError, match="table_id"):
+        download_doc(grist_client, "doc", buffer, "tsv")
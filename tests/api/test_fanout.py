@@ -0,0 +1,115 @@
+import threading
+from typing import Any, Dict, List
+
+import pytest
+from requests import HTTPError
+from requests_mock import Mocker
+
+from grist_python_sdk.api.fanout import (
+    DocOutcome,
+    DocTarget,
+    fan_out,
+    run_over_docs,
+    summarize_outcomes,
+)
+from grist_python_sdk.api.table import list_tables_info
+from grist_python_sdk.client import GristAPIClient
+
+api_key = "your_api_key"
+mock_root_url = "https://example.com"
+
+
+@pytest.fixture
+def grist_client(requests_mock: Mocker) -> GristAPIClient:
+    return GristAPIClient(mock_root_url, api_key)
+
+
+def workspace(ws_id: int, doc_ids: List[str]) -> Dict[str, Any]:
+    return {
+        "id": ws_id,
+        "name": f"ws{ws_id}",
+        "access": "owners",
+        "docs": [
+            {
+                "id": doc_id,
+                "name": doc_id.upper(),
+                "access": "owners",
+                "isPinned": False,
+            }
+            for doc_id in doc_ids
+        ],
+    }
+
+
+def test_fan_out_isolates_errors(
+    grist_client: GristAPIClient, requests_mock: Mocker
+) -> None:
+    requests_mock.get(
+        f"{mock_root_url}/api/orgs/1/workspaces",
+        json=[workspace(10, ["a", "b"]), workspace(20, ["c"])],
+    )
+    for doc_id in ("a", "c"):
+        requests_mock.get(
+            f"{mock_root_url}/api/docs/{doc_id}/tables",
+            json={
+                "tables": [{"id": "T", "fields": {"tableRef": 1, "onDemand": False}}]
+            },
+        )
+    requests_mock.get(f"{mock_root_url}/api/docs/b/tables", status_code=403)
+
+    outcomes = list(fan_out(grist_client, 1, list_tables_info, max_workers=2))
+
+    by_doc = {outcome.target.doc_id: outcome for outcome in outcomes}
+    assert sorted(by_doc) == ["a", "b", "c"]
+    assert by_doc["a"].result is not None and by_doc["a"].result[0]["id"] == "T"
+    assert isinstance(by_doc["b"].error, HTTPError)
+    assert by_doc["c"].target == DocTarget(1, 20, "ws20", "c", "C")
+    stats = summarize_outcomes(outcomes)
+    assert (stats.docs, stats.succeeded, stats.failed) == (3, 2, 1)
+    assert stats.docs_per_second > 0
+
+
+def test_fan_out_filters_workspaces(
+    grist_client: GristAPIClient, requests_mock: Mocker
+) -> None:
+    requests_mock.get(
+        f"{mock_root_url}/api/orgs/1/workspaces",
+        json=[workspace(10, ["a"]), workspace(20, ["c"])],
+    )
+
+    outcomes = list(
+        fan_out(grist_client, 1, lambda client, doc_id: doc_id, workspace_ids={20})
+    )
+
+    assert [outcome.result for outcome in outcomes] == ["c"]
+
+
+def test_run_over_docs_streams_and_limits_concurrency(
+    grist_client: GristAPIClient,
+) -> None:
+    targets = [DocTarget(1, 1, "ws", f"doc{i}", f"Doc {i}") for i in range(6)]
+    lock = threading.Lock()
+    active: List[int] = [0, 0]
+    release = threading.Event()
+
+    def operation(client: GristAPIClient, doc_id: str) -> str:
+        with lock:
+            active[0] += 1
+            active[1] = max(active[1], active[0])
+        if doc_id != "doc0":
+            release.wait(5)
+        with lock:
+            active[0] -= 1
+        return doc_id
+
+    outcomes = run_over_docs(grist_client, targets, operation, max_workers=3)
+    first: DocOutcome[str] = next(outcomes)
+    release.set()
+    rest = list(outcomes)
+
+    assert first.result == "doc0"
+    assert sorted(outcome.result or "" for outcome in rest) == [
+        f"doc{i}" for i in range(1, 6)
+    ]
+    assert active[1] <= 3
+    assert summarize_outcomes([]).docs_per_second == 0.0
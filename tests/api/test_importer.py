@@ -0,0 +1,197 @@
+import json
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+from requests_mock import Mocker
+
+from grist_python_sdk.api.importer import (
+    ImportCheckpoint,
+    ImportRowsError,
+    import_rows,
+    infer_column_type,
+    iter_csv_rows,
+    iter_parquet_rows,
+    iter_row_batches,
+)
+from grist_python_sdk.client import GristAPIClient
+
+api_key = "your_api_key"
+mock_root_url = "https://example.com"
+records_url = f"{mock_root_url}/api/docs/doc/tables/Pets/records"
+
+
+@pytest.fixture
+def grist_client(requests_mock: Mocker) -> GristAPIClient:
+    return GristAPIClient(mock_root_url, api_key)
+
+
+def sent_fields(requests_mock: Mocker) -> List[Any]:
+    return [
+        record["fields"]
+        for request in requests_mock.request_history
+        if request.url.startswith(records_url)
+        for record in request.json()["records"]
+    ]
+
+
+def test_iter_row_batches_is_lazy() -> None:
+    pulled: List[int] = []
+
+    def source() -> Any:
+        for i in range(5):
+            pulled.append(i)
+            yield {"n": i}
+
+    batches = iter_row_batches(source(), 2)
+
+    assert next(batches) == [{"n": 0}, {"n": 1}]
+    assert pulled == [0, 1, 2]
+    assert list(batches) == [[{"n": 2}, {"n": 3}], [{"n": 4}]]
+    assert [len(b) for b in iter_row_batches([{"n": "x" * 10}] * 3, 10, 30)] == [
+        1,
+        1,
+        1,
+    ]
+
+
+def test_infer_column_type() -> None:
+    assert infer_column_type([1, 2, None]) == "Int"
+    assert infer_column_type([1, 2.5]) == "Numeric"
+    assert infer_column_type(["1", "2.5", ""]) == "Numeric"
+    assert infer_column_type(["cat", "3"]) == "Text"
+    assert infer_column_type([date(2020, 1, 1)]) == "Date"
+    assert infer_column_type([True, "x"]) == "Any"
+    assert infer_column_type([]) == "Any"
+
+
+def test_checkpoint_advances_over_contiguous_spans() -> None:
+    checkpoint = ImportCheckpoint()
+
+    checkpoint.complete((2, 4))
+    assert checkpoint.rows == 0
+    checkpoint.complete((0, 2))
+
+    assert checkpoint.rows == 4
+    assert checkpoint.done == set()
+
+
+def test_import_rows_creates_columns(
+    grist_client: GristAPIClient, requests_mock: Mocker
+) -> None:
+    columns_url = f"{mock_root_url}/api/docs/doc/tables/Pets/columns"
+    requests_mock.get(columns_url, json={"columns": [{"id": "pet", "fields": {}}]})
+    requests_mock.post(columns_url, json={"columns": [{"id": "age"}]})
+    requests_mock.post(records_url, json={"records": [{"id": 1}]})
+    rows = ({"pet": f"pet{i}", "age": i} for i in range(5))
+
+    result = import_rows(
+        grist_client,
+        "doc",
+        "Pets",
+        rows,
+        batch_size=2,
+        max_in_flight=1,
+        create_columns=True,
+    )
+
+    assert result.rows == 5
+    assert result.batches == 3
+    assert result.created_columns == ["age"]
+    added = [r for r in requests_mock.request_history if r.url == columns_url]
+    assert [r.json() for r in added if r.method == "POST"] == [
+        {"columns": [{"id": "age", "fields": {"type": "Int"}}]}
+    ]
+    assert sent_fields(requests_mock) == [
+        {"pet": f"pet{i}", "age": i} for i in range(5)
+    ]
+
+
+def test_import_rows_with_key_columns(
+    grist_client: GristAPIClient, requests_mock: Mocker
+) -> None:
+    requests_mock.put(records_url, text="")
+
+    import_rows(
+        grist_client, "doc", "Pets", [{"pet": "cat", "age": 3}], key_columns=["pet"]
+    )
+
+    assert requests_mock.last_request is not None
+    assert requests_mock.last_request.json() == {
+        "records": [{"require": {"pet": "cat"}, "fields": {"age": 3}}]
+    }
+
+
+def test_import_rows_resumes_from_checkpoint(
+    grist_client: GristAPIClient, requests_mock: Mocker, tmp_path: Path
+) -> None:
+    checkpoint = tmp_path / "import.json"
+    calls: List[Any] = []
+
+    def respond(request: Any, context: Any) -> Dict[str, Any]:
+        calls.append(request)
+        if len(calls) == 2:
+            context.status_code = 500
+        return {"records": [{"id": 1}]}
+
+    requests_mock.post(records_url, json=respond)
+    rows = [{"n": i} for i in range(6)]
+
+    with pytest.raises(ImportRowsError) as info:
+        import_rows(
+            grist_client,
+            "doc",
+            "Pets",
+            iter(rows),
+            batch_size=2,
+            max_in_flight=1,
+            checkpoint=checkpoint,
+        )
+
+    assert info.value.result.rows == 2
+    assert json.loads(checkpoint.read_text()) == {
+        "version": 2,
+        "rows": 2,
+        "done": [],
+        "batch_size": 2,
+        "max_batch_bytes": None,
+    }
+    with pytest.raises(ValueError, match="batch_size=2"):
+        import_rows(grist_client, "doc", "Pets", iter(rows), checkpoint=checkpoint)
+    assert len(calls) == 2
+
+    result = import_rows(
+        grist_client,
+        "doc",
+        "Pets",
+        iter(rows),
+        batch_size=2,
+        max_in_flight=1,
+        checkpoint=checkpoint,
+    )
+
+    assert result.skipped == 2
+    assert result.rows == 4
+    assert [c.json()["records"][0]["fields"] for c in calls[2:]] == [{"n": 2}, {"n": 4}]
+    assert json.loads(checkpoint.read_text())["rows"] == 6
+
+
+def test_iter_file_rows(tmp_path: Path) -> None:
+    csv_path = tmp_path / "pets.csv"
+    csv_path.write_text("﻿pet,age\ncat,3\ndog,5\n", encoding="utf-8")
+
+    assert list(iter_csv_rows(csv_path)) == [
+        {"pet": "cat", "age": "3"},
+        {"pet": "dog", "age": "5"},
+    ]
+
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    parquet_path = tmp_path / "pets.parquet"
+    pq.write_table(pa.table({"pet": ["cat", "dog"], "age": [3, 5]}), parquet_path)
+
+    assert list(iter_parquet_rows(parquet_path, batch_size=1)) == [
+        {"pet": "cat", "age": 3},
+        {"pet": "dog", "age": 5},
+    ]
@@ -0,0 +1,110 @@
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+from grist_python_sdk.api.mirror import MANIFEST_NAME, mirror_attachments, object_path
+from grist_python_sdk.client import GristAPIClient
+from requests_mock import Mocker
+
+api_key = "your_api_key"
+mock_root_url = "https://example.com"
+
+
+@pytest.fixture
+def grist_client(requests_mock: Mocker) -> GristAPIClient:
+    return GristAPIClient(mock_root_url, api_key)
+
+
+def mock_doc(requests_mock: Mocker, doc_id: str, files: Dict[int, bytes]) -> None:
+    records: List[Dict[str, Any]] = [
+        {
+            "id": id,
+            "fields": {
+                "fileName": f"file{id}.txt",
+                "fileSize": len(contents),
+                "timeUploaded": "2020-02-13T12:17:19.000Z",
+            },
+        }
+        for id, contents in files.items()
+    ]
+    requests_mock.get(
+        f"{mock_root_url}/api/docs/{doc_id}/attachments", json={"records": records}
+    )
+    for id, contents in files.items():
+        requests_mock.get(
+            f"{mock_root_url}/api/docs/{doc_id}/attachments/{id}/download",
+            content=contents,
+        )
+
+
+def download_count(requests_mock: Mocker) -> int:
+    return sum(
+        request.path.endswith("/download") for request in requests_mock.request_history
+    )
+
+
+def test_mirror_attachments_downloads_and_dedups(
+    grist_client: GristAPIClient, requests_mock: Mocker, tmp_path: Path
+) -> None:
+    mock_doc(requests_mock, "doc1", {1: b"alpha", 2: b"beta"})
+    mock_doc(requests_mock, "doc2", {1: b"alpha"})
+
+    result = mirror_attachments(grist_client, ["doc1", "doc2"], tmp_path)
+
+    assert result.failed == {}
+    assert result.downloaded == [("doc1", 1), ("doc1", 2)]
+    assert result.deduplicated == [("doc2", 1)]
+    sha256 = hashlib.sha256(b"alpha").hexdigest()
+    assert object_path(tmp_path, sha256).read_bytes() == b"alpha"
+    manifest = json.loads((tmp_path / MANIFEST_NAME).read_text())
+    assert manifest["docs"]["doc2"]["1"]["sha256"] == sha256
+    assert manifest["docs"]["doc1"]["2"]["fileName"] == "file2.txt"
+    assert list((tmp_path / "tmp").iterdir()) == []
+
+
+def test_mirror_attachments_is_incremental(
+    grist_client: GristAPIClient, requests_mock: Mocker, tmp_path: Path
+) -> None:
+    mock_doc(requests_mock, "doc1", {1: b"alpha"})
+    mirror_attachments(grist_client, ["doc1"], tmp_path)
+    assert download_count(requests_mock) == 1
+
+    mock_doc(requests_mock, "doc1", {1: b"alpha", 2: b"gamma"})
+    result = mirror_attachments(grist_client, ["doc1"], tmp_path)
+
+    assert result.skipped == [("doc1", 1)]
+    assert result.downloaded == [("doc1", 2)]
+    assert download_count(requests_mock) == 2
+
+
+def test_mirror_attachments_refetches_damaged_objects(
+    grist_client: GristAPIClient, requests_mock: Mocker, tmp_path: Path
+) -> None:
+    mock_doc(requests_mock, "doc1", {1: b"alpha"})
+    mirror_attachments(grist_client, ["doc1"], tmp_path)
+    path = object_path(tmp_path, hashlib.sha256(b"alpha").hexdigest())
+    path.write_bytes(b"ALPHA")
+
+    assert mirror_attachments(grist_client, ["doc1"], tmp_path).skipped == [("doc1", 1)]
+    result = mirror_attachments(grist_client, ["doc1"], tmp_path, verify=True)
+
+    assert result.deduplicated == [("doc1", 1)]
+    assert path.read_bytes() == b"alpha"
+
+
+def test_mirror_attachments_records_failures(
+    grist_client: GristAPIClient, requests_mock: Mocker, tmp_path: Path
+) -> None:
+    mock_doc(requests_mock, "doc1", {1: b"alpha", 2: b"beta"})
+    requests_mock.get(
+        f"{mock_root_url}/api/docs/doc1/attachments/2/download", status_code=500
+    )
+
+    result = mirror_attachments(grist_client, ["doc1"], tmp_path)
+
+    assert result.downloaded == [("doc1", 1)]
+    assert list(result.failed) == [("doc1", 2)]
+    manifest = json.loads((tmp_path / MANIFEST_NAME).read_text())
+    assert list(manifest["docs"]["doc1"]) == ["1"]
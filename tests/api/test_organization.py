@@ -1,6 +1,9 @@
-from typing import Dict, List
+from datetime import datetime
+from typing import Any, Callable, Dict, List
 
 import pytest
+from requests_mock import Mocker
+
 from grist_python_sdk.api.organazation import (
     change_users_of_organization,
     describe_organization,
@@ -9,8 +12,8 @@ from grist_python_sdk.api.organazation import (
     rename_organization,
 )
 from grist_python_sdk.api.typing import Access
+from grist_python_sdk.api.utils import LazyTimestamps, parse_timestamp
 from grist_python_sdk.client import GristAPIClient
-from requests_mock import Mocker
 
 api_key = "your_api_key"
 mock_root_url = "https://example.com"
@@ -69,6 +72,72 @@ def test_describe_organization(
     org_info = describe_organization(grist_client, 42)
     assert org_info["id"] == 42
     assert org_info["name"] == "Grist Labs"
+    assert org_info["createdAt"] == datetime(2019, 9, 13, 15, 42, 35)
+
+
+def test_describe_organization_lazy_timestamps(
+    grist_client: GristAPIClient, requests_mock: Mocker
+) -> None:
+    requests_mock.get(
+        f"{mock_root_url}/api/orgs/42",
+        json={
+            "id": 42,
+            "name": "Grist Labs",
+            "domain": "gristlabs",
+            "owner": {"id": 101, "name": "Helga Hufflepuff"},
+            "access": "owners",
+            "createdAt": "2019-09-13T15:42:35.000Z",
+            "updatedAt": "2020-01-02T03:04:05.123Z",
+        },
+    )
+    org_info = describe_organization(grist_client, 42, timestamps="lazy")
+    assert isinstance(org_info, LazyTimestamps)
+    assert org_info.pending == {"createdAt", "updatedAt"}
+    assert org_info["updatedAt"] == datetime(2020, 1, 2, 3, 4, 5, 123000)
+    assert org_info.pending == {"createdAt"}
+    assert org_info.get("createdAt") == datetime(2019, 9, 13, 15, 42, 35)
+    assert not org_info.pending
+
+
+def test_lazy_timestamps_resolve_on_bulk_access() -> None:
+    data = LazyTimestamps({"id": 1, "at": "2019-09-13T15:42:35.000Z"}, ("at",))
+    assert dict(data.items())["at"] == datetime(2019, 9, 13, 15, 42, 35)
+    data = LazyTimestamps({"id": 1, "at": "2019-09-13T15:42:35.000Z"}, ("at",))
+    assert data == {"id": 1, "at": datetime(2019, 9, 13, 15, 42, 35)}
+    data = LazyTimestamps({"id": 1, "at": "2019-09-13T15:42:35.000Z"}, ("at",))
+    data["at"] = "replaced"
+    assert data["at"] == "replaced"
+
+
+@pytest.mark.parametrize(
+    "access",
+    [
+        dict,
+        lambda data: {**data},
+        lambda data: data.copy(),
+        lambda data: {"at": data.pop("at")},
+        lambda data: {"at": data.setdefault("at", None)},
+    ],
+)
+def test_lazy_timestamps_resolve_on_every_access_path(
+    access: Callable[[LazyTimestamps], Dict[str, Any]],
+) -> None:
+    data = LazyTimestamps({"id": 1, "at": "2019-09-13T15:42:35.000Z"}, ("at",))
+    assert access(data)["at"] == datetime(2019, 9, 13, 15, 42, 35)
+
+
+def test_parse_timestamp() -> None:
+    parse_timestamp.cache_clear()
+    assert parse_timestamp("2019-09-13T15:42:35.000Z") == datetime.strptime(
+        "2019-09-13T15:42:35.000Z", "%Y-%m-%dT%H:%M:%S.%fZ"
+    )
+    assert parse_timestamp("2019-09-13T15:42:35.5Z") == datetime(
+        2019, 9, 13, 15, 42, 35, 500000
+    )
+    assert parse_timestamp("2019-09-13T15:42:35.000Z") is parse_timestamp(
+        "2019-09-13T15:42:35.000Z"
+    )
+    assert parse_timestamp.cache_info().hits == 2
 
 
 def test_rename_organization(
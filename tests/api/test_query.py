@@ -0,0 +1,199 @@
+import json
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, List
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+from grist_python_sdk.api.query import (
+    Col,
+    Condition,
+    compile_filter,
+    compile_sort,
+    compile_sql,
+    select_records,
+)
+from grist_python_sdk.api.replica import MemoryStore, SQLiteStore
+from grist_python_sdk.api.typing import RecordInfo
+from grist_python_sdk.client import GristAPIClient
+from requests_mock import Mocker
+
+api_key = "your_api_key"
+mock_root_url = "https://example.com"
+records_url = f"{mock_root_url}/api/docs/145/tables/Pets/records"
+
+
+@pytest.fixture
+def grist_client(requests_mock: Mocker) -> GristAPIClient:
+    return GristAPIClient(mock_root_url, api_key)
+
+
+def test_compile_filter_native() -> None:
+    condition = Col("pet").isin(["cat", "dog"]) & Col("owner").eq(3)
+
+    assert compile_filter(condition) == '{"pet":["cat","dog"],"owner":[3]}'
+    assert compile_filter(Col("pet").isin(["cat", "dog"]) & Col("pet").eq("dog")) == (
+        '{"pet":["dog"]}'
+    )
+
+
+def test_compile_filter_rejects_non_native() -> None:
+    assert compile_filter(Col("age").gt(3)) is None
+    assert compile_filter(Col("pet").eq("cat") | Col("pet").eq("dog")) is None
+    assert compile_filter(~Col("pet").eq("cat")) is None
+
+
+def test_compile_sort() -> None:
+    assert compile_sort([Col("age").desc(), "name", "-owner"]) == "-age,name,-owner"
+
+
+def test_compile_sql() -> None:
+    condition = (Col("age").between(2, 5) | Col("name").contains("50%")) & ~Col(
+        "owner"
+    ).is_null()
+
+    sql, args = compile_sql(condition)
+
+    assert sql == (
+        '((("age" >= ?) AND ("age" <= ?)) OR '
+        '(typeof("name") = \'text\' AND instr("name", ?) > 0))'
+        ' AND (NOT coalesce("owner" IS NULL, 0))'
+    )
+    assert args == [2, 5, "50%"]
+    assert compile_sql(Col("pet").isin(["cat", None])) == (
+        '"pet" IS NULL OR "pet" IN (?)',
+        ["cat"],
+    )
+    assert compile_sql(Col("pet").eq(None)) == ('"pet" IS NULL', [])
+    assert compile_sql(Col("pet").ne(None)) == ('"pet" IS NOT NULL', [])
+
+
+def test_select_records_native(
+    grist_client: GristAPIClient, requests_mock: Mocker
+) -> None:
+    records = [{"id": 1, "fields": {"pet": "cat"}}]
+    requests_mock.get(records_url, json={"records": records})
+
+    result = select_records(
+        grist_client,
+        "145",
+        "Pets",
+        Col("pet").isin(["cat"]),
+        order_by=[Col("age").desc()],
+        limit=10,
+    )
+
+    assert result == records
+    assert requests_mock.last_request is not None
+    assert requests_mock.last_request.qs == {
+        "filter": ['{"pet":["cat"]}'],
+        "sort": ["-age"],
+        "limit": ["10"],
+    }
+
+
+def test_select_records_falls_back_to_sql(
+    grist_client: GristAPIClient, requests_mock: Mocker
+) -> None:
+    sql_adapter = requests_mock.post(
+        f"{mock_root_url}/api/docs/145/sql",
+        json={"records": [{"fields": {"id": 3}}, {"fields": {"id": 1}}]},
+    )
+
+    def respond(request: Any, context: Any) -> Dict[str, Any]:
+        ids = json.loads(request.qs["filter"][0])["id"]
+        return {"records": [{"id": id, "fields": {"age": id}} for id in sorted(ids)]}
+
+    records_adapter = requests_mock.get(records_url, json=respond)
+
+    result = select_records(
+        grist_client, "145", "Pets", Col("age").gt(0), order_by=["-age"], limit=2
+    )
+
+    assert [record["id"] for record in result] == [3, 1]
+    assert sql_adapter.last_request is not None
+    assert sql_adapter.last_request.json() == {
+        "sql": 'SELECT id FROM "Pets" WHERE "age" > ? ORDER BY "age" DESC LIMIT ?',
+        "args": [0, 2],
+    }
+    assert records_adapter.call_count == 1
+
+
+pets: List[RecordInfo] = [
+    {"id": 1, "fields": {"pet": "Cat", "age": 3}},
+    {"id": 2, "fields": {"pet": "cat", "age": None}},
+    {"id": 3, "fields": {"pet": None, "age": 5}},
+    {"id": 4, "fields": {"pet": "Bobcat", "age": 1}},
+    {"id": 5, "fields": {"pet": 7, "age": 2}},
+]
+
+
+def mock_pets(requests_mock: Mocker) -> sqlite3.Connection:
+    db = sqlite3.connect(":memory:")
+    db.execute('CREATE TABLE "Pets" (id INTEGER PRIMARY KEY, pet, age)')
+    db.executemany(
+        'INSERT INTO "Pets" VALUES (?, ?, ?)',
+        [(r["id"], r["fields"]["pet"], r["fields"]["age"]) for r in pets],
+    )
+
+    def run_sql(request: Any, context: Any) -> Dict[str, Any]:
+        if request.method == "GET":
+            sql, args = parse_qs(urlsplit(request.url).query)["q"][0], []
+        else:
+            sql, args = request.json()["sql"], request.json()["args"]
+        rows = db.execute(sql, args).fetchall()
+        return {"records": [{"fields": {"id": id}} for (id,) in rows]}
+
+    def filter_records(request: Any, context: Any) -> Dict[str, Any]:
+        query = parse_qs(urlsplit(request.url).query)
+        filters = json.loads(query["filter"][0])
+        return {
+            "records": [
+                record
+                for record in pets
+                if all(
+                    {"id": record["id"], **record["fields"]}[col_id] in values
+                    for col_id, values in filters.items()
+                )
+            ]
+        }
+
+    requests_mock.post(f"{mock_root_url}/api/docs/145/sql", json=run_sql)
+    requests_mock.get(f"{mock_root_url}/api/docs/145/sql", json=run_sql)
+    requests_mock.get(records_url, json=filter_records)
+    return db
+
+
+@pytest.mark.parametrize(
+    "condition, expected",
+    [
+        (Col("pet").contains("cat"), [2, 4]),
+        (Col("pet").eq(None), [3]),
+        (Col("pet").isin(["cat", None]), [2, 3]),
+        (Col("pet").ne(None), [1, 2, 4, 5]),
+        (~Col("age").gt(2), [2, 4, 5]),
+        (~Col("pet").isin(["Cat"]), [2, 3, 4, 5]),
+        (Col("pet").eq(None) & Col("age").ge(1), [3]),
+        (Col("pet").isin(["cat", None]) & Col("age").is_null(), [2]),
+    ],
+)
+def test_stores_and_select_paths_agree(
+    grist_client: GristAPIClient,
+    requests_mock: Mocker,
+    tmp_path: Path,
+    condition: Condition,
+    expected: List[int],
+) -> None:
+    db = mock_pets(requests_mock)
+    memory = MemoryStore()
+    sqlite_store = SQLiteStore(tmp_path / "pets.db")
+    for store in (memory, sqlite_store):
+        store.upsert(pets)
+        assert [id for id, _ in store.select(condition)] == expected
+    sqlite_store.close()
+
+    selected = select_records(grist_client, "145", "Pets", condition)
+    assert sorted(record["id"] for record in selected) == expected
+    via_sql = select_records(grist_client, "145", "Pets", condition & Col("id").gt(0))
+    assert [record["id"] for record in via_sql] == expected
+    db.close()
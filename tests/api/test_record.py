@@ -1,7 +1,16 @@
+import json
+from typing import Any, Dict
+
 import pytest
+from grist_python_sdk.api.chunking import ChunkedRequestError, split_chunks
 from grist_python_sdk.api.record import (
     add_records,
+    delete_records,
+    fetch_columns,
     fetch_records,
+    iter_record_batches,
+    iter_records,
+    page_filterstring,
     patch_records,
     put_records,
 )
@@ -47,6 +56,13 @@ def test_fetch_records(grist_client: GristAPIClient, requests_mock: Mocker) -> N
     )
 
     assert records == expected_records
+    assert requests_mock.last_request is not None
+    assert requests_mock.last_request.qs == {
+        "filter": [filterstring],
+        "sort": [sortstring],
+        "limit": ["5"],
+        "hidden": ["true"],
+    }
 
 
 def test_add_records(grist_client: GristAPIClient, requests_mock: Mocker) -> None:
@@ -101,3 +117,168 @@ def test_put_records(grist_client: GristAPIClient, requests_mock: Mocker) -> Non
     )
 
     put_records(grist_client, doc_id, table_id, records_to_put)
+
+
+def test_add_records_in_chunks(
+    grist_client: GristAPIClient, requests_mock: Mocker
+) -> None:
+    doc_id = "145"
+    table_id = "exampleTable"
+    next_id = iter(range(1, 100))
+
+    def respond(request: Any, context: Any) -> Dict[str, Any]:
+        records = request.json()["records"]
+        return {"records": [{"id": next(next_id)} for _ in records]}
+
+    adapter = requests_mock.post(
+        f"{mock_root_url}/api/docs/{doc_id}/tables/{table_id}/records",
+        status_code=200,
+        json=respond,
+    )
+
+    record_fields = [{"pet": f"pet{i}"} for i in range(5)]
+    response = add_records(grist_client, doc_id, table_id, record_fields, chunk_size=2)
+
+    assert response == [1, 2, 3, 4, 5]
+    assert [len(r.json()["records"]) for r in adapter.request_history] == [2, 2, 1]
+
+
+def test_add_records_reports_failed_chunks(
+    grist_client: GristAPIClient, requests_mock: Mocker
+) -> None:
+    doc_id = "145"
+    table_id = "exampleTable"
+
+    def respond(request: Any, context: Any) -> Dict[str, Any]:
+        records = request.json()["records"]
+        if records[0]["fields"]["pet"] == "pet2":
+            context.status_code = 500
+            return {}
+        return {"records": [{"id": 1} for _ in records]}
+
+    requests_mock.post(
+        f"{mock_root_url}/api/docs/{doc_id}/tables/{table_id}/records",
+        json=respond,
+    )
+
+    record_fields = [{"pet": f"pet{i}"} for i in range(6)]
+    with pytest.raises(ChunkedRequestError) as excinfo:
+        add_records(
+            grist_client, doc_id, table_id, record_fields, chunk_size=2, max_workers=3
+        )
+
+    [failure] = excinfo.value.failures
+    assert (failure.index, failure.start, failure.stop) == (1, 2, 4)
+    assert excinfo.value.results == [[1, 1], None, [1, 1]]
+
+
+def test_patch_records_in_chunks_by_size(
+    grist_client: GristAPIClient, requests_mock: Mocker
+) -> None:
+    doc_id = "145"
+    table_id = "exampleTable"
+
+    adapter = requests_mock.patch(
+        f"{mock_root_url}/api/docs/{doc_id}/tables/{table_id}/records",
+        status_code=200,
+    )
+
+    records_to_patch = {i: {"pet": "x" * 40} for i in range(1, 5)}
+    patch_records(grist_client, doc_id, table_id, records_to_patch, max_chunk_bytes=120)
+
+    assert [len(r.json()["records"]) for r in adapter.request_history] == [2, 2]
+
+
+def test_split_chunks_by_rows_and_bytes() -> None:
+    items = [{"a": "x" * 10}] * 5
+
+    assert split_chunks(items) == [items]
+    assert [len(c) for c in split_chunks(items, chunk_size=2)] == [2, 2, 1]
+    assert [len(c) for c in split_chunks(items, max_chunk_bytes=40)] == [
+        2,
+        2,
+        1,
+    ]
+    assert [len(c) for c in split_chunks(items, 1, max_chunk_bytes=1000)] == [1] * 5
+
+
+def test_iter_records_pages_by_id(
+    grist_client: GristAPIClient, requests_mock: Mocker
+) -> None:
+    doc_id = "145"
+    table_id = "exampleTable"
+    table = {i: {"pet": "cat" if i % 2 else "dog"} for i in range(1, 6)}
+
+    def respond_ids(request: Any, context: Any) -> Dict[str, Any]:
+        after_id, limit = request.json()["args"]
+        ids = [i for i in sorted(table) if i > after_id][:limit]
+        return {"records": [{"fields": {"id": i}} for i in ids]}
+
+    def respond_records(request: Any, context: Any) -> Dict[str, Any]:
+        filters = json.loads(request.qs["filter"][0])
+        return {
+            "records": [
+                {"id": i, "fields": table[i]}
+                for i in filters["id"]
+                if all(table[i][k] in v for k, v in filters.items() if k != "id")
+            ]
+        }
+
+    sql_adapter = requests_mock.post(
+        f"{mock_root_url}/api/docs/{doc_id}/sql", json=respond_ids
+    )
+    requests_mock.get(
+        f"{mock_root_url}/api/docs/{doc_id}/tables/{table_id}/records",
+        json=respond_records,
+    )
+
+    batches = list(iter_record_batches(grist_client, doc_id, table_id, page_size=2))
+    assert [[r["id"] for r in batch] for batch in batches] == [[1, 2], [3, 4], [5]]
+    assert [r.json()["args"] for r in sql_adapter.request_history] == [
+        [0, 2],
+        [2, 2],
+        [4, 2],
+    ]
+
+    records = iter_records(
+        grist_client, doc_id, table_id, filterstring='{"pet": ["cat"]}', page_size=2
+    )
+    assert [r["id"] for r in records] == [1, 3, 5]
+
+
+def test_page_filterstring_intersects_id_filter() -> None:
+    assert page_filterstring('{"id": [2, 9]}', [1, 2, 3]) == '{"id":[2]}'
+    assert page_filterstring('{"id": [9]}', [1, 2, 3]) is None
+
+
+def test_fetch_columns(grist_client: GristAPIClient, requests_mock: Mocker) -> None:
+    doc_id = "145"
+    table_id = "exampleTable"
+    expected_columns = {"id": [1, 2], "pet": ["cat", "dog"], "popularity": [67, 95]}
+
+    requests_mock.get(
+        f"{mock_root_url}/api/docs/{doc_id}/tables/{table_id}/data",
+        status_code=200,
+        json=expected_columns,
+    )
+
+    columns = fetch_columns(grist_client, doc_id, table_id, limitnumber=2)
+
+    assert columns == expected_columns
+    assert requests_mock.last_request is not None
+    assert requests_mock.last_request.qs == {"limit": ["2"]}
+
+
+def test_delete_records(grist_client: GristAPIClient, requests_mock: Mocker) -> None:
+    doc_id = "145"
+    table_id = "exampleTable"
+
+    adapter = requests_mock.post(
+        f"{mock_root_url}/api/docs/{doc_id}/tables/{table_id}/data/delete",
+        status_code=200,
+        json=None,
+    )
+
+    delete_records(grist_client, doc_id, table_id, [1, 2, 3], chunk_size=2)
+
+    assert [r.json() for r in adapter.request_history] == [[1, 2], [3]]
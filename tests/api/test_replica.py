@@ -0,0 +1,142 @@
+import json
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+import pytest
+from grist_python_sdk.api.query import Col
+from grist_python_sdk.api.replica import TableReplica
+from grist_python_sdk.client import GristAPIClient
+from requests_mock import Mocker
+
+api_key = "your_api_key"
+mock_root_url = "https://example.com"
+
+
+class FakeTable:
+    def __init__(self, requests_mock: Mocker) -> None:
+        self.db = sqlite3.connect(":memory:")
+        self.db.execute('CREATE TABLE "Pets" (id INTEGER PRIMARY KEY, pet, updated)')
+        self.fetched: List[int] = []
+        self.queries: List[str] = []
+        requests_mock.post(f"{mock_root_url}/api/docs/145/sql", json=self.post_sql)
+        requests_mock.get(f"{mock_root_url}/api/docs/145/sql", json=self.get_sql)
+        requests_mock.get(
+            f"{mock_root_url}/api/docs/145/tables/Pets/records", json=self.records
+        )
+
+    def upsert(self, id: int, pet: str, updated: float) -> None:
+        self.db.execute(
+            'INSERT OR REPLACE INTO "Pets" VALUES (?, ?, ?)', (id, pet, updated)
+        )
+
+    def run(self, sql: str, args: List[Any]) -> Dict[str, Any]:
+        self.queries.append(sql)
+        cursor = self.db.execute(sql, args)
+        names = [column[0] for column in cursor.description]
+        return {"records": [{"fields": dict(zip(names, row))} for row in cursor]}
+
+    def post_sql(self, request: Any, context: Any) -> Dict[str, Any]:
+        body = request.json()
+        return self.run(body["sql"], body["args"])
+
+    def get_sql(self, request: Any, context: Any) -> Dict[str, Any]:
+        return self.run(request.qs["q"][0], [])
+
+    def records(self, request: Any, context: Any) -> Dict[str, Any]:
+        ids = json.loads(request.qs["filter"][0])["id"]
+        self.fetched += ids
+        placeholders = ",".join("?" * len(ids))
+        rows = self.db.execute(
+            f'SELECT id, pet, updated FROM "Pets" WHERE id IN ({placeholders})', ids
+        )
+        return {
+            "records": [
+                {"id": id, "fields": {"pet": pet, "updated": updated}}
+                for id, pet, updated in rows
+            ]
+        }
+
+
+@pytest.fixture
+def grist_client(requests_mock: Mocker) -> GristAPIClient:
+    return GristAPIClient(mock_root_url, api_key)
+
+
+@pytest.fixture
+def table(requests_mock: Mocker) -> Iterator[FakeTable]:
+    table = FakeTable(requests_mock)
+    yield table
+    table.db.close()
+
+
+@pytest.mark.parametrize("storage", ["memory", "sqlite"])
+def test_replica_refreshes_incrementally(
+    grist_client: GristAPIClient, table: FakeTable, tmp_path: Path, storage: str
+) -> None:
+    for id, pet in enumerate(["cat", "dog", "bird"], start=1):
+        table.upsert(id, pet, 100.0)
+    path: Optional[Path] = tmp_path / "pets.db" if storage == "sqlite" else None
+
+    replica = TableReplica(grist_client, "145", "Pets", "updated", path, page_size=2)
+    result = replica.refresh()
+
+    assert (result.changed, result.deleted, result.full) == (3, 0, True)
+    assert replica.get(2) == {"id": 2, "fields": {"pet": "dog", "updated": 100.0}}
+    assert len(replica) == 3
+
+    table.upsert(2, "wolf", 200.0)
+    table.upsert(4, "fish", 150.0)
+    table.db.execute('DELETE FROM "Pets" WHERE id = 3')
+    table.fetched.clear()
+    result = replica.refresh()
+
+    assert (result.changed, result.deleted, result.full) == (3, 1, False)
+    assert sorted(table.fetched) == [1, 2, 4]
+    assert 3 not in replica
+    assert replica.get(2) == {"id": 2, "fields": {"pet": "wolf", "updated": 200.0}}
+    assert [r["id"] for r in replica.select(Col("updated").gt(120))] == [2, 4]
+    assert [r["id"] for r in replica.select(Col("pet").isin(["cat", "fish"]))] == [
+        1,
+        4,
+    ]
+    replica.close()
+
+
+def test_sqlite_replica_resumes_across_instances(
+    grist_client: GristAPIClient, table: FakeTable, tmp_path: Path
+) -> None:
+    table.upsert(1, "cat", 100.0)
+    path = tmp_path / "pets.db"
+    with TableReplica(grist_client, "145", "Pets", "updated", path) as replica:
+        replica.refresh()
+
+    table.upsert(2, "dog", 100.0)
+    table.fetched.clear()
+    with TableReplica(grist_client, "145", "Pets", "updated", path) as replica:
+        result = replica.refresh()
+        assert not result.full
+        assert [r["id"] for r in replica.records()] == [1, 2]
+    assert table.fetched == [1, 2]
+
+
+def test_replica_scans_ids_only_when_counts_differ(
+    grist_client: GristAPIClient, table: FakeTable
+) -> None:
+    table.upsert(1, "cat", 100.0)
+    table.upsert(2, "dog", 100.0)
+    replica = TableReplica(grist_client, "145", "Pets")
+    replica.refresh()
+
+    table.upsert(3, "fish", 100.0)
+    table.queries.clear()
+    assert replica.refresh().changed == 1
+    assert not any(q.lower() == 'select id from "pets"' for q in table.queries)
+
+    table.db.execute('DELETE FROM "Pets" WHERE id = 1')
+    table.upsert(4, "bird", 100.0)
+    table.queries.clear()
+    result = replica.refresh()
+    assert (result.changed, result.deleted) == (1, 1)
+    assert any(q.lower() == 'select id from "pets"' for q in table.queries)
+    assert [r["id"] for r in replica.records()] == [2, 3, 4]
@@ -0,0 +1,84 @@
+import sys
+from typing import Any, Dict
+
+import pytest
+from grist_python_sdk.api.rows import (
+    fetch_rows,
+    parse_rows,
+    row_type,
+    rows_from_records,
+)
+from grist_python_sdk.client import GristAPIClient
+from requests_mock import Mocker
+
+api_key = "your_api_key"
+mock_root_url = "https://example.com"
+
+
+@pytest.fixture
+def grist_client(requests_mock: Mocker) -> GristAPIClient:
+    return GristAPIClient(mock_root_url, api_key)
+
+
+def test_compact_row_access() -> None:
+    [row] = parse_rows({"id": [1], "pet": ["cat"], "count": [3]})
+
+    assert row.id == 1
+    assert row.pet == "cat"
+    assert row["pet"] == "cat"
+    assert row["count"] == 3
+    assert row.get("missing", "-") == "-"
+    assert "pet" in row
+    assert list(row.keys()) == ["id", "pet", "count"]
+    assert row.to_record() == {"id": 1, "fields": {"pet": "cat", "count": 3}}
+    assert repr(row) == "Row(id=1, pet='cat', count=3)"
+    with pytest.raises(AttributeError):
+        row.missing
+
+
+def test_compact_row_columns_shadow_methods() -> None:
+    names = ["count", "index", "fields", "columns", "keys", "get"]
+    [row] = parse_rows({"id": [7], **{name: [name.upper()] for name in names}})
+
+    assert [getattr(row, name) for name in names] == [name.upper() for name in names]
+    assert row["count"] == "COUNT"
+    assert row.id == 7
+    assert row.to_record() == {
+        "id": 7,
+        "fields": {name: name.upper() for name in names},
+    }
+
+
+def test_compact_rows_share_schema() -> None:
+    rows = parse_rows({"id": [1, 2], "pet": ["cat", "dog"]})
+
+    assert type(rows[0]) is type(rows[1])
+    assert type(rows[0]) is row_type(("id", "pet"), "Row")
+    assert not hasattr(rows[0], "__dict__")
+
+
+def test_compact_rows_use_less_memory() -> None:
+    fields: Dict[str, Any] = {f"col{i}": i for i in range(8)}
+    record = {"id": 1, "fields": fields}
+    [row] = rows_from_records([record])  # type: ignore[list-item]
+
+    dict_size = sys.getsizeof(record) + sys.getsizeof(fields)
+    assert sys.getsizeof(row) < dict_size / 2
+    assert row.col7 == 7
+
+
+def test_fetch_rows(grist_client: GristAPIClient, requests_mock: Mocker) -> None:
+    requests_mock.get(
+        f"{mock_root_url}/api/docs/145/tables/Pets/data",
+        json={"id": [1, 2], "pet": ["cat", "dog"], "age": [3, 5]},
+    )
+
+    rows = fetch_rows(grist_client, "145", "Pets", sortstring="-age")
+
+    assert [(row.id, row.pet, row["age"]) for row in rows] == [
+        (1, "cat", 3),
+        (2, "dog", 5),
+    ]
+    assert type(rows[0]).__name__ == "Pets"
+    assert requests_mock.last_request is not None
+    assert requests_mock.last_request.qs == {"sort": ["-age"]}
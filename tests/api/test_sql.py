@@ -0,0 +1,144 @@
+from typing import Any, Dict, List
+
+import pytest
+from grist_python_sdk.api.sql import (
+    iter_sql,
+    iter_sql_batches,
+    query_sql,
+    query_sql_columns,
+)
+from grist_python_sdk.client import GristAPIClient
+from requests_mock import Mocker
+
+api_key = "your_api_key"
+mock_root_url = "https://example.com"
+sql_url = f"{mock_root_url}/api/docs/145/sql"
+
+
+@pytest.fixture
+def grist_client(requests_mock: Mocker) -> GristAPIClient:
+    return GristAPIClient(mock_root_url, api_key)
+
+
+def sql_response(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {"statement": "", "records": [{"fields": row} for row in rows]}
+
+
+def test_query_sql_uses_get_without_args(
+    grist_client: GristAPIClient, requests_mock: Mocker
+) -> None:
+    rows = [{"pet": "cat", "n": 2}, {"pet": "dog", "n": 5}]
+    requests_mock.get(sql_url, json=sql_response(rows))
+
+    result = query_sql(grist_client, "145", "SELECT pet, count(*) AS n FROM Pets")
+
+    assert result == rows
+    assert requests_mock.last_request is not None
+    assert requests_mock.last_request.qs == {
+        "q": ["select pet, count(*) as n from pets"]
+    }
+
+
+def test_query_sql_posts_args_and_timeout(
+    grist_client: GristAPIClient, requests_mock: Mocker
+) -> None:
+    requests_mock.post(sql_url, json=sql_response([{"pet": "cat"}]))
+
+    result = query_sql(
+        grist_client, "145", "SELECT pet FROM Pets WHERE age > ?", [3], timeout=500
+    )
+
+    assert result == [{"pet": "cat"}]
+    assert requests_mock.last_request is not None
+    assert requests_mock.last_request.json() == {
+        "sql": "SELECT pet FROM Pets WHERE age > ?",
+        "args": [3],
+        "timeout": 500,
+    }
+
+
+def test_query_sql_posts_long_statements(
+    grist_client: GristAPIClient, requests_mock: Mocker
+) -> None:
+    requests_mock.post(sql_url, json=sql_response([]))
+    sql = "SELECT id FROM Pets WHERE " + " OR ".join(f"id = {i}" for i in range(500))
+
+    assert query_sql(grist_client, "145", sql) == []
+    assert requests_mock.last_request is not None
+    assert requests_mock.last_request.json()["sql"] == sql
+
+
+def test_query_sql_columns(grist_client: GristAPIClient, requests_mock: Mocker) -> None:
+    rows = [{"pet": "cat", "n": 2}, {"pet": "dog", "n": 5}]
+    requests_mock.get(sql_url, json=sql_response(rows))
+
+    columns = query_sql_columns(grist_client, "145", "SELECT pet, n FROM Pets")
+
+    assert columns == {"pet": ["cat", "dog"], "n": [2, 5]}
+    assert list(columns) == ["pet", "n"]
+
+
+def test_iter_sql_pages_with_offset(
+    grist_client: GristAPIClient, requests_mock: Mocker
+) -> None:
+    table = [{"id": i} for i in range(1, 6)]
+
+    def respond(request: Any, context: Any) -> Dict[str, Any]:
+        limit, offset = request.json()["args"][-2:]
+        return sql_response(table[offset : offset + limit])
+
+    adapter = requests_mock.post(sql_url, json=respond)
+
+    batches = list(
+        iter_sql_batches(
+            grist_client,
+            "145",
+            "SELECT id FROM Pets WHERE id > ? ORDER BY id;",
+            [0],
+            page_size=2,
+        )
+    )
+
+    assert batches == [table[0:2], table[2:4], table[4:5]]
+    first = adapter.request_history[0].json()
+    assert first["sql"] == (
+        "SELECT * FROM (SELECT id FROM Pets WHERE id > ? ORDER BY id) LIMIT ? OFFSET ?"
+    )
+    assert [r.json()["args"] for r in adapter.request_history] == [
+        [0, 2, 0],
+        [0, 2, 2],
+        [0, 2, 4],
+    ]
+
+
+def test_iter_sql_offset_paging_requires_order_by(
+    grist_client: GristAPIClient,
+) -> None:
+    with pytest.raises(ValueError, match="ORDER BY"):
+        next(iter_sql(grist_client, "145", "SELECT id FROM Pets"))
+
+
+def test_iter_sql_pages_with_key_column(
+    grist_client: GristAPIClient, requests_mock: Mocker
+) -> None:
+    table = [{"id": i} for i in range(1, 5)]
+
+    def respond(request: Any, context: Any) -> Dict[str, Any]:
+        args = request.json()["args"]
+        after = args[0] if len(args) == 2 else 0
+        return sql_response([row for row in table if row["id"] > after][: args[-1]])
+
+    adapter = requests_mock.post(sql_url, json=respond)
+
+    rows = list(
+        iter_sql(
+            grist_client, "145", "SELECT id FROM Pets", page_size=2, key_column="id"
+        )
+    )
+
+    assert rows == table
+    assert [r.json()["sql"] for r in adapter.request_history] == [
+        'SELECT * FROM (SELECT id FROM Pets) ORDER BY "id" LIMIT ?',
+        'SELECT * FROM (SELECT id FROM Pets) WHERE "id" > ? ORDER BY "id" LIMIT ?',
+        'SELECT * FROM (SELECT id FROM Pets) WHERE "id" > ? ORDER BY "id" LIMIT ?',
+    ]
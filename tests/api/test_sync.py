@@ -0,0 +1,103 @@
+from typing import Any, Dict, List
+
+import pytest
+from grist_python_sdk.api.sync import plan_sync, sync_table
+from grist_python_sdk.client import GristAPIClient
+from requests_mock import Mocker
+
+api_key = "your_api_key"
+mock_root_url = "https://example.com"
+doc_id = "145"
+table_id = "Pets"
+table_url = f"{mock_root_url}/api/docs/{doc_id}/tables/{table_id}"
+
+remote_columns: Dict[str, List[Any]] = {
+    "id": [1, 2, 3],
+    "name": ["cat", "dog", "eel"],
+    "popularity": [67, 95, 3],
+}
+
+
+@pytest.fixture
+def grist_client(requests_mock: Mocker) -> GristAPIClient:
+    return GristAPIClient(mock_root_url, api_key)
+
+
+def test_plan_sync() -> None:
+    rows = [
+        {"name": "cat", "popularity": 67.0},
+        {"name": "dog", "popularity": 96},
+        {"name": "fox", "popularity": 10},
+    ]
+
+    plan = plan_sync(remote_columns, rows, ["name"], delete_missing=True)
+
+    assert plan.additions == [{"name": "fox", "popularity": 10}]
+    assert plan.updates == {2: {"popularity": 96}}
+    assert plan.deletions == [3]
+    assert plan.unchanged == 1
+
+
+def test_plan_sync_rejects_duplicate_keys() -> None:
+    with pytest.raises(ValueError, match="duplicate key"):
+        plan_sync(remote_columns, [{"name": "cat"}, {"name": "cat"}], ["name"])
+    with pytest.raises(ValueError, match="in remote table"):
+        plan_sync({"id": [1, 2], "name": ["a", "a"]}, [], ["name"])
+
+
+def test_plan_sync_keys_on_list_cells() -> None:
+    remote: Dict[str, List[Any]] = {"id": [1, 2], "tags": [["L", "a"], ["L", 1.0]]}
+    rows = [{"tags": ["L", 1], "n": 1}, {"tags": ["L", "c"], "n": 2}]
+
+    plan = plan_sync(remote, rows, ["tags"], delete_missing=True)
+
+    assert plan.updates == {2: {"n": 1}}
+    assert plan.additions == [{"tags": ["L", "c"], "n": 2}]
+    assert plan.deletions == [1]
+
+
+def test_sync_table(grist_client: GristAPIClient, requests_mock: Mocker) -> None:
+    requests_mock.get(f"{table_url}/data", json=remote_columns)
+    add = requests_mock.post(f"{table_url}/records", json={"records": [{"id": 4}]})
+    patch = requests_mock.patch(f"{table_url}/records")
+    delete = requests_mock.post(f"{table_url}/data/delete", json=None)
+
+    rows = [
+        {"name": "cat", "popularity": 67},
+        {"name": "dog", "popularity": 96},
+        {"name": "fox", "popularity": 10},
+    ]
+    result = sync_table(
+        grist_client, doc_id, table_id, rows, ["name"], delete_missing=True
+    )
+
+    assert (result.added, result.updated, result.deleted, result.unchanged) == (
+        1,
+        1,
+        1,
+        1,
+    )
+    assert result.added_ids == [4]
+    assert add.last_request is not None
+    assert add.last_request.json() == {
+        "records": [{"fields": {"name": "fox", "popularity": 10}}]
+    }
+    assert patch.last_request is not None
+    assert patch.last_request.json() == {
+        "records": [{"id": 2, "fields": {"popularity": 96}}]
+    }
+    assert delete.last_request is not None
+    assert delete.last_request.json() == [3]
+
+
+def test_sync_table_dry_run(
+    grist_client: GristAPIClient, requests_mock: Mocker
+) -> None:
+    requests_mock.get(f"{table_url}/data", json=remote_columns)
+
+    result = sync_table(
+        grist_client, doc_id, table_id, [{"name": "fox"}], ["name"], dry_run=True
+    )
+
+    assert result.added == 1
+    assert requests_mock.call_count == 1
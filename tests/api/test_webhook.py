@@ -0,0 +1,68 @@
+import pytest
+from grist_python_sdk.api.webhook import (
+    add_webhooks,
+    clear_webhook_queue,
+    delete_webhook,
+    list_webhooks,
+    modify_webhook,
+)
+from grist_python_sdk.api.typing import WebhookFieldsInfo
+from grist_python_sdk.client import GristAPIClient
+from requests_mock import Mocker
+
+api_key = "your_api_key"
+mock_root_url = "https://example.com"
+webhooks_url = f"{mock_root_url}/api/docs/145/webhooks"
+
+
+@pytest.fixture
+def grist_client(requests_mock: Mocker) -> GristAPIClient:
+    return GristAPIClient(mock_root_url, api_key)
+
+
+def test_list_webhooks(grist_client: GristAPIClient, requests_mock: Mocker) -> None:
+    webhooks = [
+        {
+            "id": "xxxx-xxxx",
+            "fields": {
+                "url": "https://example.com/hook",
+                "eventTypes": ["add", "update"],
+                "tableId": "Pets",
+                "enabled": True,
+            },
+            "usage": {"numWaiting": 0, "status": "idle"},
+        }
+    ]
+    requests_mock.get(webhooks_url, json={"webhooks": webhooks})
+
+    assert list_webhooks(grist_client, "145") == webhooks
+
+
+def test_add_webhooks(grist_client: GristAPIClient, requests_mock: Mocker) -> None:
+    requests_mock.post(webhooks_url, json={"webhooks": [{"id": "xxxx-xxxx"}]})
+    fields: WebhookFieldsInfo = {
+        "url": "https://example.com/hook?token=secret",
+        "eventTypes": ["add", "update"],
+        "tableId": "Pets",
+    }
+
+    assert add_webhooks(grist_client, "145", [fields]) == ["xxxx-xxxx"]
+    assert requests_mock.last_request is not None
+    assert requests_mock.last_request.json() == {"webhooks": [{"fields": fields}]}
+
+
+def test_modify_and_delete_webhook(
+    grist_client: GristAPIClient, requests_mock: Mocker
+) -> None:
+    patch = requests_mock.patch(f"{webhooks_url}/xxxx-xxxx", text="")
+    delete = requests_mock.delete(f"{webhooks_url}/xxxx-xxxx", json={"success": True})
+    queue = requests_mock.delete(f"{webhooks_url}/queue", text="")
+
+    modify_webhook(grist_client, "145", "xxxx-xxxx", {"enabled": False})
+    delete_webhook(grist_client, "145", "xxxx-xxxx")
+    clear_webhook_queue(grist_client, "145")
+
+    assert patch.last_request is not None
+    assert patch.last_request.json() == {"enabled": False}
+    assert delete.called
+    assert queue.called
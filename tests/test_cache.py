@@ -0,0 +1,151 @@
+import pytest
+from grist_python_sdk.api.attachment import list_attachments_metadata
+from grist_python_sdk.api.column import add_columns, list_columns
+from grist_python_sdk.api.table import list_tables_info
+from grist_python_sdk.cache import ResponseCache, cache_scope, make_cache_key
+from grist_python_sdk.client import GristAPIClient
+from requests_mock import Mocker
+
+mock_root_url = "https://example.com"
+columns_url = f"{mock_root_url}/api/docs/doc1/tables/Pets/columns"
+columns_response = {"columns": [{"id": "pet", "fields": {"type": "Text"}}]}
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def grist_client(requests_mock: Mocker, clock: FakeClock) -> GristAPIClient:
+    cache = ResponseCache(max_entries=2, ttl=10, clock=clock)
+    return GristAPIClient(mock_root_url, "your_api_key", cache=cache)
+
+
+def test_cache_scope() -> None:
+    assert cache_scope("docs/doc1/tables/Pets/columns") == "docs/doc1"
+    assert cache_scope("docs/doc1") == "docs/doc1"
+    assert cache_scope("orgs/1/workspaces") == "site"
+
+
+def test_response_cache_lru_and_ttl(clock: FakeClock) -> None:
+    cache = ResponseCache(max_entries=2, ttl=10, clock=clock)
+    keys = [make_cache_key(f"docs/doc{i}", None) for i in range(3)]
+
+    cache.store(keys[0], b"0")
+    cache.store(keys[1], b"1")
+    assert cache.lookup(keys[0]) == (b"0", None)
+    cache.store(keys[2], b"2")
+
+    assert cache.lookup(keys[1]) == (None, None)
+    clock.now = 11
+    assert cache.lookup(keys[0]) == (None, None)
+    assert cache.stats["hits"] == 1
+    assert cache.stats["misses"] == 2
+
+
+def test_response_cache_invalidation(clock: FakeClock) -> None:
+    cache = ResponseCache(clock=clock)
+    doc_key = make_cache_key("docs/doc1/tables", None)
+    other_doc_key = make_cache_key("docs/doc2/tables", None)
+    site_key = make_cache_key("orgs/1/workspaces", None)
+    for key in (doc_key, other_doc_key, site_key):
+        cache.store(key, b"{}")
+
+    cache.invalidate("docs/doc1/tables/Pets/columns")
+    assert len(cache) == 2
+    cache.invalidate("docs/doc2")
+    assert len(cache) == 0
+
+
+def test_client_caches_metadata_calls(
+    grist_client: GristAPIClient, requests_mock: Mocker
+) -> None:
+    requests_mock.get(columns_url, json=columns_response)
+
+    first = list_columns(grist_client, "doc1", "Pets")
+    first[0]["fields"]["type"] = "mutated"
+    second = list_columns(grist_client, "doc1", "Pets")
+
+    assert second == columns_response["columns"]
+    assert requests_mock.call_count == 1
+    assert grist_client.cache is not None
+    assert grist_client.cache.stats["hits"] == 1
+
+
+def test_client_invalidates_cache_on_write(
+    grist_client: GristAPIClient, requests_mock: Mocker
+) -> None:
+    requests_mock.get(columns_url, json=columns_response)
+    requests_mock.post(columns_url, json={"columns": [{"id": "age"}]})
+
+    list_columns(grist_client, "doc1", "Pets")
+    add_columns(grist_client, "doc1", "Pets", [{"id": "age"}])
+    list_columns(grist_client, "doc1", "Pets")
+
+    assert [r.method for r in requests_mock.request_history] == ["GET", "POST", "GET"]
+
+
+def test_client_keeps_cache_on_attachment_reads(
+    grist_client: GristAPIClient, requests_mock: Mocker
+) -> None:
+    tables_url = f"{mock_root_url}/api/docs/doc1/tables"
+    tables = {"tables": [{"id": "Pets", "fields": {"tableRef": 1, "onDemand": False}}]}
+    requests_mock.get(tables_url, json=tables)
+    requests_mock.get(
+        f"{mock_root_url}/api/docs/doc1/attachments", json={"records": []}
+    )
+
+    list_tables_info(grist_client, "doc1")
+    list_attachments_metadata(grist_client, "doc1")
+    list_tables_info(grist_client, "doc1")
+
+    assert [r.path for r in requests_mock.request_history] == [
+        "/api/docs/doc1/tables",
+        "/api/docs/doc1/attachments",
+    ]
+    assert grist_client.cache is not None
+    assert grist_client.cache.stats["invalidations"] == 0
+
+
+def test_client_does_not_cache_records(
+    grist_client: GristAPIClient, requests_mock: Mocker
+) -> None:
+    requests_mock.get(f"{mock_root_url}/api/path", json={})
+
+    grist_client.request("get", "path")
+    grist_client.request("get", "path")
+
+    assert requests_mock.call_count == 2
+
+
+def test_client_revalidates_with_etag(
+    grist_client: GristAPIClient, requests_mock: Mocker, clock: FakeClock
+) -> None:
+    tables_url = f"{mock_root_url}/api/docs/doc1/tables"
+    tables = {"tables": [{"id": "Pets", "fields": {"tableRef": 1, "onDemand": False}}]}
+    requests_mock.get(
+        tables_url,
+        [
+            {"json": tables, "headers": {"ETag": '"v1"'}},
+            {"status_code": 304},
+        ],
+    )
+
+    list_tables_info(grist_client, "doc1")
+    clock.now = 11
+    result = list_tables_info(grist_client, "doc1")
+
+    assert result[0]["id"] == "Pets"
+    assert requests_mock.last_request is not None
+    assert requests_mock.last_request.headers["If-None-Match"] == '"v1"'
+    assert grist_client.cache is not None
+    assert grist_client.cache.stats["revalidations"] == 1
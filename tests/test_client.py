@@ -75,3 +75,38 @@ def test_base_grist_client_get_url(
     expected_url = "https://example.com/api/path"
     result: str = grist_client.get_url(path)
     assert result == expected_url
+
+
+def test_base_grist_client_reuses_session(
+    requests_mock: Mocker,
+    grist_client: GristAPIClient,
+) -> None:
+    requests_mock.get("https://example.com/api/path", json={})
+
+    session = grist_client.session
+    grist_client.request("get", "path")
+    grist_client.request("get", "path")
+
+    assert grist_client.session is session
+    assert requests_mock.call_count == 2
+
+
+def test_base_grist_client_pool_settings() -> None:
+    client = GristAPIClient(
+        "https://example.com", "your_api_key", pool_connections=3, pool_maxsize=7
+    )
+    adapter = client.session.get_adapter("https://example.com/api/path")
+
+    assert adapter._pool_connections == 3  # type:ignore
+    assert adapter._pool_maxsize == 7  # type:ignore
+
+
+def test_base_grist_client_context_manager_closes_session() -> None:
+    with GristAPIClient("https://example.com", "your_api_key") as client:
+        adapter = client.session.get_adapter("https://example.com/api/path")
+        adapter.poolmanager.connection_from_url(  # type:ignore
+            "https://example.com/api/path"
+        )
+        assert len(adapter.poolmanager.pools) == 1  # type:ignore
+
+    assert len(adapter.poolmanager.pools) == 0  # type:ignore
@@ -0,0 +1,163 @@
+import asyncio
+from typing import List
+
+import httpx
+import pytest
+import requests
+from requests_mock import Mocker
+
+from grist_python_sdk.aio.client import AsyncGristAPIClient
+from grist_python_sdk.api.attachment import upload_attachments
+from grist_python_sdk.api.record import add_records
+from grist_python_sdk.client import GristAPIClient
+from grist_python_sdk.instrumentation import (
+    PrometheusListener,
+    RequestEvent,
+    path_template,
+)
+from grist_python_sdk.retry import RetryPolicy
+
+root_url = "https://example.com"
+records_url = f"{root_url}/api/docs/doc1/tables/Pets/records"
+
+
+@pytest.mark.parametrize(
+    "path, template",
+    [
+        ("docs/abc/tables/Pets/records", "docs/{doc_id}/tables/{table_id}/records"),
+        (
+            "docs/abc/tables/Pets/columns/age",
+            "docs/{doc_id}/tables/{table_id}/columns/{col_id}",
+        ),
+        (
+            "docs/abc/attachments/12/download",
+            "docs/{doc_id}/attachments/{attachment_id}/download",
+        ),
+        ("docs/abc/attachments/archive", "docs/{doc_id}/attachments/archive"),
+        ("orgs/current/workspaces", "orgs/{org_id}/workspaces"),
+        ("workspaces/3/docs", "workspaces/{workspace_id}/docs"),
+        ("docs/abc/webhooks/queue", "docs/{doc_id}/webhooks/queue"),
+        ("docs/abc/sql", "docs/{doc_id}/sql"),
+    ],
+)
+def test_path_template(path: str, template: str) -> None:
+    assert path_template(path) == template
+
+
+def test_listener_receives_request_event(requests_mock: Mocker) -> None:
+    events: List[RequestEvent] = []
+    client = GristAPIClient(root_url, "key", listeners=[events.append])
+    requests_mock.post(records_url, json={"records": [{"id": 1}]})
+
+    add_records(client, "doc1", "Pets", [{"pet": "cat"}])
+
+    [event] = events
+    assert event.method == "post"
+    assert event.path_template == "docs/{doc_id}/tables/{table_id}/records"
+    assert event.status == 200
+    assert event.retries == 0
+    assert event.latency >= 0
+    assert requests_mock.last_request is not None
+    assert event.request_bytes == len(requests_mock.last_request.body)
+    assert event.response_bytes == len(b'{"records": [{"id": 1}]}')
+
+
+def test_failing_listener_does_not_affect_request(
+    requests_mock: Mocker, caplog: pytest.LogCaptureFixture
+) -> None:
+    def broken(event: RequestEvent) -> None:
+        raise RuntimeError("exporter down")
+
+    events: List[RequestEvent] = []
+    client = GristAPIClient(root_url, "key", listeners=[broken, events.append])
+    requests_mock.post(records_url, json={"records": [{"id": 1}]})
+
+    assert add_records(client, "doc1", "Pets", [{"pet": "cat"}]) == [1]
+    assert len(events) == 1
+    assert "request listener" in caplog.text
+    assert "exporter down" in caplog.text
+
+
+def test_listener_reports_retries_and_errors(
+    requests_mock: Mocker, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr("grist_python_sdk.client.time.sleep", lambda delay: None)
+    events: List[RequestEvent] = []
+    client = GristAPIClient(
+        root_url, "key", retry=RetryPolicy(max_attempts=3), listeners=[events.append]
+    )
+    requests_mock.get(
+        records_url,
+        [
+            {"status_code": 503},
+            {"exc": requests.ConnectionError},
+            {"exc": requests.ConnectionError},
+        ],
+    )
+
+    with pytest.raises(requests.ConnectionError):
+        client.request("get", "docs/doc1/tables/Pets/records")
+
+    [event] = events
+    assert event.status is None
+    assert event.retries == 2
+    assert isinstance(event.error, requests.ConnectionError)
+
+
+def test_listener_sees_upload_size(requests_mock: Mocker) -> None:
+    events: List[RequestEvent] = []
+    client = GristAPIClient(root_url, "key", listeners=[events.append])
+    requests_mock.post(f"{root_url}/api/docs/doc1/attachments", json=[1])
+
+    upload_attachments(client, "doc1", [("a.txt", b"x" * 1000)])
+
+    assert events[0].request_bytes is not None and events[0].request_bytes > 1000
+    assert events[0].path_template == "docs/{doc_id}/attachments"
+
+
+def test_async_listener_receives_request_event() -> None:
+    events: List[RequestEvent] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"records": []})
+
+    client = AsyncGristAPIClient(
+        root_url,
+        "key",
+        transport=httpx.MockTransport(handler),
+        listeners=[events.append],
+    )
+
+    asyncio.run(client.request("get", "docs/doc1/tables/Pets/records"))
+
+    [event] = events
+    assert event.status == 200
+    assert event.response_bytes == len(b'{"records":[]}')
+
+
+def test_prometheus_listener() -> None:
+    prometheus_client = pytest.importorskip("prometheus_client")
+    registry = prometheus_client.CollectorRegistry()
+    listener = PrometheusListener(registry)
+
+    listener(
+        RequestEvent("get", "docs/abc/tables/Pets/records", 200, 0.0, 0.25, None, 42, 1)
+    )
+
+    labels = {
+        "method": "GET",
+        "path_template": "docs/{doc_id}/tables/{table_id}/records",
+    }
+    assert (
+        registry.get_sample_value(
+            "grist_request_duration_seconds_count", {**labels, "status": "200"}
+        )
+        == 1
+    )
+    assert (
+        registry.get_sample_value(
+            "grist_request_bytes_total", {**labels, "direction": "received"}
+        )
+        == 42
+    )
+    assert registry.get_sample_value("grist_request_retries_total", labels) == 1
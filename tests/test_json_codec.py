@@ -0,0 +1,89 @@
+from datetime import date
+from typing import Any, List, Union
+
+import pytest
+from grist_python_sdk.client import GristAPIClient
+from grist_python_sdk.json_codec import (
+    OrjsonCodec,
+    StdlibJSONCodec,
+    UjsonCodec,
+    default_codec,
+    fast_codec,
+)
+from requests_mock import Mocker
+
+payload = {
+    "records": [
+        {"id": 1, "fields": {"name": "Zoë", "score": 1.5, "tags": ["L", "a/b"]}},
+        {"id": 2, "fields": {"name": None, "score": 0, "tags": ["L"]}},
+    ]
+}
+
+
+@pytest.mark.parametrize("codec_class", [StdlibJSONCodec, OrjsonCodec, UjsonCodec])
+def test_codec_round_trip(codec_class: Any) -> None:
+    try:
+        codec = codec_class()
+    except ImportError:
+        pytest.skip(f"{codec_class.__name__} backend not installed")
+
+    dumped = codec.dumps(payload)
+
+    assert isinstance(dumped, bytes)
+    assert codec.loads(dumped) == payload
+    assert StdlibJSONCodec().loads(dumped) == payload
+
+
+def test_default_codec_is_stdlib() -> None:
+    codec = default_codec()
+
+    assert codec.name == "json"
+    with pytest.raises(ValueError):
+        codec.dumps({"score": float("nan")})
+    with pytest.raises(TypeError):
+        codec.dumps({"born": date(2020, 1, 1)})
+
+
+def test_fast_codec_falls_back_to_stdlib(monkeypatch: pytest.MonkeyPatch) -> None:
+    import sys
+
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    monkeypatch.setitem(sys.modules, "ujson", None)
+
+    assert fast_codec().name == "json"
+
+
+def test_orjson_codec_rejects_dates() -> None:
+    pytest.importorskip("orjson")
+
+    with pytest.raises(TypeError):
+        OrjsonCodec().dumps({"born": date(2020, 1, 1)})
+
+
+class RecordingCodec(StdlibJSONCodec):
+    def __init__(self) -> None:
+        self.calls: List[str] = []
+
+    def dumps(self, obj: Any) -> bytes:
+        self.calls.append("dumps")
+        return super().dumps(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        self.calls.append("loads")
+        return super().loads(data)
+
+
+def test_client_uses_codec_for_requests_and_responses(
+    requests_mock: Mocker,
+) -> None:
+    codec = RecordingCodec()
+    client = GristAPIClient("https://example.com", "your_api_key", json_codec=codec)
+    requests_mock.post("https://example.com/api/path", json={"ok": True})
+
+    result = client.request("post", "path", json=payload)
+
+    assert result == {"ok": True}
+    assert codec.calls == ["dumps", "loads"]
+    assert requests_mock.last_request is not None
+    assert requests_mock.last_request.json() == payload
+    assert requests_mock.last_request.headers["Content-Type"] == "application/json"
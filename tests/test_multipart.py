@@ -0,0 +1,78 @@
+import io
+from email.parser import BytesParser
+from pathlib import Path
+from typing import BinaryIO, List, Tuple
+
+import pytest
+
+from grist_python_sdk import multipart
+from grist_python_sdk.multipart import MultipartStream
+
+
+def parse_parts(content_type: str, body: bytes) -> List[Tuple[str, bytes]]:
+    message = BytesParser().parsebytes(
+        f"Content-Type: {content_type}\r\n\r\n".encode() + body
+    )
+    parts: List[Tuple[str, bytes]] = []
+    for part in message.walk():
+        if part.is_multipart():
+            continue
+        payload = part.get_payload(decode=True)
+        assert isinstance(payload, bytes)
+        parts.append((str(part.get_filename()), payload))
+    return parts
+
+
+def test_multipart_stream_encodes_every_source(tmp_path: Path) -> None:
+    path = tmp_path / "a.txt"
+    path.write_bytes(b"from disk")
+    buffer = io.BytesIO(b"skipped|from buffer")
+    buffer.seek(8)
+
+    with MultipartStream(
+        [str(path), ("b.bin", b"in memory"), ("c.bin", buffer)], chunk_size=4
+    ) as stream:
+        body = b"".join(stream)
+        assert len(body) == len(stream)
+        parts = parse_parts(stream.content_type, body)
+
+    assert parts == [
+        ("a.txt", b"from disk"),
+        ("b.bin", b"in memory"),
+        ("c.bin", b"from buffer"),
+    ]
+
+
+def test_multipart_stream_read_in_blocks() -> None:
+    with MultipartStream([("a.bin", b"x" * 100)], chunk_size=7) as stream:
+        blocks = []
+        while block := stream.read(16):
+            blocks.append(block)
+        assert all(len(block) == 16 for block in blocks[:-1])
+        assert len(b"".join(blocks)) == len(stream)
+
+
+def test_multipart_stream_closes_file_on_close(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = tmp_path / "a.txt"
+    path.write_bytes(b"contents")
+    opened: List[BinaryIO] = []
+
+    def spy_open(file: Path, mode: str) -> BinaryIO:
+        f = open(file, mode)
+        assert isinstance(f, io.BufferedReader)
+        opened.append(f)
+        return f
+
+    monkeypatch.setattr(multipart, "open", spy_open, raising=False)
+    stream = MultipartStream([path])
+    iterator = iter(stream)
+    next(iterator)
+    next(iterator)
+    [file] = opened
+    assert not file.closed
+
+    stream.close()
+
+    assert file.closed
@@ -0,0 +1,90 @@
+import asyncio
+import threading
+from typing import List, Tuple
+
+import pytest
+from grist_python_sdk.client import GristAPIClient
+from grist_python_sdk.ratelimit import RateLimiter, TokenBucket, classify_endpoint
+from requests_mock import Mocker
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_classify_endpoint() -> None:
+    assert classify_endpoint("get", "docs/doc/tables/T/records") == "read"
+    assert classify_endpoint("post", "docs/doc/sql") == "read"
+    assert classify_endpoint("post", "docs/doc/tables/T/records") == "write"
+    assert classify_endpoint("get", "docs/doc/attachments/1/download") == "attachment"
+    assert classify_endpoint("post", "docs/doc/attachments") == "attachment"
+
+
+def test_token_bucket_reserve() -> None:
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, capacity=2, clock=clock)
+
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.5)
+    assert bucket.reserve() == pytest.approx(1.0)
+
+    clock.now = 10
+    assert bucket.reserve() == 0
+
+
+def test_token_bucket_is_thread_safe() -> None:
+    clock = FakeClock()
+    bucket = TokenBucket(rate=10, capacity=10, clock=clock)
+    delays: List[float] = []
+    lock = threading.Lock()
+
+    def worker() -> None:
+        for _ in range(25):
+            delay = bucket.reserve()
+            with lock:
+                delays.append(delay)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(delays)[-1] == pytest.approx(9.0)
+    assert sum(1 for delay in delays if delay == 0) == 10
+
+
+def test_token_bucket_acquire_async() -> None:
+    bucket = TokenBucket(rate=1000, capacity=1)
+
+    async def run() -> None:
+        await asyncio.gather(*(bucket.acquire_async() for _ in range(5)))
+
+    asyncio.run(run())
+    assert bucket.tokens <= 0
+
+
+class RecordingLimiter(RateLimiter):
+    def __init__(self) -> None:
+        super().__init__(read=TokenBucket(rate=1000))
+        self.calls: List[Tuple[str, str]] = []
+
+    def acquire(self, method: str, path: str) -> None:
+        self.calls.append((method, path))
+        super().acquire(method, path)
+
+
+def test_client_acquires_before_each_request(requests_mock: Mocker) -> None:
+    limiter = RecordingLimiter()
+    client = GristAPIClient("https://example.com", "key", rate_limiter=limiter)
+    requests_mock.get("https://example.com/api/docs/doc/tables", json={})
+
+    client.request("get", "docs/doc/tables")
+    client.request("get", "docs/doc/tables")
+
+    assert limiter.calls == [("get", "docs/doc/tables")] * 2
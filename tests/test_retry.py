@@ -0,0 +1,160 @@
+import asyncio
+import io
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from typing import Any, List
+
+import httpx
+import pytest
+import requests
+from requests_mock import Mocker
+
+from grist_python_sdk.aio.client import AsyncGristAPIClient
+from grist_python_sdk.client import GristAPIClient
+from grist_python_sdk.retry import (
+    IDEMPOTENT_METHODS,
+    WRITE_METHODS,
+    RetryPolicy,
+    parse_retry_after,
+)
+
+url = "https://example.com/api/path"
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> List[float]:
+    delays: List[float] = []
+    monkeypatch.setattr("grist_python_sdk.client.time.sleep", delays.append)
+    return delays
+
+
+def test_retry_policy_should_retry() -> None:
+    policy = RetryPolicy(max_attempts=3)
+
+    assert policy.should_retry("get", 1, 503)
+    assert policy.should_retry("get", 2, None)
+    assert not policy.should_retry("get", 3, 503)
+    assert not policy.should_retry("get", 1, 404)
+    assert not policy.should_retry("post", 1, 503)
+    assert RetryPolicy(retry_methods=IDEMPOTENT_METHODS | WRITE_METHODS).should_retry(
+        "post", 1, 429
+    )
+
+
+def test_retry_policy_backoff() -> None:
+    policy = RetryPolicy(backoff_factor=1, max_backoff=5, jitter=False)
+
+    assert [policy.backoff(attempt) for attempt in range(1, 5)] == [1, 2, 4, 5]
+    assert policy.backoff(1, retry_after="3") == 3
+    assert policy.backoff(1, retry_after="120") == 5
+    assert 0 <= RetryPolicy(backoff_factor=1).backoff(3) <= 4
+
+
+def test_parse_retry_after() -> None:
+    later = datetime.now(timezone.utc) + timedelta(seconds=30)
+
+    assert parse_retry_after("7") == 7
+    assert 25 < parse_retry_after(format_datetime(later, usegmt=True)) <= 30  # type:ignore
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_client_retries_idempotent_requests(
+    requests_mock: Mocker, sleeps: List[float]
+) -> None:
+    client = GristAPIClient("https://example.com", "key", retry=RetryPolicy())
+    requests_mock.get(
+        url,
+        [
+            {"status_code": 429, "headers": {"Retry-After": "2"}},
+            {"status_code": 503},
+            {"json": {"ok": True}},
+        ],
+    )
+
+    assert client.request("get", "path") == {"ok": True}
+    assert requests_mock.call_count == 3
+    assert sleeps[0] == 2
+
+
+def test_client_gives_up_after_max_attempts(
+    requests_mock: Mocker, sleeps: List[float]
+) -> None:
+    client = GristAPIClient("https://example.com", "key", retry=RetryPolicy())
+    requests_mock.get(url, status_code=503)
+
+    with pytest.raises(requests.HTTPError):
+        client.request("get", "path")
+    assert requests_mock.call_count == 3
+
+
+def test_client_does_not_retry_writes_by_default(
+    requests_mock: Mocker, sleeps: List[float]
+) -> None:
+    client = GristAPIClient("https://example.com", "key", retry=RetryPolicy())
+    requests_mock.post(url, [{"status_code": 503}, {"json": {"ok": True}}])
+
+    with pytest.raises(requests.HTTPError):
+        client.request("post", "path", json={})
+    assert requests_mock.call_count == 1
+
+    client.retry = RetryPolicy(retry_methods=IDEMPOTENT_METHODS | WRITE_METHODS)
+    requests_mock.post(url, [{"status_code": 503}, {"json": {"ok": True}}])
+    assert client.request("post", "path", json={}) == {"ok": True}
+
+
+def test_client_retries_uploads_from_file_objects(
+    requests_mock: Mocker, sleeps: List[float]
+) -> None:
+    client = GristAPIClient(
+        "https://example.com",
+        "key",
+        retry=RetryPolicy(retry_methods=IDEMPOTENT_METHODS | WRITE_METHODS),
+    )
+    bodies: List[bytes] = []
+
+    def respond(request: Any, context: Any) -> List[int]:
+        bodies.append(b"".join(request.body))
+        context.status_code = 503 if len(bodies) == 1 else 200
+        return [1]
+
+    requests_mock.post(url, json=respond)
+    upload = io.BytesIO(b"skipped|contents")
+    upload.seek(8)
+
+    assert client.request("post", "path", filenames=[("a.txt", upload)]) == [1]
+    assert len(bodies) == 2
+    assert all(b"\r\n\r\ncontents\r\n" in body for body in bodies)
+
+
+def test_client_retries_connection_errors(
+    requests_mock: Mocker, sleeps: List[float]
+) -> None:
+    client = GristAPIClient("https://example.com", "key", retry=RetryPolicy())
+    requests_mock.get(url, [{"exc": requests.ConnectionError}, {"json": {"ok": True}}])
+
+    assert client.request("get", "path") == {"ok": True}
+    assert len(sleeps) == 1
+
+
+def test_async_client_retries(monkeypatch: pytest.MonkeyPatch) -> None:
+    statuses = iter([503, 200])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(next(statuses), json={"ok": True})
+
+    async def no_sleep(delay: float) -> None:
+        pass
+
+    monkeypatch.setattr("grist_python_sdk.aio.client.asyncio.sleep", no_sleep)
+
+    async def run() -> object:
+        async with AsyncGristAPIClient(
+            "https://example.com",
+            "key",
+            retry=RetryPolicy(),
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            return await client.request("get", "path")
+
+    assert asyncio.run(run()) == {"ok": True}
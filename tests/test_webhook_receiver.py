@@ -0,0 +1,111 @@
+import asyncio
+import io
+import json
+import threading
+from typing import Any, Dict, List, Tuple
+from wsgiref.util import setup_testing_defaults
+
+from grist_python_sdk.api.replica import TableReplica
+from grist_python_sdk.client import GristAPIClient
+from grist_python_sdk.webhook import WebhookReceiver
+
+
+def post(
+    receiver: WebhookReceiver, payload: Any, query: str = ""
+) -> Tuple[str, List[Tuple[str, str]]]:
+    body = json.dumps(payload).encode()
+    environ: Dict[str, Any] = {
+        "REQUEST_METHOD": "POST",
+        "QUERY_STRING": query,
+        "CONTENT_LENGTH": str(len(body)),
+        "wsgi.input": io.BytesIO(body),
+    }
+    setup_testing_defaults(environ)
+    response: List[Any] = []
+    receiver(environ, lambda status, headers: response.extend([status, headers]))
+    return response[0], response[1]
+
+
+def test_wsgi_receiver_batches_and_dedupes() -> None:
+    batches: List[List[Dict[str, Any]]] = []
+    receiver = WebhookReceiver(batches.append, max_batch=3)
+
+    assert post(receiver, [{"id": 1, "pet": "cat"}, {"id": 2, "pet": "dog"}])[0] == (
+        "200 OK"
+    )
+    assert post(receiver, [{"id": 1, "pet": "lion"}, {"id": 3, "pet": "fish"}])[0] == (
+        "200 OK"
+    )
+    receiver.flush()
+
+    assert batches == [
+        [{"id": 1, "pet": "lion"}, {"id": 2, "pet": "dog"}],
+        [{"id": 3, "pet": "fish"}],
+    ]
+
+
+def test_wsgi_receiver_rejects_bad_requests() -> None:
+    receiver = WebhookReceiver(lambda rows: None, token="secret", max_pending=2)
+
+    assert post(receiver, [{"id": 1}])[0] == "403 Forbidden"
+    assert post(receiver, [{"id": 1}], "token=wrong")[0] == "403 Forbidden"
+    assert post(receiver, {"id": 1}, "token=secret")[0] == "400 Bad Request"
+    assert post(receiver, [{"id": 1}, {"id": 2}], "token=secret")[0] == "200 OK"
+    status, headers = post(receiver, [{"id": 3}], "token=secret")
+    assert status == "503 Service Unavailable"
+    assert ("Retry-After", "1") in headers
+
+
+def test_receiver_worker_delivers_in_background() -> None:
+    delivered = threading.Event()
+    rows: List[Dict[str, Any]] = []
+
+    def handler(batch: List[Dict[str, Any]]) -> None:
+        rows.extend(batch)
+        delivered.set()
+
+    with WebhookReceiver(handler, max_delay=0.01) as receiver:
+        post(receiver, [{"id": 1}])
+        assert delivered.wait(5)
+
+    assert rows == [{"id": 1}]
+
+
+def test_receiver_reports_handler_errors() -> None:
+    errors: List[Tuple[BaseException, List[Dict[str, Any]]]] = []
+
+    def handler(batch: List[Dict[str, Any]]) -> None:
+        raise RuntimeError("boom")
+
+    receiver = WebhookReceiver(
+        handler, on_error=lambda e, batch: errors.append((e, batch))
+    )
+    receiver.submit([{"id": 1}])
+    receiver.flush()
+
+    assert str(errors[0][0]) == "boom"
+    assert errors[0][1] == [{"id": 1}]
+
+
+def test_asgi_receiver_updates_replica() -> None:
+    replica = TableReplica(GristAPIClient("https://example.com", "key"), "145", "Pets")
+    receiver = WebhookReceiver(replica.apply)
+    sent: List[Dict[str, Any]] = []
+    payload = json.dumps([{"id": 7, "pet": "cat", "manualSort": 7}]).encode()
+    messages: List[Dict[str, Any]] = [
+        {"type": "http.request", "body": payload[:10], "more_body": True},
+        {"type": "http.request", "body": payload[10:]},
+    ]
+
+    async def receive() -> Dict[str, Any]:
+        return messages.pop(0)
+
+    async def send(message: Dict[str, Any]) -> None:
+        sent.append(message)
+
+    scope = {"type": "http", "method": "POST", "query_string": b""}
+    asyncio.run(receiver.asgi(scope, receive, send))
+    receiver.flush()
+
+    assert sent[0]["status"] == 200
+    assert replica.get(7) == {"id": 7, "fields": {"pet": "cat"}}